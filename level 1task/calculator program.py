@@ -1,3 +1,532 @@
+import re
+import os
+import csv
+import sys
+import math
+import time
+import random
+import argparse
+import operator
+from functools import lru_cache, reduce
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # expressions still compile to closures; only vectorized evaluation needs NumPy
+    np = None
+
+TOKEN_RE = re.compile(r'\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\*\*|[-+*/%^(),])|(\S))')
+CONSTANTS = {'pi': math.pi, 'e': math.e}
+CSV_CHUNK_ROWS = 65536
+BATCH_SIZE = 5000
+EXPRESSION_CACHE_SIZE = 65536
+
+# name: (scalar function, NumPy function name, argument count or None for one or more)
+FUNCTIONS = {
+    'abs': (abs, 'absolute', 1),
+    'sqrt': (math.sqrt, 'sqrt', 1),
+    'exp': (math.exp, 'exp', 1),
+    'log': (math.log, 'log', 1),
+    'log10': (math.log10, 'log10', 1),
+    'log2': (math.log2, 'log2', 1),
+    'sin': (math.sin, 'sin', 1),
+    'cos': (math.cos, 'cos', 1),
+    'tan': (math.tan, 'tan', 1),
+    'floor': (math.floor, 'floor', 1),
+    'ceil': (math.ceil, 'ceil', 1),
+    'round': (round, 'round', 1),
+    'pow': (math.pow, 'power', 2),
+    'min': (min, 'minimum', None),
+    'max': (max, 'maximum', None),
+}
+
+class ExpressionError(ValueError):
+    pass
+
+# Parsing, folding, compiling and evaluating all recurse over the tree, so
+# a long chain such as 'x+x+...+x' can exhaust the stack in any of them.
+TOO_DEEP = "Expression is nested too deeply"
+
+def _divide(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Division by zero is not allowed.")
+    return a / b
+
+def _modulo(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Modulo by zero is not allowed.")
+    return a % b
+
+def _vector_divide(a, b):
+    # Rows with a zero divisor become NaN instead of aborting the column.
+    return np.divide(a, b, out=np.full(np.broadcast(a, b).shape, np.nan), where=np.asarray(b) != 0)
+
+def _vector_modulo(a, b):
+    return np.mod(a, b, out=np.full(np.broadcast(a, b).shape, np.nan), where=np.asarray(b) != 0)
+
+def _vector_power(a, b):
+    return np.power(a, b)
+
+SCALAR_OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _divide, '%': _modulo, '**': math.pow}
+VECTOR_OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _vector_divide, '%': _vector_modulo, '**': _vector_power}
+
+def tokenize(text):
+    tokens = []
+    for match in TOKEN_RE.finditer(text):
+        number, name, op, other = match.groups()
+        if number:
+            tokens.append(('number', float(number)))
+        elif name:
+            tokens.append(('name', name))
+        elif op:
+            tokens.append(('op', op))
+        else:
+            raise ExpressionError(f"Unexpected character {other!r} at position {match.start(4)}")
+    return tokens
+
+class _Parser:
+    """
+    Recursive descent over the usual precedence: + and - below * / %,
+    below unary signs, below right-associative ** (or ^). The tree is
+    nested tuples: ('number', value), ('variable', name), ('negate', x),
+    ('binary', op, left, right) and ('call', name, args). Variable names
+    are collected in order of first use as they are parsed.
+    """
+    
+    def __init__(self, tokens):
+        self.tokens = tokens + [(None, None)]
+        self.position = 0
+        self.variables = {}
+    
+    def peek(self):
+        return self.tokens[self.position]
+    
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+    
+    def expect(self, op):
+        kind, value = self.take()
+        if (kind, value) != ('op', op):
+            raise ExpressionError(f"Expected {op!r} but found {'end of expression' if kind is None else repr(value)}")
+    
+    def parse(self):
+        if len(self.tokens) == 1:
+            raise ExpressionError("Empty expression")
+        tree = self.expression()
+        if self.peek()[0] is not None:
+            raise ExpressionError(f"Unexpected {self.peek()[1]!r}")
+        return tree
+    
+    def expression(self):
+        left = self.term()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            left = ('binary', self.take()[1], left, self.term())
+        return left
+    
+    def term(self):
+        left = self.unary()
+        while self.peek() in (('op', '*'), ('op', '/'), ('op', '%')):
+            left = ('binary', self.take()[1], left, self.unary())
+        return left
+    
+    def unary(self):
+        if self.peek() in (('op', '-'), ('op', '+')):
+            sign = self.take()[1]
+            operand = self.unary()
+            return ('negate', operand) if sign == '-' else operand
+        return self.power()
+    
+    def power(self):
+        base = self.atom()
+        if self.peek() in (('op', '**'), ('op', '^')):
+            self.take()
+            return ('binary', '**', base, self.unary())
+        return base
+    
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return ('number', value)
+        if kind == 'name':
+            if self.peek() == ('op', '('):
+                return self.call(value)
+            if value in CONSTANTS:
+                return ('number', CONSTANTS[value])
+            self.variables.setdefault(value)
+            return ('variable', value)
+        if (kind, value) == ('op', '('):
+            inner = self.expression()
+            self.expect(')')
+            return inner
+        raise ExpressionError("Unexpected end of expression" if kind is None else f"Unexpected {value!r}")
+    
+    def call(self, name):
+        if name not in FUNCTIONS:
+            raise ExpressionError(f"Unknown function: {name}")
+        self.take()
+        args = []
+        if self.peek() != ('op', ')'):
+            args.append(self.expression())
+            while self.peek() == ('op', ','):
+                self.take()
+                args.append(self.expression())
+        self.expect(')')
+        arity = FUNCTIONS[name][2]
+        if len(args) != arity and not (arity is None and args):
+            raise ExpressionError(f"{name}() takes {arity or 'at least 1'} argument(s), got {len(args)}")
+        return ('call', name, tuple(args))
+
+def parse_expression(text):
+    """Return (tree, names of the variables it uses)."""
+    parser = _Parser(tokenize(text))
+    try:
+        tree = parser.parse()
+    except RecursionError:
+        raise ExpressionError(TOO_DEEP) from None
+    return tree, tuple(parser.variables)
+
+def _evaluate_constant(tree):
+    kind = tree[0]
+    if kind == 'negate':
+        return -tree[1][1]
+    if kind == 'binary':
+        return SCALAR_OPERATORS[tree[1]](tree[2][1], tree[3][1])
+    function, _, arity = FUNCTIONS[tree[1]]
+    values = [arg[1] for arg in tree[2]]
+    return function(*values) if arity else function(values)
+
+def fold_constants(tree):
+    """Evaluate subtrees without variables once, leaving any that would raise for evaluation time."""
+    kind = tree[0]
+    if kind == 'negate':
+        children = (fold_constants(tree[1]),)
+        tree = ('negate', children[0])
+    elif kind == 'binary':
+        children = (fold_constants(tree[2]), fold_constants(tree[3]))
+        tree = ('binary', tree[1], *children)
+    elif kind == 'call':
+        children = tuple(map(fold_constants, tree[2]))
+        tree = ('call', tree[1], children)
+    else:
+        return tree
+    if all(child[0] == 'number' for child in children):
+        try:
+            return ('number', _evaluate_constant(tree))
+        except (ArithmeticError, ValueError):
+            pass
+    return tree
+
+def _compile(tree, vectorized):
+    """
+    Turn a tree into nested closures taking one mapping of variable
+    values: floats for scalar evaluation, NumPy arrays when vectorized.
+    Constant operands are bound directly rather than called.
+    """
+    kind = tree[0]
+    if kind == 'number':
+        value = tree[1]
+        return lambda env: value
+    if kind == 'variable':
+        return operator.itemgetter(tree[1])
+    if kind == 'negate':
+        operand = _compile(tree[1], vectorized)
+        return lambda env: -operand(env)
+    if kind == 'binary':
+        op = (VECTOR_OPERATORS if vectorized else SCALAR_OPERATORS)[tree[1]]
+        left_tree, right_tree = tree[2], tree[3]
+        if right_tree[0] == 'number':
+            left, right = _compile(left_tree, vectorized), right_tree[1]
+            return lambda env: op(left(env), right)
+        if left_tree[0] == 'number':
+            left, right = left_tree[1], _compile(right_tree, vectorized)
+            return lambda env: op(left, right(env))
+        left, right = _compile(left_tree, vectorized), _compile(right_tree, vectorized)
+        return lambda env: op(left(env), right(env))
+    
+    scalar_function, vector_name, arity = FUNCTIONS[tree[1]]
+    args = [_compile(arg, vectorized) for arg in tree[2]]
+    if vectorized:
+        ufunc = getattr(np, vector_name)
+        function = ufunc if arity else lambda *values: reduce(ufunc, values)
+    else:
+        function = scalar_function if arity else lambda *values: scalar_function(values)
+    if len(args) == 1:
+        arg = args[0]
+        return lambda env: function(arg(env))
+    return lambda env: function(*[arg(env) for arg in args])
+
+class Expression:
+    """
+    An arithmetic expression parsed once and compiled to closures.
+    Call it with a mapping of variable values for one result, or use
+    evaluate_many() to compute a whole column at once.
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        tree, self.variables = parse_expression(text)
+        try:
+            self.tree = fold_constants(tree)
+            self._scalar = _compile(self.tree, vectorized=False)
+        except RecursionError:
+            raise ExpressionError(TOO_DEEP) from None
+        self._vector = None
+    
+    def __repr__(self):
+        return f"Expression({self.text!r})"
+    
+    def __call__(self, bindings=None):
+        """
+        Evaluate for one set of variable values. Division or modulo by
+        zero raises ZeroDivisionError, as in calculator().
+        """
+        try:
+            return self._scalar(bindings)
+        except RecursionError:
+            raise ExpressionError(TOO_DEEP) from None
+        except (KeyError, TypeError):
+            missing = [name for name in self.variables if not bindings or name not in bindings]
+            if missing:
+                raise ExpressionError(f"No value for variable(s): {', '.join(missing)}") from None
+            raise
+    
+    def evaluate_many(self, columns):
+        """
+        Evaluate over equal-length columns (a mapping from variable name to
+        a sequence) in one vectorized pass. Returns a float64 array. Rows
+        whose result is undefined (division or modulo by zero, sqrt of a
+        negative, ...) are NaN rather than errors. Without NumPy, rows are
+        evaluated one by one with the compiled closures and returned as a list.
+        """
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise ExpressionError(f"No column for variable(s): {', '.join(missing)}")
+        length = len(next(iter(columns.values()))) if columns else 1
+        
+        if np is None:
+            names = self.variables
+            rows = zip(*(columns[name] for name in names)) if names else ((),) * length
+            return [self._scalar_or_nan(dict(zip(names, map(float, values)))) for values in rows]
+        
+        arrays = {name: np.asarray(columns[name], dtype=np.float64) for name in self.variables}
+        try:
+            if self._vector is None:
+                self._vector = _compile(self.tree, vectorized=True)
+            with np.errstate(all='ignore'):
+                result = np.asarray(self._vector(arrays), dtype=np.float64)
+        except RecursionError:
+            raise ExpressionError(TOO_DEEP) from None
+        if result.shape != (length,):
+            result = np.full(length, result, dtype=np.float64)
+        return result
+    
+    def _scalar_or_nan(self, bindings):
+        try:
+            return float(self._scalar(bindings))
+        except RecursionError:
+            raise ExpressionError(TOO_DEEP) from None
+        except (ArithmeticError, ValueError):
+            return math.nan
+
+def compile_expression(text):
+    return Expression(text)
+
+def normalize_expression(text):
+    """
+    Canonical spelling of an expression: tokens joined by single spaces,
+    numbers in repr form and ^ written as **, so '2^x+1' and '2.0 ** x + 1'
+    share one cache entry.
+    """
+    parts = []
+    for kind, value in tokenize(text):
+        if kind == 'number':
+            # A literal too large for a float reads as inf, whose repr would
+            # read back as a variable; 1e999 overflows to the same value.
+            parts.append(repr(value) if math.isfinite(value) else '1e999')
+        else:
+            parts.append('**' if value == '^' else value)
+    return ' '.join(parts)
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized(normalized):
+    return compile_expression(normalized)
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def cached_expression(text):
+    """
+    compile_expression() through two LRU caches: raw text, so repeated
+    lines skip even tokenizing, and normalized text, so different
+    spellings of one expression share a compiled form.
+    """
+    return _compile_normalized(normalize_expression(text))
+
+def _evaluate_batch(first_line, lines, bindings):
+    rows = []
+    for line_number, text in enumerate(lines, first_line):
+        text = text.strip()
+        if not text or text.startswith('#'):
+            continue
+        try:
+            rows.append((line_number, text, cached_expression(text)(bindings), ''))
+        except (ArithmeticError, ValueError) as e:
+            # Division and modulo by zero, parse errors, unbound variables
+            # and math domain errors are reported per row.
+            rows.append((line_number, text, '', str(e)))
+    return rows
+
+def iter_line_batches(file, batch_size=BATCH_SIZE):
+    batch = []
+    first_line = 1
+    for line_number, line in enumerate(file, 1):
+        batch.append(line)
+        if len(batch) == batch_size:
+            yield first_line, batch
+            batch = []
+            first_line = line_number + 1
+    if batch:
+        yield first_line, batch
+
+def evaluate_file(input_path, output_path, bindings=None, workers=None, batch_size=BATCH_SIZE):
+    """
+    Evaluate one expression per line of input_path (blank lines and
+    #-comments are skipped) and stream CSV rows of line, expression,
+    result, error to output_path in input order. A failing row gets an
+    error message instead of a result, and evaluation carries on. Batches
+    go through a process pool with a bounded number in flight; each worker
+    keeps its own LRU of compiled expressions.
+    Returns (rows written, rows with errors).
+    """
+    workers = workers or os.cpu_count() or 1
+    bindings = dict(bindings or {})
+    counts = [0, 0]
+    
+    with open(input_path, 'r', encoding='utf-8', errors='replace') as source, \
+            open(output_path, 'w', encoding='utf-8', newline='') as output:
+        writer = csv.writer(output)
+        writer.writerow(["line", "expression", "result", "error"])
+        
+        def write(rows):
+            writer.writerows(rows)
+            counts[0] += len(rows)
+            counts[1] += sum(1 for row in rows if row[3])
+        
+        batches = iter_line_batches(source, batch_size)
+        if workers == 1:
+            for first_line, lines in batches:
+                write(_evaluate_batch(first_line, lines, bindings))
+            return tuple(counts)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for first_line, lines in batches:
+                pending.append(executor.submit(_evaluate_batch, first_line, lines, bindings))
+                if len(pending) >= workers * 2:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+    
+    return tuple(counts)
+
+def run_batch(args):
+    output = args.output or args.batch.rsplit('.', 1)[0] + '.results.csv'
+    start = time.perf_counter()
+    try:
+        count, errors = evaluate_file(args.batch, output, dict(args.var), args.workers)
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"Evaluated {count} expressions in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f}/s), {errors} with errors")
+    print(f"Results written to {output}")
+    return 0
+
+def _float_or_nan(value):
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+def _column_values(rows, index):
+    values = [row[index] for row in rows]
+    if np is None:
+        return [_float_or_nan(value) for value in values]
+    try:
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        # Blank or non-numeric cells: convert one by one, leaving them NaN.
+        return np.array([_float_or_nan(value) for value in values], dtype=np.float64)
+
+def derive_column(source_path, target_path, expression, name='result', chunk_rows=CSV_CHUNK_ROWS):
+    """
+    Copy a CSV file with one more column, computed from the other columns
+    by expression (text or an Expression). The file is streamed in blocks
+    of chunk_rows rows, each evaluated in one vectorized call. Blank or
+    non-numeric inputs and undefined results are written as nan.
+    Returns the number of data rows written.
+    """
+    if not isinstance(expression, Expression):
+        expression = compile_expression(expression)
+    with open(source_path, newline='') as source, open(target_path, 'w', newline='') as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        missing = [variable for variable in expression.variables if variable not in header]
+        if missing:
+            raise ExpressionError(f"No column for variable(s): {', '.join(missing)}")
+        indices = {variable: header.index(variable) for variable in expression.variables}
+        writer.writerow(header + [name])
+        
+        count = 0
+        while True:
+            rows = list(islice(reader, chunk_rows))
+            if not rows:
+                break
+            columns = {variable: _column_values(rows, index) for variable, index in indices.items()}
+            if not columns:
+                columns = {None: rows}
+            results = expression.evaluate_many(columns)
+            if np is not None:
+                results = results.tolist()
+            writer.writerows(row + [repr(value)] for row, value in zip(rows, results))
+            count += len(rows)
+    return count
+
+def benchmark(rows=1_000_000, text='(price * qty - discount) / qty + sqrt(qty) % 3', seed=0):
+    """Rows per second for re-parsing every row, the compiled closures and one vectorized call."""
+    rng = random.Random(seed)
+    columns = {
+        'price': [rng.uniform(1, 500) for _ in range(rows)],
+        'qty': [float(rng.randint(1, 100)) for _ in range(rows)],
+        'discount': [rng.uniform(0, 50) for _ in range(rows)],
+    }
+    bindings = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    results = []
+    
+    sample = bindings[:20000]
+    start = time.perf_counter()
+    reparsed = [compile_expression(text)(row) for row in sample]
+    results.append(('re-parse per row', len(sample), len(sample) / (time.perf_counter() - start)))
+    
+    expression = compile_expression(text)
+    sample = bindings[:200000]
+    start = time.perf_counter()
+    compiled = [expression(row) for row in sample]
+    results.append(('compiled closures', len(sample), len(sample) / (time.perf_counter() - start)))
+    
+    start = time.perf_counter()
+    vectorized = expression.evaluate_many(columns)
+    results.append(('vectorized' if np is not None else 'closures (no NumPy)', rows, rows / (time.perf_counter() - start)))
+    
+    same = reparsed == compiled[:len(reparsed)] and all(
+        math.isclose(a, b, rel_tol=1e-12) for a, b in zip(compiled, vectorized))
+    return results, same
+
 def calculator():
     print("Calculator Program")
     
@@ -33,13 +562,88 @@ def calculator():
         
         print(f"\n{operation_name} Result:")
         print(f"{num1} {op} {num2} = {result}")
-        
+    
     except ValueError:
         print("Please enter valid numbers.")
 
-if __name__ == "__main__":
-    calculator()
+def _parse_binding(text):
+    name, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    try:
+        return name.strip(), float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a number") from None
+
+def main():
+    parser = argparse.ArgumentParser(description='Calculator with a compiled expression engine.')
+    
+    parser.add_argument('--expr', metavar='EXPRESSION',
+                        help='Evaluate an expression, e.g. "(a + b) * sqrt(c) % 7"')
+    
+    parser.add_argument('--var', action='append', type=_parse_binding, default=[], metavar='NAME=VALUE',
+                        help='Value for a variable in --expr or --batch (repeatable)')
+    
+    parser.add_argument('--csv', metavar='PATH',
+                        help='Add a column computed by --expr from the columns of PATH')
+    
+    parser.add_argument('--batch', metavar='PATH',
+                        help='Evaluate one expression per line of PATH into a CSV of results')
+    
+    parser.add_argument('-o', '--output',
+                        help='Where to write the --csv or --batch result '
+                             '(default: <PATH>.derived.csv or <PATH>.results.csv)')
+    
+    parser.add_argument('--name', default='result',
+                        help='Header of the derived column (default: result)')
+    
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Worker processes for --batch (default: CPU count)')
     
+    parser.add_argument('--benchmark', metavar='ROWS', type=int, nargs='?', const=1_000_000,
+                        help='Compare re-parsing, compiled and vectorized evaluation')
+    
+    args = parser.parse_args()
+    
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.benchmark is not None and args.benchmark < 1:
+        parser.error("--benchmark needs at least 1 row")
+    
+    if args.benchmark is not None:
+        results, same = benchmark(args.benchmark)
+        print(f"{'method':<22}{'rows':>10}{'rows/s':>14}")
+        for method, rows, rate in results:
+            print(f"{method:<22}{rows:>10}{rate:>14,.0f}")
+        print(f"Results agree: {'yes' if same else 'NO'}")
+        return 0
+    
+    if args.batch:
+        return run_batch(args)
+    
+    if args.csv and not args.expr:
+        parser.error('--csv needs --expr')
+    
+    if args.expr:
+        try:
+            expression = compile_expression(args.expr)
+            if args.csv:
+                output = args.output or args.csv.rsplit('.', 1)[0] + '.derived.csv'
+                count = derive_column(args.csv, output, expression, args.name)
+                print(f"Wrote {count} rows with {args.name} = {args.expr} to {output}")
+            else:
+                print(f"{args.expr} = {expression(dict(args.var))}")
+        except (ArithmeticError, OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+    
+    calculator()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
 #output
    #Calculator Program
    #Enter the first number: 9
@@ -1,28 +1,551 @@
 import re
+import os
+import csv
+import sys
+import time
+import heapq
+import pickle
+import socket
+import string
+import asyncio
+import argparse
+import tempfile
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+except ImportError:  # without dnspython only A/AAAA records are checked
+    dns = None
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Only A-Z are lowered: casefold() would turn non-ASCII domains that
+# EMAIL_PATTERN rejects (STRAßE.de) into ones it accepts (strasse.de).
+ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+BATCH_SIZE = 50000
+DEDUP_RUN_SIZE = 1_000_000
+
+DOMAIN_TTL = 3600
+NEGATIVE_DOMAIN_TTL = 300
+DOMAIN_CACHE_SIZE = 100000
+DNS_CONCURRENCY = 100
+DNS_TIMEOUT = 5.0
+
+DISPOSABLE_DOMAINS = frozenset("""
+mailinator.com 10minutemail.com guerrillamail.com guerrillamail.net sharklasers.com
+yopmail.com tempmail.com temp-mail.org trashmail.com getnada.com dispostable.com
+maildrop.cc throwawaymail.com fakeinbox.com mintemail.com mailnesia.com
+spamgourmet.com emailondeck.com mohmal.com tempail.com burnermail.io
+""".split())
+
+COMMON_DOMAINS = (
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'icloud.com', 'aol.com',
+    'live.com', 'msn.com', 'protonmail.com', 'gmx.com', 'mail.com', 'yandex.com',
+    'comcast.net', 'verizon.net', 'att.net', 'me.com', 'googlemail.com', 'yahoo.co.uk'
+)
+
 def validate_email(email):
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if re.match(pattern, email):
+    if EMAIL_PATTERN.match(email):
         return True
     return False
 
-def email_validator():
+def normalize_email(email, strip_plus=False):
+    """Trim, lowercase the domain's ASCII letters and optionally drop a +tag from the local part."""
+    email = email.strip()
+    local, at, domain = email.rpartition('@')
+    if not at:
+        return email
+    if strip_plus:
+        local = local.split('+', 1)[0]
+    return f"{local}@{domain.translate(ASCII_LOWER_TABLE)}"
+
+def _validate_batch(emails, strip_plus):
+    results = []
+    for email in emails:
+        normalized = normalize_email(email, strip_plus)
+        results.append((normalized, validate_email(normalized)))
+    return results
+
+def iter_address_batches(file, column=None, batch_size=BATCH_SIZE):
+    """
+    Yield (rows, emails) batches. With a column (name or index) the file is
+    read as CSV and rows are lists; otherwise every line is one address and
+    rows is None.
+    """
+    if column is None:
+        batch = []
+        for line in file:
+            batch.append(line.rstrip('\r\n'))
+            if len(batch) == batch_size:
+                yield None, batch
+                batch = []
+        if batch:
+            yield None, batch
+        return
+    
+    reader = csv.reader(file)
+    rows = []
+    for row in reader:
+        rows.append(row)
+        if len(rows) == batch_size:
+            yield rows, [row[column] if column < len(row) else '' for row in rows]
+            rows = []
+    if rows:
+        yield rows, [row[column] if column < len(row) else '' for row in rows]
+
+class ExternalDeduplicator:
+    """
+    Keep the first record per key for inputs larger than memory: records
+    are sorted in runs on disk, then merged. Output is in key order.
+    """
+    
+    def __init__(self, run_size=DEDUP_RUN_SIZE, directory=None):
+        self.run_size = run_size
+        self.directory = directory
+        self.buffer = []
+        self.runs = []
+        self.sequence = 0
+    
+    def add(self, key, record):
+        self.buffer.append((key, self.sequence, record))
+        self.sequence += 1
+        if len(self.buffer) >= self.run_size:
+            self._spill()
+    
+    def _spill(self):
+        self.buffer.sort()
+        run = tempfile.TemporaryFile(dir=self.directory)
+        for entry in self.buffer:
+            pickle.dump(entry, run, pickle.HIGHEST_PROTOCOL)
+        run.seek(0)
+        self.runs.append(run)
+        self.buffer = []
+    
+    @staticmethod
+    def _read_run(run):
+        while True:
+            try:
+                yield pickle.load(run)
+            except EOFError:
+                return
+    
+    def unique(self):
+        """Yield the first record for each key; duplicates are counted in self.duplicates."""
+        self.buffer.sort()
+        sources = [self._read_run(run) for run in self.runs] + [iter(self.buffer)]
+        self.duplicates = 0
+        previous = None
+        for key, _, record in heapq.merge(*sources):
+            if key == previous:
+                self.duplicates += 1
+                continue
+            previous = key
+            yield record
+    
+    def close(self):
+        for run in self.runs:
+            run.close()
+        self.runs = []
+        self.buffer = []
+
+def clean_email_list(input_path, valid_path, invalid_path, column=None, strip_plus=False,
+                     external_dedup=False, workers=None, batch_size=BATCH_SIZE, domain_validator=None):
+    """
+    Stream addresses from input_path, normalize and validate them in a
+    process pool, drop duplicates of valid addresses and write the valid
+    and invalid partitions. With a CSV column the partitions are CSV files
+    keeping the header and whole rows (valid rows get the normalized
+    address). With a domain_validator, addresses whose domain fails its
+    checks are also invalid; each batch's distinct domains are checked
+    concurrently in this process, so the cache is shared across batches.
+    Returns a dict of counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    counts = {"rows": 0, "valid": 0, "invalid": 0, "bad_domain": 0, "duplicates": 0}
+    seen = set()  # normalized addresses; --external-dedup when they will not fit in memory
+    deduplicator = ExternalDeduplicator(directory=os.path.dirname(os.path.abspath(valid_path))) if external_dedup else None
+    
+    with open(input_path, 'r', encoding='utf-8', errors='surrogateescape', newline='') as source, \
+            open(valid_path, 'w', encoding='utf-8', errors='surrogateescape', newline='') as valid_file, \
+            open(invalid_path, 'w', encoding='utf-8', errors='surrogateescape', newline='') as invalid_file:
+        if column is not None:
+            header = next(csv.reader([source.readline()]), [])
+            if not isinstance(column, int):
+                if column not in header:
+                    raise ValueError(f"Column '{column}' not found in {input_path}")
+                column = header.index(column)
+            valid_out, invalid_out = csv.writer(valid_file), csv.writer(invalid_file)
+            valid_out.writerow(header)
+            invalid_out.writerow(header)
+            write_valid, write_invalid = valid_out.writerow, invalid_out.writerow
+        else:
+            write_valid = lambda email: valid_file.write(email + '\n')
+            write_invalid = lambda email: invalid_file.write(email + '\n')
+        
+        def write(rows, emails, results):
+            domains = {}
+            if domain_validator is not None:
+                domains = domain_validator.check_domains({normalized.rpartition('@')[2] for normalized, ok in results if ok})
+            
+            for index, (normalized, ok) in enumerate(results):
+                counts["rows"] += 1
+                record = emails[index] if rows is None else rows[index]
+                if ok and domains and not domains[normalized.rpartition('@')[2]]["ok"]:
+                    counts["bad_domain"] += 1
+                    ok = False
+                if not ok:
+                    counts["invalid"] += 1
+                    write_invalid(record)
+                    continue
+                
+                if rows is None:
+                    record = normalized
+                else:
+                    record[column] = normalized
+                
+                if deduplicator is not None:
+                    deduplicator.add(normalized, record)
+                    continue
+                if normalized in seen:
+                    counts["duplicates"] += 1
+                    continue
+                seen.add(normalized)
+                counts["valid"] += 1
+                write_valid(record)
+        
+        batches = iter_address_batches(source, column, batch_size)
+        try:
+            if workers == 1:
+                for rows, emails in batches:
+                    write(rows, emails, _validate_batch(emails, strip_plus))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    pending = deque()
+                    for rows, emails in batches:
+                        pending.append((rows, emails, executor.submit(_validate_batch, emails, strip_plus)))
+                        if len(pending) >= workers * 2:
+                            rows, emails, future = pending.popleft()
+                            write(rows, emails, future.result())
+                    while pending:
+                        rows, emails, future = pending.popleft()
+                        write(rows, emails, future.result())
+            
+            if deduplicator is not None:
+                for record in deduplicator.unique():
+                    counts["valid"] += 1
+                    write_valid(record)
+                counts["duplicates"] = deduplicator.duplicates
+        finally:
+            if deduplicator is not None:
+                deduplicator.close()
+    
+    return counts
+
+def edit_distance(a, b, limit=2):
+    """Optimal string alignment distance, giving up once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+def suggest_domain(domain):
+    """Return the common domain that `domain` looks like a typo of, or None."""
+    if domain in COMMON_DOMAINS:
+        return None
+    best, best_distance = None, 3
+    for candidate in COMMON_DOMAINS:
+        distance = edit_distance(domain, candidate)
+        if distance < best_distance and (distance == 1 or len(candidate) > 8):
+            best, best_distance = candidate, distance
+    return best
+
+class TTLCache:
+    """LRU mapping whose entries also expire after a per-entry TTL."""
+    
+    def __init__(self, maxsize=DOMAIN_CACHE_SIZE, ttl=DOMAIN_TTL, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is None or entry[1] <= self.clock():
+            if entry is not None:
+                del self.data[key]
+            self.misses += 1
+            return None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def put(self, key, value, ttl=None):
+        self.data[key] = (value, self.clock() + (self.ttl if ttl is None else ttl))
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+    
+    def __len__(self):
+        return len(self.data)
+
+class DomainResolver:
+    """
+    Interface for DNS lookups. resolve(domain) returns {"mx": [hosts],
+    "a": bool} and raises for transient failures (timeouts, SERVFAIL).
+    """
+    
+    async def resolve(self, domain):
+        raise NotImplementedError
+
+class SystemResolver(DomainResolver):
+    """MX records through dnspython when installed, A/AAAA through the system resolver."""
+    
+    def __init__(self, timeout=DNS_TIMEOUT):
+        self.timeout = timeout
+    
+    async def resolve(self, domain):
+        mx = []
+        if dns is not None:
+            try:
+                answer = await dns.asyncresolver.resolve(domain, 'MX', lifetime=self.timeout)
+                mx = [str(record.exchange).rstrip('.') for record in answer]
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                pass
+            except dns.exception.DNSException as e:
+                raise OSError(f"MX lookup failed: {e}") from e
+        if mx:
+            return {"mx": mx, "a": True}
+        
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(loop.getaddrinfo(domain, None), self.timeout)
+            return {"mx": mx, "a": True}
+        except socket.gaierror as e:
+            if e.errno in (socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)):
+                return {"mx": mx, "a": False}
+            raise OSError(f"Address lookup failed: {e}") from e
+        except asyncio.TimeoutError as e:
+            raise OSError("Address lookup timed out") from e
+
+class StubResolver(DomainResolver):
+    """Resolver answering from a dict, for tests and offline runs."""
+    
+    def __init__(self, records=None, delay=0.0):
+        self.records = records or {}
+        self.delay = delay
+        self.calls = Counter()
+    
+    async def resolve(self, domain):
+        self.calls[domain] += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        record = self.records.get(domain)
+        if isinstance(record, Exception):
+            raise record
+        return record or {"mx": [], "a": False}
+
+class DomainValidator:
+    """
+    Domain checks for email addresses: disposable providers and MX/A
+    records, plus a suggested fix when a domain looks like a typo of a
+    common provider. Only a disposable provider or a domain with no MX or
+    A records fails; a suggestion alone never does, since real domains
+    (ymail.com, aon.com) sit close to common ones. Results are cached per
+    domain (shorter TTL for failures), concurrent lookups of one domain
+    share a single query and at most `concurrency` queries run at once.
+    """
+    
+    def __init__(self, resolver=None, cache=None, concurrency=DNS_CONCURRENCY,
+                 reject_disposable=True, disposable_domains=DISPOSABLE_DOMAINS):
+        self.resolver = resolver or SystemResolver()
+        self.cache = cache if cache is not None else TTLCache()
+        self.concurrency = concurrency
+        self.reject_disposable = reject_disposable
+        self.disposable_domains = disposable_domains
+        self._loop = None
+    
+    def _loop_state(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._inflight = {}
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+    
+    async def check_domain(self, domain):
+        domain = domain.casefold()
+        result = self.cache.get(domain)
+        if result is not None:
+            return result
+        self._loop_state()
+        task = self._inflight.get(domain)
+        if task is None:
+            task = asyncio.ensure_future(self._lookup(domain))
+            self._inflight[domain] = task
+            task.add_done_callback(lambda _: self._inflight.pop(domain, None))
+        return await task
+    
+    async def _lookup(self, domain):
+        result = {"domain": domain, "ok": True, "mx": False, "a": False, "disposable": False,
+                  "suggestion": None, "error": None}
+        
+        if domain in self.disposable_domains:
+            result["disposable"] = True
+            result["ok"] = not self.reject_disposable
+        result["suggestion"] = suggest_domain(domain)
+        
+        ttl = None
+        if result["ok"]:
+            async with self._semaphore:
+                try:
+                    records = await self.resolver.resolve(domain)
+                except OSError as e:
+                    # Don't reject addresses over a transient failure; retry soon.
+                    result["error"] = str(e)
+                    ttl = NEGATIVE_DOMAIN_TTL
+                else:
+                    result["mx"] = bool(records["mx"])
+                    result["a"] = records["a"]
+                    result["ok"] = result["mx"] or result["a"]
+                    if not result["ok"]:
+                        ttl = NEGATIVE_DOMAIN_TTL
+        
+        self.cache.put(domain, result, ttl)
+        return result
+    
+    async def check_domains_async(self, domains):
+        domains = list(domains)
+        results = await asyncio.gather(*(self.check_domain(domain) for domain in domains))
+        return dict(zip(domains, results))
+    
+    def check_domains(self, domains):
+        """Synchronous wrapper: {domain: result} for an iterable of domains."""
+        return asyncio.run(self.check_domains_async(domains))
+
+def load_domain_list(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return frozenset(line.strip().casefold() for line in f if line.strip() and not line.startswith('#'))
+
+def run_bulk(args):
+    stem, _ = os.path.splitext(args.bulk)
+    extension = '.csv' if args.column is not None else '.txt'
+    valid_path = args.valid_out or stem + '.valid' + extension
+    invalid_path = args.invalid_out or stem + '.invalid' + extension
+    column = int(args.column) if args.column is not None and args.column.isdigit() else args.column
+    
+    start = time.perf_counter()
+    try:
+        validator = make_domain_validator(args) if args.check_domains else None
+        counts = clean_email_list(args.bulk, valid_path, invalid_path, column, args.strip_plus,
+                                  args.external_dedup, args.workers, domain_validator=validator)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    
+    print(f"Processed {counts['rows']} addresses in {elapsed:.2f}s ({counts['rows'] / max(elapsed, 1e-9):,.0f}/s)")
+    print(f"Valid: {counts['valid']} -> {valid_path}")
+    print(f"Invalid: {counts['invalid']} -> {invalid_path}")
+    if validator is not None:
+        print(f"  of which failed domain checks: {counts['bad_domain']}")
+        print(f"Domains looked up: {len(validator.cache)} (cache hits: {validator.cache.hits})")
+    print(f"Duplicates removed: {counts['duplicates']}")
+    return 0
+
+def make_domain_validator(args):
+    disposable = DISPOSABLE_DOMAINS
+    if args.disposable_list:
+        disposable = disposable | load_domain_list(args.disposable_list)
+    return DomainValidator(concurrency=args.dns_concurrency, reject_disposable=not args.allow_disposable,
+                           disposable_domains=disposable)
+
+def describe_domain(result):
+    if result["disposable"]:
+        return "disposable email provider"
+    if result["error"]:
+        description = f"could not be checked ({result['error']})"
+    elif not result["ok"]:
+        description = "domain has no mail (MX) or address records"
+    else:
+        description = "domain accepts mail" if result["mx"] else "domain resolves (no MX record)"
+    if result["suggestion"]:
+        description += f"; did you mean {result['suggestion']}?"
+    return description
+
+def email_validator(domain_validator=None):
     
     print("Email Validator")
     email = input("Enter an email address to validate: ")
     if validate_email(email):
         print(f"{email} is a valid email address.")
+        if domain_validator is not None:
+            domain = normalize_email(email).rpartition('@')[2]
+            print(f"Domain check: {describe_domain(domain_validator.check_domains([domain])[domain])}")
     else:
         print(f"{email} is not a valid email address.")
-    
-    for test_email in test_email:
-        result = "valid" if validate_email(test_email) else "invalid"
-        print(f"- {test_email}: {result}")
 
-if __name__ == "__main__":
-    email_validator()
+def main():
+    parser = argparse.ArgumentParser(description='Validate one email address interactively or clean a list in bulk.')
+    
+    parser.add_argument('--bulk', metavar='FILE',
+                        help='Validate every address in FILE (one per line, or CSV with --column)')
+    
+    parser.add_argument('--column',
+                        help='CSV column holding the address (header name or 0-based index)')
+    
+    parser.add_argument('--valid-out',
+                        help='Output for valid, de-duplicated addresses (default: <FILE>.valid.txt/.csv)')
+    
+    parser.add_argument('--invalid-out',
+                        help='Output for invalid addresses (default: <FILE>.invalid.txt/.csv)')
+    
+    parser.add_argument('--strip-plus', action='store_true',
+                        help='Drop +tags from the local part before de-duplicating')
+    
+    parser.add_argument('--external-dedup', action='store_true',
+                        help='De-duplicate with an on-disk sort for inputs larger than memory (output is sorted)')
+    
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Worker processes (default: CPU count)')
+    
+    parser.add_argument('--check-domains', action='store_true',
+                        help='Also reject domains without MX/A records and disposable providers, and flag likely typos')
     
+    parser.add_argument('--allow-disposable', action='store_true',
+                        help='Accept disposable email providers when checking domains')
     
+    parser.add_argument('--disposable-list', metavar='FILE',
+                        help='Extra disposable domains, one per line')
+    
+    parser.add_argument('--dns-concurrency', type=int, default=DNS_CONCURRENCY,
+                        help=f'Concurrent DNS lookups (default: {DNS_CONCURRENCY})')
+    
+    args = parser.parse_args()
+    
+    if args.bulk:
+        return run_bulk(args)
+    
+    email_validator(make_domain_validator(args) if args.check_domains else None)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
 #output
 #Email Validator
 #Enter an email address to validate: dharrani123@gmail.com
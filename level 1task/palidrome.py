@@ -1,7 +1,183 @@
+import re
+import os
+import sys
+import string
+import argparse
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+NON_ALNUM_RE = re.compile(r'[\W_]+')
+ASCII_CLEAN_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase,
+                                  ''.join(chr(c) for c in range(128) if not chr(c).isalnum()))
+BYTES_LOWER_TABLE = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+BYTES_NON_ALNUM = bytes(c for c in range(256) if not chr(c).isalnum() or c >= 128)
+
+LINE_BATCH_SIZE = 10000
+READ_CHUNK_SIZE = 16 * 1024 * 1024
+
+def clean_text(text):
+    """Lowercase alphanumerics only, built in one C-level pass."""
+    if text.isascii():
+        return text.translate(ASCII_CLEAN_TABLE)
+    cleaned = NON_ALNUM_RE.sub('', text)
+    if 'Σ' in cleaned:
+        # str.lower() turns a word-final capital sigma into 'ς'; lower it
+        # character by character as is_palindrome always has.
+        return ''.join(map(str.lower, cleaned))
+    return cleaned.lower()
+
+def clean_bytes(data):
+    """The same view for ASCII bytes, without decoding."""
+    return data.translate(BYTES_LOWER_TABLE, BYTES_NON_ALNUM)
+
 def is_palindrome(string):
-    cleaned_string = ''.join(char.lower() for char in string if char.isalnum())
+    cleaned_string = clean_text(string)
     return cleaned_string == cleaned_string[::-1]
 
+def manacher(s):
+    """
+    Palindrome radii for every centre of s (a str or bytes) in linear time:
+    odd[i] is the number of palindromes centred on s[i], even[i] the number
+    centred between s[i - 1] and s[i].
+    """
+    n = len(s)
+    odd = array('l', [0]) * n
+    even = array('l', [0]) * n
+    
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+    
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return odd, even
+
+def longest_palindrome_span(s):
+    """(start, end) of the longest palindromic substring of s, end exclusive."""
+    if not s:
+        return 0, 0
+    odd, even = manacher(s)
+    best_odd = max(range(len(s)), key=odd.__getitem__)
+    best_even = max(range(len(s)), key=even.__getitem__)
+    if 2 * even[best_even] > 2 * odd[best_odd] - 1:
+        return best_even - even[best_even], best_even + even[best_even]
+    return best_odd - odd[best_odd] + 1, best_odd + odd[best_odd]
+
+def longest_palindrome(text):
+    """Longest palindromic substring of the cleaned text."""
+    cleaned = clean_text(text)
+    start, end = longest_palindrome_span(cleaned)
+    return cleaned[start:end]
+
+def _scan_line_batch(first_line, lines, min_length):
+    results = []
+    for line_number, line in enumerate(lines, first_line):
+        cleaned = clean_text(line)
+        if not cleaned:
+            continue
+        whole = cleaned == cleaned[::-1]
+        start, end = longest_palindrome_span(cleaned)
+        if whole or end - start >= min_length:
+            results.append((line_number, whole, cleaned[start:end]))
+    return results
+
+def _iter_line_batches(file, batch_size=LINE_BATCH_SIZE):
+    batch = []
+    first_line = 1
+    for line_number, line in enumerate(file, 1):
+        batch.append(line.rstrip('\r\n'))
+        if len(batch) == batch_size:
+            yield first_line, batch
+            batch = []
+            first_line = line_number + 1
+    if batch:
+        yield first_line, batch
+
+def scan_lines(path, min_length=3, workers=None, batch_size=LINE_BATCH_SIZE):
+    """
+    Yield (line_number, whole_line_is_palindrome, longest_palindrome) for
+    every line that is a palindrome or contains one of at least min_length
+    characters. Lines are streamed in batches through a process pool and
+    results come back in file order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        batches = _iter_line_batches(file, batch_size)
+        if workers == 1:
+            for first_line, lines in batches:
+                yield from _scan_line_batch(first_line, lines, min_length)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for first_line, lines in batches:
+                pending.append(executor.submit(_scan_line_batch, first_line, lines, min_length))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+def longest_palindrome_in_file(path, chunk_size=READ_CHUNK_SIZE):
+    """
+    Longest palindrome in the cleaned text of a whole file, ignoring line
+    breaks. The cleaned view is built once, chunk by chunk, as bytes for
+    ASCII files (one byte per character) and as str otherwise.
+    Returns (offset in the cleaned text, palindrome, cleaned length).
+    """
+    cleaned = bytearray()
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            if not chunk.isascii():
+                cleaned = None
+                break
+            cleaned += clean_bytes(chunk)
+    
+    if cleaned is None:
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            cleaned = ''.join(clean_text(block) for block in iter(lambda: file.read(chunk_size), ''))
+    else:
+        cleaned = bytes(cleaned)
+    
+    start, end = longest_palindrome_span(cleaned)
+    palindrome = cleaned[start:end]
+    if isinstance(palindrome, bytes):
+        palindrome = palindrome.decode('ascii')
+    return start, palindrome, len(cleaned)
+
+def run_file(args):
+    try:
+        if args.longest:
+            offset, palindrome, length = longest_palindrome_in_file(args.file)
+            print(f"Longest palindrome ({len(palindrome)} of {length} cleaned characters, at offset {offset}):")
+            print(palindrome)
+            return 0
+        
+        count = 0
+        for line_number, whole, palindrome in scan_lines(args.file, args.min_length, args.workers):
+            count += 1
+            label = "palindrome" if whole else f"contains {palindrome}"
+            print(f"{line_number}: {label}")
+        print(f"{count} matching lines")
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    return 0
+
 def palindrome_checker():
     print("Palindrome Checker Program")
     
@@ -11,10 +187,35 @@ def palindrome_checker():
         print(f'"{string}" is a palindrome.')
     else:
         print(f'"{string}" is not a palindrome.')
+        longest = longest_palindrome(string)
+        if len(longest) > 1:
+            print(f'Longest palindrome inside it: "{longest}"')
+
+def main():
+    parser = argparse.ArgumentParser(description='Check strings and files for palindromes.')
+    
+    parser.add_argument('--file', metavar='PATH',
+                        help='Report palindromic lines (and palindromes within lines) in PATH')
+    
+    parser.add_argument('--longest', action='store_true',
+                        help='With --file, find the longest palindrome across the whole file instead')
     
+    parser.add_argument('--min-length', type=int, default=5,
+                        help='Smallest palindrome inside a line worth reporting (default: 5)')
+    
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Worker processes for line scanning (default: CPU count)')
+    
+    args = parser.parse_args()
+    
+    if args.file:
+        return run_file(args)
+    
+    palindrome_checker()
+    return 0
 
 if __name__ == "__main__":
-    palindrome_checker()
+    sys.exit(main())
 
 #output
 #Palindrome Checker Program
@@ -1,10 +1,288 @@
+import re
+import os
+import sys
+import mmap
+import time
+import random
+import argparse
+import tempfile
+import unicodedata
+from functools import lru_cache
+
+try:
+    import regex
+except ImportError:  # fall back to an approximation of \X built from unicodedata
+    regex = None
+
+CHUNK_SIZE = 4 * 1024 * 1024
+REVERSE_MODES = ('bytes', 'chars', 'graphemes', 'lines')
+
+# An ASCII character other than CR followed by another ASCII character is a
+# cluster of its own under every grapheme rule, so runs of them can be
+# reversed as plain strings and the gap between two of them is always a
+# cluster boundary.
+ASCII_RUN = r'(?:[\x00-\x0c\x0e-\x7f](?=[\x00-\x7f]|\Z))+'
+STABLE_BOUNDARY_RE = re.compile(r'[\x00-\x0c\x0e-\x7f][\x00-\x7f]')
+# Format characters that are not grapheme Controls: ZWNJ and ZWJ extend a
+# cluster, and the prepended concatenation marks attach to what follows.
+PREPEND_OR_EXTEND_FORMAT = frozenset((0x200C, 0x200D, 0x600, 0x601, 0x602, 0x603, 0x604, 0x605,
+                                      0x6DD, 0x70F, 0x890, 0x891, 0x8E2, 0x110BD, 0x110CD))
+
 def reverse_string(input_string):
     return input_string[::-1]
-print("String Reversal")
-sample_string = "hello"
-reversed_string = reverse_string(sample_string)
-print(f"Original: {sample_string}")
-print(f"Reversed: {reversed_string}")
+
+def _char_ranges(codepoints):
+    """Character-class body matching ascending codepoints, as compressed ranges."""
+    ranges = []
+    for c in codepoints:
+        if ranges and ranges[-1][1] == c - 1:
+            ranges[-1][1] = c
+        else:
+            ranges.append([c, c])
+    return ''.join(f'{re.escape(chr(a))}-{re.escape(chr(b))}' for a, b in ranges)
+
+@lru_cache(maxsize=None)
+def grapheme_pattern():
+    """
+    Pattern matching one extended grapheme cluster. Uses the regex
+    module's \\X when installed; otherwise a base character with its
+    combining marks, variation selectors, emoji modifiers and ZWJ
+    sequences, plus CRLF and regional-indicator pairs. Control characters
+    (including CR and LF) are always clusters of their own (GB4/GB5).
+    """
+    if regex is not None:
+        return regex.compile(r'\X', regex.DOTALL)
+    marks, controls = [], []
+    for c in (*range(0x20000), *range(0xE0000, 0xE01F0)):
+        category = unicodedata.category(chr(c))
+        if category in ('Mn', 'Mc', 'Me'):
+            marks.append(c)
+        elif category in ('Cc', 'Zl', 'Zp') or (category == 'Cf' and c not in PREPEND_OR_EXTEND_FORMAT
+                                                 and not 0xE0020 <= c <= 0xE007F):
+            controls.append(c)
+    controls = _char_ranges(controls)
+    # A character joined on by ZWJ is never a control or a regional
+    # indicator, so "x\u200d\r\n" keeps its CRLF and RI pairing holds.
+    control, base, joined = f'[{controls}]', f'[^{controls}]', f'[^{controls}\U0001F1E6-\U0001F1FF]'
+    extend = '[' + _char_ranges(marks) + '\ufe00-\ufe0f\U0001F3FB-\U0001F3FF\U000E0020-\U000E007F]'
+    return re.compile(rf'\r\n|{control}|(?:[\U0001F1E6-\U0001F1FF]{{2}}|{base}){extend}*'
+                      rf'(?:\u200d(?:{joined}{extend}*)?)*')
+
+@lru_cache(maxsize=None)
+def reversal_pattern():
+    """grapheme_pattern() with ASCII runs matched whole, in group 1."""
+    cluster = grapheme_pattern()
+    engine = regex if regex is not None else re
+    return engine.compile(f'({ASCII_RUN})|({cluster.pattern})', cluster.flags)
+
+def _is_regional_indicator(char):
+    return '\U0001F1E6' <= char <= '\U0001F1FF'
+
+def _unstable_prefix(clusters):
+    """
+    Number of leading clusters that text before them could still change:
+    the first one (it may be marks for an earlier base), anything joined
+    on by a trailing ZWJ, and a leading run of regional indicators, whose
+    pairing depends on how many come before.
+    """
+    held = 1
+    while held < len(clusters):
+        previous, current = clusters[held - 1], clusters[held]
+        if not (previous.endswith('\u200d') or (_is_regional_indicator(previous[0]) and _is_regional_indicator(current[0]))):
+            break
+        held += 1
+    return held
+
+def reverse_graphemes(text):
+    return ''.join([run[::-1] or cluster for run, cluster in reversed(reversal_pattern().findall(text))])
+
+def _stable_split(text):
+    """
+    Length of the prefix of text that text before it could still change:
+    up to the first boundary between two ASCII characters, or else the
+    clusters counted by _unstable_prefix.
+    """
+    match = STABLE_BOUNDARY_RE.search(text)
+    if match:
+        return match.start() + 1
+    clusters = grapheme_pattern().findall(text)
+    return sum(map(len, clusters[:_unstable_prefix(clusters)])) if clusters else 0
+
+def _open_map(file):
+    size = os.fstat(file.fileno()).st_size
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+def _char_start(data, position):
+    """Move position forward past UTF-8 continuation bytes to a character start."""
+    while position < len(data) and data[position] & 0xC0 == 0x80:
+        position += 1
+    return position
+
+def iter_reversed_bytes(data, chunk_size=CHUNK_SIZE):
+    for end in range(len(data), 0, -chunk_size):
+        yield data[max(0, end - chunk_size):end][::-1]
+
+def iter_reversed_chars(data, chunk_size=CHUNK_SIZE, graphemes=False):
+    """
+    Reverse UTF-8 data chunk by chunk from the end. Chunk starts are moved
+    to character boundaries; with graphemes, the leading text of every
+    chunk that earlier text could change (see _stable_split) is held back
+    and re-read with the chunk before it, so clusters that straddle a chunk
+    edge stay intact.
+    """
+    end = len(data)
+    carry = ''
+    while end > 0:
+        start = 0 if end <= chunk_size else _char_start(data, end - chunk_size)
+        if start >= end:
+            # A single run of continuation bytes longer than the chunk.
+            start = 0
+        text = data[start:end].decode('utf-8', 'surrogateescape')
+        if graphemes:
+            text += carry
+            held = _stable_split(text) if start > 0 else 0
+            carry = text[:held]
+            text = reverse_graphemes(text[held:])
+        else:
+            text = text[::-1]
+        yield text.encode('utf-8', 'surrogateescape')
+        end = start
+    if carry:
+        yield carry.encode('utf-8', 'surrogateescape')
+
+def iter_reversed_lines(data, chunk_size=CHUNK_SIZE):
+    """
+    Lines in reverse order, like tac. Each block ends on a line boundary,
+    so lines are split and re-joined in C. A final line without a newline
+    gets one, so it never runs into the line printed after it.
+    """
+    end = len(data)
+    while end > 0:
+        start = data.rfind(b'\n', 0, max(0, end - chunk_size)) + 1
+        lines = data[start:end].split(b'\n')
+        if lines[-1] == b'':
+            lines.pop()
+        lines.reverse()
+        lines.append(b'')
+        yield b'\n'.join(lines)
+        end = start
+
+def reverse_file(source_path, target_path, mode='lines', chunk_size=CHUNK_SIZE):
+    """
+    Write source_path reversed by mode ('bytes', 'chars', 'graphemes' or
+    'lines') to target_path. The source is memory-mapped and read
+    backwards in chunks, so memory use is bounded by chunk_size (plus the
+    longest line in lines mode) regardless of file size.
+    """
+    if mode not in REVERSE_MODES:
+        raise ValueError(f"mode must be one of {', '.join(REVERSE_MODES)}")
+    with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+        data = _open_map(source)
+        try:
+            if mode == 'bytes':
+                blocks = iter_reversed_bytes(data, chunk_size)
+            elif mode == 'lines':
+                blocks = iter_reversed_lines(data, chunk_size)
+            else:
+                blocks = iter_reversed_chars(data, chunk_size, graphemes=mode == 'graphemes')
+            for block in blocks:
+                target.write(block)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+def reverse_file_naive(source_path, target_path, mode='lines'):
+    """Read everything, reverse in memory, write; the baseline for benchmark()."""
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    if mode == 'bytes':
+        result = data[::-1]
+    elif mode == 'lines':
+        lines = data.split(b'\n')
+        if lines[-1] == b'':
+            lines.pop()
+        result = b''.join(line + b'\n' for line in reversed(lines))
+    else:
+        text = data.decode('utf-8', 'surrogateescape')
+        text = reverse_graphemes(text) if mode == 'graphemes' else text[::-1]
+        result = text.encode('utf-8', 'surrogateescape')
+    with open(target_path, 'wb') as f:
+        f.write(result)
+
+def _same_file(path_a, path_b):
+    with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+        return a.read() == b.read()
+
+def benchmark(size_mb=64, modes=REVERSE_MODES, seed=0):
+    """MB/s of reverse_file against reverse_file_naive on a synthetic UTF-8 log."""
+    rng = random.Random(seed)
+    words = ['GET', 'POST', '/api/v1/items', 'status=200', 'user=42', 'café', 'naïve', 'ok', 'latency_ms=12', '👍🏽']
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'log.txt')
+        with open(source, 'w', encoding='utf-8') as f:
+            written = 0
+            while written < size_mb * 1024 * 1024:
+                line = ' '.join(rng.choice(words) for _ in range(rng.randint(4, 14))) + '\n'
+                written += f.write(line)
+        size = os.path.getsize(source)
+        
+        rows = []
+        for mode in modes:
+            timings = []
+            for function in (reverse_file_naive, reverse_file):
+                target = os.path.join(directory, f'{function.__name__}.{mode}')
+                start = time.perf_counter()
+                function(source, target, mode)
+                timings.append(size / 1e6 / (time.perf_counter() - start))
+            same = _same_file(os.path.join(directory, f'reverse_file_naive.{mode}'),
+                              os.path.join(directory, f'reverse_file.{mode}'))
+            rows.append((mode, timings[0], timings[1], same))
+    return size, rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Reverse strings, or whole files in constant memory.')
+    
+    parser.add_argument('--file', metavar='PATH',
+                        help='File to reverse')
+    
+    parser.add_argument('-o', '--output',
+                        help='Where to write the reversed file (default: <PATH>.reversed)')
+    
+    parser.add_argument('--mode', choices=REVERSE_MODES, default='lines',
+                        help='Reverse line order (like tac), bytes, characters or grapheme clusters')
+    
+    parser.add_argument('--benchmark', metavar='MB', type=int, nargs='?', const=64,
+                        help='Compare chunked and naive reversal on an MB-sized synthetic log')
+    
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        size, rows = benchmark(args.benchmark)
+        print(f"{size / 1e6:.0f} MB log")
+        print(f"{'mode':<12}{'naive MB/s':>12}{'chunked MB/s':>14}{'same':>6}")
+        for mode, naive, chunked, same in rows:
+            print(f"{mode:<12}{naive:>12.0f}{chunked:>14.0f}{'yes' if same else 'NO':>6}")
+        return 0
+    
+    if args.file:
+        output = args.output or args.file + '.reversed'
+        try:
+            reverse_file(args.file, output, args.mode)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Reversed {args.mode} of {args.file} -> {output}")
+        return 0
+    
+    print("String Reversal")
+    sample_string = "hello"
+    reversed_string = reverse_string(sample_string)
+    print(f"Original: {sample_string}")
+    print(f"Reversed: {reversed_string}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
 
 #output
 #String Reversal
@@ -1,9 +1,212 @@
+import os
+import csv
+import sys
+import time
+import random
+import argparse
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # the interactive converter works without NumPy; bulk conversion needs it
+    np = None
+
+# Freezing point of water in each unit and how many of its degrees make one Celsius degree.
+UNITS = {
+    'C': (0.0, 1.0),
+    'F': (32.0, 1.8),
+    'K': (273.15, 1.0),
+    'R': (491.67, 1.8),
+}
+UNIT_NAMES = {'CELSIUS': 'C', 'FAHRENHEIT': 'F', 'KELVIN': 'K', 'RANKINE': 'R'}
+
+CSV_CHUNK_ROWS = 100000
+BINARY_CHUNK_VALUES = 1 << 22
+
 def celsius_to_fahrenheit(celsius):
     return (celsius * 9/5) + 32
 def fahrenheit_to_celsius(fahrenheit):
     return (fahrenheit - 32) * 5/9
-def temperature_converter():
 
+def parse_unit(unit):
+    """'C', 'f', 'Kelvin', ... -> one of the UNITS keys."""
+    key = unit.strip().upper()
+    key = UNIT_NAMES.get(key, key)
+    if key not in UNITS:
+        raise ValueError(f"Unknown unit {unit!r}; use C, F, K or R")
+    return key
+
+def _conversion(from_unit, to_unit):
+    from_zero, from_degree = UNITS[parse_unit(from_unit)]
+    to_zero, to_degree = UNITS[parse_unit(to_unit)]
+    return from_zero, to_degree / from_degree, to_zero
+
+def convert_temperature(value, from_unit, to_unit):
+    from_zero, ratio, to_zero = _conversion(from_unit, to_unit)
+    return (value - from_zero) * ratio + to_zero
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for bulk temperature conversion")
+
+def convert_inplace(values, from_unit, to_unit):
+    """
+    Convert a float32 or float64 NumPy array in place, one ufunc pass per
+    step that is not a no-op (at most subtract, multiply, add), and
+    return it. NaNs stay NaN.
+    """
+    _require_numpy()
+    if not isinstance(values, np.ndarray) or values.dtype.kind != 'f':
+        raise TypeError("convert_inplace needs a float32 or float64 NumPy array")
+    from_zero, ratio, to_zero = _conversion(from_unit, to_unit)
+    if from_zero:
+        np.subtract(values, from_zero, out=values)
+    if ratio != 1:
+        np.multiply(values, ratio, out=values)
+    if to_zero:
+        np.add(values, to_zero, out=values)
+    return values
+
+def convert_array(values, from_unit, to_unit, dtype='float64'):
+    """Converted copy of any sequence of numbers as a NumPy array of dtype."""
+    _require_numpy()
+    return convert_inplace(np.array(values, dtype=dtype), from_unit, to_unit)
+
+def _require_distinct(source_path, target_path):
+    """Refuse to write over the input: opening the target would truncate it before it is read."""
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        raise ValueError(f"{target_path} is the input file; choose a different output path")
+
+def convert_binary(source_path, target_path, from_unit, to_unit, dtype='float32', chunk_values=BINARY_CHUNK_VALUES):
+    """
+    Convert a raw file of native-endian float32 or float64 readings.
+    Chunks are read straight into one reusable buffer, converted in place
+    and written out from it. With target_path None the file itself is
+    memory-mapped and rewritten in place. Returns the number of values.
+    """
+    _require_numpy()
+    dtype = np.dtype(dtype)
+    size = os.path.getsize(source_path)
+    if size % dtype.itemsize:
+        raise ValueError(f"{source_path} is not a whole number of {dtype.name} values")
+    
+    if target_path is None:
+        if not size:
+            return 0
+        values = np.memmap(source_path, dtype=dtype, mode='r+')
+        for start in range(0, len(values), chunk_values):
+            convert_inplace(values[start:start + chunk_values], from_unit, to_unit)
+        values.flush()
+        del values
+        return size // dtype.itemsize
+    
+    _require_distinct(source_path, target_path)
+    buffer = np.empty(chunk_values, dtype=dtype)
+    raw = memoryview(buffer).cast('B')
+    count = 0
+    with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+        while True:
+            filled = source.readinto(raw)
+            if not filled:
+                break
+            chunk = buffer[:filled // dtype.itemsize]
+            convert_inplace(chunk, from_unit, to_unit)
+            target.write(memoryview(chunk))
+            count += len(chunk)
+    return count
+
+def _column_floats(cells):
+    """Parse a column in one C call; blank or non-numeric cells become NaN and are reported."""
+    try:
+        return np.array(cells, dtype=np.float64), None
+    except ValueError:
+        invalid = []
+        values = np.empty(len(cells), dtype=np.float64)
+        for i, cell in enumerate(cells):
+            try:
+                values[i] = float(cell)
+            except ValueError:
+                values[i] = np.nan
+                invalid.append(i)
+        return values, invalid
+
+def _resolve_columns(columns, header):
+    indices = []
+    for column in columns:
+        if header is not None and column in header:
+            indices.append(header.index(column))
+        elif column.isdigit():
+            indices.append(int(column))
+        else:
+            raise ValueError(f"No column named {column!r}")
+    return indices
+
+def convert_csv(source_path, target_path, columns, from_unit, to_unit, precision=2, header=True,
+                delimiter=',', chunk_rows=CSV_CHUNK_ROWS):
+    """
+    Stream a CSV (or any delimited sensor log) converting the given
+    columns (names, or zero-based indices) from from_unit to to_unit.
+    Each block of chunk_rows rows is parsed per column into a float64
+    array, converted in place with ufuncs and written back; other columns
+    pass through untouched, as do blank or non-numeric cells. precision
+    is the number of decimals written, or None for the shortest exact form.
+    Returns the number of data rows.
+    """
+    _require_numpy()
+    _require_distinct(source_path, target_path)
+    fmt = repr if precision is None else f'{{:.{precision}f}}'.format
+    count = 0
+    with open(source_path, newline='') as source, open(target_path, 'w', newline='') as target:
+        reader = csv.reader(source, delimiter=delimiter)
+        writer = csv.writer(target, delimiter=delimiter)
+        names = next(reader, None) if header else None
+        if header:
+            if names is None:
+                return 0
+            writer.writerow(names)
+        indices = _resolve_columns(columns, names)
+        
+        while True:
+            rows = list(islice(reader, chunk_rows))
+            if not rows:
+                break
+            for index in indices:
+                cells = [row[index] if index < len(row) else '' for row in rows]
+                values, invalid = _column_floats(cells)
+                convert_inplace(values, from_unit, to_unit)
+                converted = list(map(fmt, values.tolist()))
+                for i in invalid or ():
+                    converted[i] = cells[i]
+                for row, cell in zip(rows, converted):
+                    if index < len(row):
+                        row[index] = cell
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+def benchmark(count=10_000_000, seed=0):
+    """Values per second: the scalar functions in a loop against convert_inplace on float64 and float32."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    readings = rng.uniform(-40, 120, count)
+    rows = []
+    
+    sample = readings[:min(count, 1_000_000)].tolist()
+    start = time.perf_counter()
+    scalar = [celsius_to_fahrenheit(value) for value in sample]
+    rows.append(('scalar loop', len(sample), len(sample) / (time.perf_counter() - start)))
+    
+    for dtype in ('float64', 'float32'):
+        values = readings.astype(dtype)
+        start = time.perf_counter()
+        convert_inplace(values, 'C', 'F')
+        rows.append((f'in place {dtype}', count, count / (time.perf_counter() - start)))
+        if dtype == 'float64':
+            same = np.allclose(values[:len(scalar)], scalar, rtol=1e-12)
+    return rows, same
+
+def temperature_converter():
+    
     print("Temperature Conversion Program")
     try:
         temp = float(input("Enter the temperature value: "))
@@ -20,9 +223,95 @@ def temperature_converter():
     except ValueError:
         print("Please enter a valid number for temperature.")
 
-if __name__ == "__main__":
-    temperature_converter()
+def run_bulk(args):
+    start = time.perf_counter()
+    try:
+        if args.csv:
+            output = args.output or args.csv.rsplit('.', 1)[0] + f'.{parse_unit(args.to_unit)}.csv'
+            columns = [column.strip() for column in args.columns.split(',')]
+            count = convert_csv(args.csv, output, columns, args.from_unit, args.to_unit,
+                                None if args.precision < 0 else args.precision,
+                                header=not args.no_header, delimiter=args.delimiter)
+        elif args.in_place:
+            output = args.binary
+            count = convert_binary(args.binary, None, args.from_unit, args.to_unit, args.dtype)
+        else:
+            output = args.output or args.binary.rsplit('.', 1)[0] + f'.{parse_unit(args.to_unit)}.bin'
+            count = convert_binary(args.binary, output, args.from_unit, args.to_unit, args.dtype)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"Converted {count} {'rows' if args.csv else 'readings'} from {parse_unit(args.from_unit)} "
+          f"to {parse_unit(args.to_unit)} in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f}/s)")
+    print(f"Results written to {output}")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert temperatures between Celsius, Fahrenheit, Kelvin and Rankine.')
+    
+    parser.add_argument('--csv', metavar='PATH',
+                        help='Convert columns of a CSV or delimited sensor log')
+    
+    parser.add_argument('--binary', metavar='PATH',
+                        help='Convert a raw file of float32/float64 readings')
+    
+    parser.add_argument('--from', dest='from_unit', default='C',
+                        help='Unit of the input values: C, F, K or R (default: C)')
+    
+    parser.add_argument('--to', dest='to_unit', default='F',
+                        help='Unit to convert to (default: F)')
+    
+    parser.add_argument('--columns', default='temperature',
+                        help='Comma-separated names or zero-based indices of the CSV columns to convert')
+    
+    parser.add_argument('--delimiter', default=',',
+                        help='CSV field delimiter (default: ,)')
+    
+    parser.add_argument('--no-header', action='store_true',
+                        help='The CSV has no header row; --columns are indices')
     
+    parser.add_argument('--precision', type=int, default=2,
+                        help='Decimals written to the CSV (default: 2; -1 for full precision)')
+    
+    parser.add_argument('--dtype', choices=['float32', 'float64'], default='float32',
+                        help='Value type of a --binary file (default: float32)')
+    
+    parser.add_argument('-o', '--output',
+                        help='Output path (default: <PATH>.<unit>.csv for --csv, <PATH>.<unit>.bin for --binary)')
+    
+    parser.add_argument('--in-place', action='store_true',
+                        help='Rewrite the --binary file itself instead of writing a new one')
+    
+    parser.add_argument('--benchmark', metavar='N', type=int, nargs='?', const=10_000_000,
+                        help='Compare per-value function calls with in-place array conversion')
+    
+    args = parser.parse_args()
+    
+    if args.in_place and (not args.binary or args.output):
+        parser.error('--in-place needs --binary and no -o')
+    
+    if args.benchmark:
+        try:
+            rows, same = benchmark(args.benchmark)
+        except ImportError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"{'method':<18}{'values':>12}{'values/s':>16}")
+        for method, count, rate in rows:
+            print(f"{method:<18}{count:>12}{rate:>16,.0f}")
+        print(f"Results agree: {'yes' if same else 'NO'}")
+        return 0
+    
+    if args.csv or args.binary:
+        return run_bulk(args)
+    
+    temperature_converter()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+   
    #output
      #Temperature Conversion Program
      #Enter the temperature value: 100
@@ -1,3 +1,12 @@
+import sys
+import math
+import time
+import argparse
+import tracemalloc
+from itertools import islice
+
+PRINT_ALL_LIMIT = 1000
+
 def generate_fibonacci(n_terms):
     if not isinstance(n_terms, int) or n_terms <= 0:
         return "Please enter a positive integer."
@@ -15,7 +24,178 @@ def generate_fibonacci(n_terms):
     
     return fibonacci_sequence
 
+def fibonacci_pair(n, mod=None):
+    """Return (F(n), F(n+1)) by fast doubling in O(log n) steps, optionally mod `mod`."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod:
+            c, d = c % mod, d % mod
+        a, b = (d, c + d) if bit == '1' else (c, d)
+        if mod:
+            b %= mod
+    return a, b
+
+def fibonacci(n, mod=None):
+    return fibonacci_pair(n, mod)[0]
+
+def fibonacci_sum(n_terms):
+    """Sum of the first n_terms terms F(0)..F(n_terms - 1), which is F(n_terms + 1) - 1."""
+    return fibonacci(n_terms + 1) - 1 if n_terms > 0 else 0
+
+def fibonacci_ratio(n_terms):
+    """F(n_terms - 1) / F(n_terms - 2), the ratio of the last two of n_terms terms."""
+    previous, last = fibonacci_pair(n_terms - 2)
+    return last / previous
+
+def iter_fibonacci(n_terms=None, start=0, mod=None):
+    """Lazily yield F(start), F(start + 1), ... (n_terms of them, or forever)."""
+    a, b = fibonacci_pair(start, mod)
+    count = 0
+    while n_terms is None or count < n_terms:
+        yield a
+        a, b = b, (a + b) % mod if mod else a + b
+        count += 1
+
+def _factorize(m):
+    factors = {}
+    d = 2
+    while d * d <= m:
+        while m % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            m //= d
+        d += 1 if d == 2 else 2
+    if m > 1:
+        factors[m] = factors.get(m, 0) + 1
+    return factors
+
+def _divisors(n):
+    divisors = [1]
+    for prime, power in _factorize(n).items():
+        divisors = [d * prime ** k for d in divisors for k in range(power + 1)]
+    return sorted(divisors)
+
+def _prime_pisano_period(p):
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    # pi(p) divides p - 1 when p = +-1 (mod 10), otherwise 2(p + 1).
+    bound = p - 1 if p % 10 in (1, 9) else 2 * (p + 1)
+    for d in _divisors(bound):
+        if fibonacci_pair(d, p) == (0, 1):
+            return d
+    return bound
+
+def pisano_period(m):
+    """Period of the Fibonacci sequence mod m, from the periods of its prime powers."""
+    if m < 1:
+        raise ValueError("modulus must be positive")
+    period = 1
+    for prime, power in _factorize(m).items():
+        period = math.lcm(period, _prime_pisano_period(prime) * prime ** (power - 1))
+    return period
+
+def benchmark(sizes=(1000, 10000, 100000)):
+    """Compare the list builder with the closed forms for the sum and ratio of n terms."""
+    rows = []
+    for n in sizes:
+        tracemalloc.start()
+        start = time.perf_counter()
+        sequence = generate_fibonacci(n)
+        total = sum(sequence)
+        ratio = sequence[-1] / sequence[-2]
+        list_seconds = time.perf_counter() - start
+        list_peak = tracemalloc.get_traced_memory()[1]
+        del sequence
+        tracemalloc.stop()
+        
+        tracemalloc.start()
+        start = time.perf_counter()
+        fast_total = fibonacci_sum(n)
+        fast_ratio = fibonacci_ratio(n)
+        fast_seconds = time.perf_counter() - start
+        fast_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        assert total == fast_total and ratio == fast_ratio
+        rows.append((n, list_seconds, list_peak, fast_seconds, fast_peak))
+    return rows
+
+def print_sequence(n, start=0, mod=None):
+    terms = iter_fibonacci(n, start, mod)
+    if n <= 15:
+        print(list(terms))
+        return
+    for i, num in enumerate(terms):
+        if i % 10 == 0 and i > 0:
+            print()  
+        print(f"{num:<15}", end="")
+    print() 
+
+def run_cli(args):
+    if args.benchmark:
+        print(f"{'terms':>10}{'list s':>12}{'list MB':>12}{'fast s':>12}{'fast MB':>12}")
+        for n, list_seconds, list_peak, fast_seconds, fast_peak in benchmark(args.sizes):
+            print(f"{n:>10}{list_seconds:>12.4f}{list_peak / 1e6:>12.2f}{fast_seconds:>12.6f}{fast_peak / 1e6:>12.3f}")
+        return 0
+    
+    if args.nth is not None:
+        value = fibonacci(args.nth, args.mod)
+        label = f"F({args.nth})" + (f" mod {args.mod}" if args.mod else "")
+        print(f"{label} = {value}")
+        if args.pisano and args.mod:
+            print(f"Pisano period for {args.mod}: {pisano_period(args.mod)}")
+        return 0
+    
+    if args.terms is not None:
+        print_sequence(args.terms, args.start, args.mod)
+        return 0
+    return None
+
 def main():
+    parser = argparse.ArgumentParser(description='Generate Fibonacci numbers.')
+    
+    parser.add_argument('--nth', type=int, metavar='N',
+                        help='Print F(N) only (fast doubling; works for very large N)')
+    
+    parser.add_argument('--terms', type=int, metavar='N',
+                        help='Stream N terms to stdout without building a list')
+    
+    parser.add_argument('--start', type=int, default=0,
+                        help='Index of the first streamed term (default: 0)')
+    
+    parser.add_argument('--mod', type=int, metavar='M',
+                        help='Work modulo M')
+    
+    parser.add_argument('--pisano', action='store_true',
+                        help='With --nth and --mod, also print the Pisano period of M (factorizes M by trial division)')
+    
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare the list builder with the closed-form sum and ratio')
+    
+    parser.add_argument('--sizes', type=lambda value: [int(n) for n in value.split(',')], default=[1000, 10000, 100000],
+                        help='Comma-separated term counts for --benchmark')
+    
+    args = parser.parse_args()
+    
+    for option, value in (('--nth', args.nth), ('--terms', args.terms), ('--start', args.start)):
+        if value is not None and value < 0:
+            parser.error(f"{option} must be non-negative")
+    if args.mod is not None and args.mod < 1:
+        parser.error("--mod must be a positive integer")
+    
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+    
+    status = run_cli(args)
+    if status is not None:
+        return status
+    
     print(" Fibonacci Sequence Generator ")
     
     while True:
@@ -32,31 +212,25 @@ def main():
                 print("Please enter a positive integer.")
                 continue
             
-            sequence = generate_fibonacci(n)
-            
             print(f"\nFibonacci sequence up to {n} terms:")
             
-            if len(sequence) <= 15:
-                print(sequence)
+            if n <= PRINT_ALL_LIMIT or input(f"Print all {n} terms? [y/n]: ").lower() in ['y', 'yes']:
+                print_sequence(n)
             else:
-                for i, num in enumerate(sequence):
-                    if i % 10 == 0 and i > 0:
-                        print()  
-                    print(f"{num:<15}", end="")
-                print() 
+                print(f"Last term: F({n - 1}) = {fibonacci(n - 1)}")
             
-            print(f"\nSum of the sequence: {sum(sequence)}")
+            print(f"\nSum of the sequence: {fibonacci_sum(n)}")
             
             if n > 2:
-                golden_ratio = sequence[-1] / sequence[-2]
+                golden_ratio = fibonacci_ratio(n)
                 print(f"Ratio of last two terms (approximation of golden ratio): {golden_ratio:.8f}")
-            
+        
         except ValueError:
             print("Invalid input. Please enter a positive integer.")
-            
+        
         except KeyboardInterrupt:
             print("\nProgram interrupted. Exiting.")
             break
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -1,17 +1,72 @@
 import re
 import os
+import io
+import glob
+import heapq
+import math
+import sqlite3
+from itertools import islice
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-def count_words_in_file(file_path):
+try:
+    import numpy as np
+except ImportError:  # only the n-gram and co-occurrence counters need NumPy
+    np = None
+
+WORD_PATTERN = re.compile(r'\b[a-z0-9]+\b')
+LAST_BREAK_PATTERN = re.compile(r'\W(?=\w*\Z)')
+CHUNK_SIZE = 1024 * 1024
+STREAMING_THRESHOLD = 64 * 1024 * 1024
+SHARD_BYTES = 64 * 1024 * 1024
+WORD_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_') | frozenset(range(0x80, 0x100))
+
+def iter_text_blocks(file, chunk_size=CHUNK_SIZE):
+    """
+    Yield lowercased blocks of text that each end on a non-word character,
+    so no word is ever split between two blocks.
+    """
+    carry = ''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        
+        text = carry + chunk.lower()
+        last_break = LAST_BREAK_PATTERN.search(text, len(carry))
+        
+        if last_break is None:
+            carry = text
+            continue
+        
+        yield text[:last_break.end()]
+        carry = text[last_break.end():]
+    
+    if carry:
+        yield carry
+
+def count_words_streaming(file, chunk_size=CHUNK_SIZE, word_counts=None):
+    word_counts = Counter() if word_counts is None else word_counts
+    for block in iter_text_blocks(file, chunk_size):
+        word_counts.update(WORD_PATTERN.findall(block))
+    return word_counts
+
+def count_words_in_file(file_path, streaming=None):
     if not os.path.exists(file_path):
         print(f"Error: File '{file_path}' not found.")
         return None
     
+    if streaming is None:
+        streaming = os.path.getsize(file_path) > STREAMING_THRESHOLD
+    
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
+            if streaming:
+                return count_words_streaming(file)
+            
             content = file.read().lower()
             
-            words = re.findall(r'\b[a-z0-9]+\b', content)
+            words = WORD_PATTERN.findall(content)
             
             word_counts = Counter(words)
             
@@ -21,25 +76,534 @@ def count_words_in_file(file_path):
         print(f"Error reading file: {e}")
         return None
 
-def display_word_counts(word_counts, sort_by='alphabetical', limit=None):
-    if not word_counts:
-        return
+class _ByteRange(io.RawIOBase):
+    def __init__(self, path, start, end):
+        self.file = open(path, 'rb')
+        self.file.seek(start)
+        self.remaining = end - start
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        data = self.file.read(min(len(buffer), self.remaining))
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+    
+    def close(self):
+        self.file.close()
+        super().close()
+
+def iter_corpus_files(paths):
+    """Expand directories (recursively) and glob patterns into file paths."""
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = (os.path.join(root, name) for root, _, names in os.walk(path) for name in sorted(names))
+        elif any(ch in path for ch in '*?['):
+            candidates = sorted(glob.glob(path, recursive=True))
+        else:
+            candidates = [path]
+        
+        for candidate in candidates:
+            real = os.path.realpath(candidate)
+            if os.path.isfile(real) and real not in seen:
+                seen.add(real)
+                yield candidate
+
+def split_file(file_path, shard_bytes=SHARD_BYTES):
+    """
+    Split a file into byte ranges of roughly shard_bytes. Every boundary is
+    placed just after an ASCII non-word byte, which can never be part of a
+    word or of a multi-byte UTF-8 character.
+    """
+    size = os.path.getsize(file_path)
+    bounds = [0]
+    with open(file_path, 'rb') as f:
+        for offset in range(shard_bytes, size, shard_bytes):
+            if offset <= bounds[-1]:
+                continue
+            f.seek(offset)
+            while True:
+                block = f.read(64 * 1024)
+                if not block:
+                    offset = size
+                    break
+                cut = next((i for i, byte in enumerate(block) if byte not in WORD_BYTES), None)
+                if cut is not None:
+                    offset += cut + 1
+                    break
+                offset += len(block)
+            if offset < size:
+                bounds.append(offset)
+    bounds.append(size)
+    return [(file_path, start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+def _count_shard_batch(shards, chunk_size=CHUNK_SIZE):
+    """
+    Count a batch of (file_path, start, end, split) shards. Returns
+    (word_counts, split_counts, errors): word_counts merges the files read
+    in one piece, split_counts keeps per-file counts for files split into
+    several shards (another batch may fail on the same file, and then all
+    of it is dropped) and errors maps each failed file to its error.
+    """
+    word_counts = Counter()
+    split_counts = {}
+    errors = {}
+    for file_path, start, end, split in shards:
+        if file_path in errors:
+            continue
+        try:
+            with io.TextIOWrapper(io.BufferedReader(_ByteRange(file_path, start, end)), encoding='utf-8') as file:
+                shard_counts = count_words_streaming(file, chunk_size)
+        except (OSError, UnicodeDecodeError) as e:
+            errors[file_path] = f"{file_path}: {e}"
+            split_counts.pop(file_path, None)
+            continue
+        if split:
+            split_counts[file_path] = _merge_counts(split_counts.get(file_path, Counter()), shard_counts)
+        else:
+            word_counts = _merge_counts(word_counts, shard_counts)
+    return word_counts, split_counts, errors
+
+def _merge_counts(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    a.update(b)
+    return a
+
+def count_words_in_corpus(paths, workers=None, shard_bytes=SHARD_BYTES):
+    """
+    Count words across every file matched by paths (files, directories or
+    glob patterns) with a process pool. Large files are split into byte
+    ranges; per-task counters are combined by a pairwise tree reduction run
+    in the same pool. A file that fails to read or decode anywhere is left
+    out entirely, as count_words_in_file would return nothing for it.
+    Returns (word_counts, files_counted, errors), one error per failed file.
+    """
+    files = list(iter_corpus_files(paths))
+    shards = []
+    for file_path in files:
+        file_shards = split_file(file_path, shard_bytes)
+        shards.extend((*shard, len(file_shards) > 1) for shard in file_shards)
+    workers = workers or os.cpu_count() or 1
+    
+    # Longest-first greedy packing keeps the batches close in total bytes.
+    batch_count = max(1, min(len(shards), workers * 4))
+    batches = [[] for _ in range(batch_count)]
+    loads = [0] * batch_count
+    for shard in sorted(shards, key=lambda shard: shard[2] - shard[1], reverse=True):
+        target = loads.index(min(loads))
+        batches[target].append(shard)
+        loads[target] += shard[2] - shard[1]
+    
+    def collect(results):
+        failed = {}
+        for _, _, batch_errors in results:
+            failed.update(batch_errors)
+        partials = [counts for counts, _, _ in results]
+        partials += [counts for _, split_counts, _ in results
+                     for file_path, counts in split_counts.items() if file_path not in failed]
+        return partials, failed
+    
+    if workers == 1:
+        partials, failed = collect([_count_shard_batch(batch) for batch in batches])
+        while len(partials) > 1:
+            partials = [_merge_counts(a, b) for a, b in zip(partials[0::2], partials[1::2])] + partials[len(partials) // 2 * 2:]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials, failed = collect(list(executor.map(_count_shard_batch, batches)))
+            while len(partials) > 1:
+                leftover = partials[len(partials) // 2 * 2:]
+                partials = list(executor.map(_merge_counts, partials[0::2], partials[1::2])) + leftover
+    
+    return (partials[0] if partials else Counter()), len(files) - len(failed), list(failed.values())
+
+class SpaceSavingCounter:
+    """
+    Approximate heavy-hitter counter with fixed memory (Space-Saving,
+    Metwally et al.). At most `capacity` words are tracked; a reported count
+    never underestimates and overestimates by at most total / capacity.
+    Pass epsilon instead of capacity to ask for that relative error bound.
+    """
+    
+    def __init__(self, capacity=None, epsilon=None):
+        if capacity is None:
+            capacity = math.ceil(1 / epsilon) if epsilon else 10000
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        self._heap = []
+    
+    def add(self, word, weight=1):
+        self.total += weight
+        if word in self.counts:
+            self.counts[word] += weight
+            return
+        
+        if len(self.counts) < self.capacity:
+            self.counts[word] = weight
+            self.errors[word] = 0
+            heapq.heappush(self._heap, (weight, word))
+            return
+        
+        # Heap entries go stale as counts grow; refresh them until the top
+        # entry is the real minimum, then hand its slot to the new word.
+        while True:
+            count, victim = self._heap[0]
+            if self.counts[victim] == count:
+                break
+            heapq.heapreplace(self._heap, (self.counts[victim], victim))
+        
+        del self.counts[victim]
+        del self.errors[victim]
+        self.counts[word] = count + weight
+        self.errors[word] = count
+        heapq.heapreplace(self._heap, (count + weight, word))
+    
+    def update(self, word_counts):
+        for word, count in word_counts.items():
+            self.add(word, count)
     
-    total_words = sum(word_counts.values())
-    unique_words = len(word_counts)
+    def __len__(self):
+        return len(self.counts)
     
-    print(f"\nTotal words: {total_words}")
-    print(f"Unique words: {unique_words}")
+    def items(self):
+        return self.counts.items()
+    
+    def most_common(self, n=None):
+        if n is None:
+            return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(n, self.counts.items(), key=lambda item: item[1])
+    
+    def max_error(self):
+        return max(self.errors.values(), default=0)
+
+def count_top_words_approx(file_path, capacity=None, epsilon=None, chunk_size=CHUNK_SIZE):
+    summary = SpaceSavingCounter(capacity, epsilon)
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for block in iter_text_blocks(file, chunk_size):
+                # Pre-aggregating each block in C keeps the Python-level
+                # work proportional to the block's vocabulary, not its tokens.
+                summary.update(Counter(WORD_PATTERN.findall(block)))
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return None
+    return summary
+
+def _count_file_for_index(file_path, chunk_size=CHUNK_SIZE):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file_path, count_words_streaming(file, chunk_size), None
+    except (OSError, UnicodeDecodeError) as e:
+        return file_path, None, str(e)
+
+class WordCountIndex:
+    """
+    Persistent word counts for a corpus, stored in SQLite.
+    
+    Words get integer ids in `vocab`; `file_counts` holds each file's counts
+    by id and `totals` the corpus-wide sums. A file is recounted only when
+    its (path, size, mtime) changes, and its old counts are subtracted from
+    the totals before the new ones are added, so a refresh costs time
+    proportional to what changed.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vocab (id INTEGER PRIMARY KEY, word TEXT NOT NULL UNIQUE);
+        CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE,
+                                          size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL);
+        CREATE TABLE IF NOT EXISTS file_counts (file_id INTEGER NOT NULL, word_id INTEGER NOT NULL,
+                                                count INTEGER NOT NULL, PRIMARY KEY (file_id, word_id))
+                                                WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS totals (word_id INTEGER PRIMARY KEY, count INTEGER NOT NULL);
+        CREATE INDEX IF NOT EXISTS totals_by_count ON totals (count DESC, word_id);
+    """
+    
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.conn = sqlite3.connect(index_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+    
+    def close(self):
+        self.conn.close()
+    
+    def _word_ids(self, words):
+        self.conn.executemany("INSERT OR IGNORE INTO vocab (word) VALUES (?)", ((word,) for word in words))
+        ids = {}
+        words = list(words)
+        for start in range(0, len(words), 500):
+            batch = words[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            ids.update((word, word_id) for word_id, word in
+                       self.conn.execute(f"SELECT id, word FROM vocab WHERE word IN ({placeholders})", batch))
+        return ids
+    
+    def _remove_file(self, file_id):
+        self.conn.execute("""
+            UPDATE totals SET count = count - (
+                SELECT fc.count FROM file_counts fc WHERE fc.file_id = ? AND fc.word_id = totals.word_id)
+            WHERE word_id IN (SELECT word_id FROM file_counts WHERE file_id = ?)
+        """, (file_id, file_id))
+        self.conn.execute("DELETE FROM totals WHERE count <= 0")
+        self.conn.execute("DELETE FROM file_counts WHERE file_id = ?", (file_id,))
+        self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+    
+    def _add_file(self, file_path, stat, word_counts):
+        cursor = self.conn.execute("INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+                                   (file_path, stat.st_size, stat.st_mtime_ns))
+        file_id = cursor.lastrowid
+        ids = self._word_ids(word_counts.keys())
+        rows = [(file_id, ids[word], count) for word, count in word_counts.items()]
+        self.conn.executemany("INSERT INTO file_counts (file_id, word_id, count) VALUES (?, ?, ?)", rows)
+        self.conn.executemany("""
+            INSERT INTO totals (word_id, count) VALUES (?, ?)
+            ON CONFLICT (word_id) DO UPDATE SET count = count + excluded.count
+        """, ((word_id, count) for _, word_id, count in rows))
+    
+    def refresh(self, paths, workers=None, prune=True):
+        """
+        Bring the index up to date with the files matched by paths. Files
+        that were indexed before but no longer exist are dropped when prune
+        is set. Returns (new_or_changed, removed, errors).
+        """
+        indexed = {path: (file_id, size, mtime_ns) for file_id, path, size, mtime_ns in
+                   self.conn.execute("SELECT id, path, size, mtime_ns FROM files")}
+        
+        seen = set()
+        changed = {}
+        own_files = {os.path.realpath(self.index_path + suffix) for suffix in ("", "-wal", "-shm", "-journal")}
+        for file_path in iter_corpus_files(paths):
+            file_path = os.path.realpath(file_path)
+            if file_path in own_files:
+                continue
+            stat = os.stat(file_path)
+            seen.add(file_path)
+            known = indexed.get(file_path)
+            if known is None or known[1:] != (stat.st_size, stat.st_mtime_ns):
+                changed[file_path] = stat
+        
+        removed = [path for path in indexed if path not in seen and not os.path.exists(path)] if prune else []
+        
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(changed) <= 1:
+            results = map(_count_file_for_index, changed)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(_count_file_for_index, changed, chunksize=16)
+        
+        errors = []
+        try:
+            with self.conn:
+                for path in removed:
+                    self._remove_file(indexed[path][0])
+                for file_path, word_counts, error in results:
+                    if file_path in indexed:
+                        self._remove_file(indexed[file_path][0])
+                    if error is not None:
+                        errors.append(f"{file_path}: {error}")
+                        continue
+                    self._add_file(file_path, changed[file_path], word_counts)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return len(changed) - len(errors), len(removed), errors
+    
+    def total_words(self):
+        return self.conn.execute("SELECT COALESCE(SUM(count), 0) FROM totals").fetchone()[0]
+    
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM totals").fetchone()[0]
+    
+    def query(self, sort_by='alphabetical', limit=None):
+        if sort_by == 'alphabetical':
+            order = "v.word"
+        else:
+            order = "t.count DESC, v.word"
+        return self.conn.execute(f"""
+            SELECT v.word, t.count FROM totals t JOIN vocab v ON v.id = t.word_id
+            ORDER BY {order} LIMIT ?
+        """, (limit or -1,)).fetchall()
+    
+    def word_counts(self):
+        return Counter(dict(self.query('alphabetical')))
+
+class NgramCounts:
+    """
+    Counts of token tuples packed into uint64 keys.
+    
+    Tokens are interned to integer ids and each tuple is packed into one
+    64-bit key (bits_per_token bits per position). Blocks of keys are
+    counted with np.unique and merged by sorting, so memory is two arrays
+    rather than a dict entry per tuple.
+    """
+    
+    def __init__(self, size, bits_per_token=None):
+        if np is None:
+            raise ImportError("NumPy is required for n-gram and co-occurrence counting")
+        self.size = size
+        self.bits = bits_per_token or 64 // size
+        self.vocab = {}
+        self.words = []
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self._pending = []
+        self._pending_len = 0
+    
+    def encode(self, words):
+        vocab = self.vocab
+        ids = np.fromiter((vocab.setdefault(word, len(vocab)) for word in words), dtype=np.uint64, count=len(words))
+        new = len(vocab) - len(self.words)
+        if new:
+            # The words just given ids are the last `new` keys of vocab;
+            # walk back over only those rather than copying the vocabulary.
+            self.words.extend(reversed(list(islice(reversed(vocab), new))))
+            if len(self.words) >= 1 << self.bits:
+                raise ValueError(f"Vocabulary exceeds {1 << self.bits} words for {self.size}-token keys")
+        return ids
+    
+    def pack(self, columns):
+        key = np.zeros(len(columns[0]), dtype=np.uint64)
+        for column in columns:
+            key = (key << np.uint64(self.bits)) | column
+        return key
+    
+    def add_keys(self, keys):
+        if len(keys) == 0:
+            return
+        unique, counts = np.unique(keys, return_counts=True)
+        self._pending.append((unique, counts))
+        self._pending_len += len(unique)
+        # Merge once the pending blocks outgrow the merged table, so each
+        # key is re-sorted O(log blocks) times overall.
+        if self._pending_len >= max(len(self.keys), 1 << 16):
+            self._merge()
+    
+    def _merge(self):
+        if not self._pending:
+            return
+        keys = np.concatenate([self.keys] + [unique for unique, _ in self._pending])
+        counts = np.concatenate([self.counts] + [counts for _, counts in self._pending])
+        order = np.argsort(keys, kind='stable')
+        keys, counts = keys[order], counts[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        self.keys = keys[starts]
+        self.counts = np.add.reduceat(counts, starts)
+        self._pending = []
+        self._pending_len = 0
+    
+    def decode(self, key):
+        key = int(key)
+        mask = (1 << self.bits) - 1
+        ids = [(key >> (self.bits * (self.size - 1 - i))) & mask for i in range(self.size)]
+        return " ".join(self.words[i] for i in ids)
+    
+    def __len__(self):
+        self._merge()
+        return len(self.keys)
+    
+    def values(self):
+        self._merge()
+        return self.counts.tolist()
+    
+    def items(self):
+        self._merge()
+        return ((self.decode(key), int(count)) for key, count in zip(self.keys, self.counts))
+    
+    def most_common(self, n=None):
+        self._merge()
+        if n is not None and n < len(self.counts):
+            top = np.argpartition(-self.counts, n)[:n]
+        else:
+            top = np.arange(len(self.counts))
+        top = top[np.lexsort((self.keys[top], -self.counts[top]))]
+        return [(self.decode(self.keys[i]), int(self.counts[i])) for i in top]
+
+def _iter_file_tokens(paths, chunk_size=CHUNK_SIZE):
+    """Yield (starts_new_file, words) blocks for every file matched by paths."""
+    for file_path in iter_corpus_files(paths):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                first = True
+                for block in iter_text_blocks(file, chunk_size):
+                    yield first, WORD_PATTERN.findall(block)
+                    first = False
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Skipped {file_path}: {e}")
+
+def count_ngrams(paths, n=2, chunk_size=CHUNK_SIZE):
+    """Count n-grams of consecutive words; n-grams never span two files."""
+    ngrams = NgramCounts(n)
+    carry = np.empty(0, dtype=np.uint64)
+    for new_file, words in _iter_file_tokens(paths, chunk_size):
+        ids = ngrams.encode(words)
+        tokens = ids if new_file else np.concatenate([carry, ids])
+        count = len(tokens) - n + 1
+        if count > 0:
+            ngrams.add_keys(ngrams.pack([tokens[i:i + count] for i in range(n)]))
+        carry = tokens[-(n - 1):] if n > 1 else tokens[:0]
+    return ngrams
+
+def count_cooccurrences(paths, window=5, chunk_size=CHUNK_SIZE):
+    """
+    Count unordered word pairs that occur within `window` positions of each
+    other. Pairs are stored as (smaller id, larger id).
+    """
+    pairs = NgramCounts(2)
+    carry = np.empty(0, dtype=np.uint64)
+    for new_file, words in _iter_file_tokens(paths, chunk_size):
+        ids = pairs.encode(words)
+        tokens = ids if new_file else np.concatenate([carry, ids])
+        first_new = len(tokens) - len(ids)
+        for distance in range(1, window + 1):
+            # Only pairs whose later token is in this block; earlier pairs
+            # were counted with the previous block.
+            start = max(first_new, distance)
+            if start >= len(tokens):
+                continue
+            left, right = tokens[start - distance:len(tokens) - distance], tokens[start:]
+            pairs.add_keys(pairs.pack([np.minimum(left, right), np.maximum(left, right)]))
+        carry = tokens[-window:]
+    return pairs
+
+def select_word_counts(word_counts, sort_by='alphabetical', limit=None):
+    if isinstance(word_counts, WordCountIndex):
+        return word_counts.query(sort_by, limit)
     
     if sort_by == 'alphabetical':
-        items = sorted(word_counts.items())
-    else: 
-        items = word_counts.most_common()
+        if limit:
+            return heapq.nsmallest(limit, word_counts.items())
+        return sorted(word_counts.items())
+    
+    return word_counts.most_common(limit or None)
+
+def display_word_counts(word_counts, sort_by='alphabetical', limit=None):
+    if not word_counts:
+        return
+    
+    if isinstance(word_counts, SpaceSavingCounter):
+        print(f"\nTotal words: {word_counts.total}")
+        print(f"Tracked words: {len(word_counts)} (approximate, counts may be high by up to {word_counts.max_error()})")
+    else:
+        if isinstance(word_counts, WordCountIndex):
+            total_words = word_counts.total_words()
+        else:
+            total_words = sum(word_counts.values())
+        unique_words = len(word_counts)
+        
+        print(f"\nTotal words: {total_words}")
+        print(f"Unique words: {unique_words}")
     
-    if limit:
-        items = items[:limit]
+    items = select_word_counts(word_counts, sort_by, limit)
     
-    max_word_length = max(len(word) for word, _ in items)
+    max_word_length = max((len(word) for word, _ in items), default=4)
     
     print("\nWord Occurrences:")
     print("-" * 40)
@@ -49,17 +613,53 @@ def display_word_counts(word_counts, sort_by='alphabetical', limit=None):
     for word, count in items:
         print(f"{word:<{max_word_length + 2}}{count}")
 
+def count_tuples(file_path, mode):
+    """Bigram, trigram or co-occurrence counts for main(); None after printing an error."""
+    if not os.path.exists(file_path) and not any(ch in file_path for ch in '*?['):
+        print(f"Error: File '{file_path}' not found.")
+        return None
+    try:
+        if mode in ['b', 'bigrams']:
+            return count_ngrams([file_path], 2)
+        if mode in ['t', 'trigrams']:
+            return count_ngrams([file_path], 3)
+        return count_cooccurrences([file_path])
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+
 def main():
     print(" Text File Word Counter ")
     
     while True:
-        file_path = input("\nEnter the path to a text file (or 'exit' to quit): ")
+        file_path = input("\nEnter the path to a text file, directory or glob (or 'exit' to quit): ")
         
         if file_path.lower() == 'exit':
             print("Exiting program. Goodbye!")
             break
         
-        word_counts = count_words_in_file(file_path)
+        mode = 'w'
+        if np is not None:
+            mode = input("Count (w)ords, (b)igrams, (t)rigrams or (c)o-occurring pairs? [w/b/t/c]: ").lower()
+        
+        if mode in ['b', 'bigrams', 't', 'trigrams', 'c', 'co-occurrence']:
+            word_counts = count_tuples(file_path, mode)
+        elif os.path.isdir(file_path) or any(ch in file_path for ch in '*?['):
+            index_path = input("Index file to reuse between runs (press Enter to count from scratch): ").strip()
+            if index_path:
+                word_counts = WordCountIndex(index_path)
+                updated, removed, errors = word_counts.refresh([file_path])
+                print(f"Index refreshed: {updated} files counted, {removed} removed.")
+            else:
+                word_counts, file_count, errors = count_words_in_corpus([file_path])
+                print(f"Counted words in {file_count} files.")
+            for error in errors:
+                print(f"Skipped {error}")
+        elif os.path.isfile(file_path) and os.path.getsize(file_path) > STREAMING_THRESHOLD and \
+                input("\nLarge file. Keep only an approximate top-k in bounded memory? [y/n]: ").lower() in ['y', 'yes']:
+            word_counts = count_top_words_approx(file_path)
+        else:
+            word_counts = count_words_in_file(file_path)
         
         if word_counts:
             while True:
@@ -77,6 +677,8 @@ def main():
             try:
                 limit_input = input("\nLimit results? Enter a number or press Enter for all: ")
                 limit = int(limit_input) if limit_input.strip() else None
+                if limit is not None and limit <= 0:
+                    raise ValueError(limit_input)
             except ValueError:
                 print("Invalid input. Showing all results.")
                 limit = None
@@ -88,20 +690,21 @@ def main():
                 output_file = input("Enter output file name: ")
                 try:
                     with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(f"Total words: {sum(word_counts.values())}\n")
-                        f.write(f"Unique words: {len(word_counts)}\n\n")
+                        if isinstance(word_counts, SpaceSavingCounter):
+                            f.write(f"Total words: {word_counts.total}\n")
+                            f.write(f"Tracked words: {len(word_counts)} (approximate)\n\n")
+                        elif isinstance(word_counts, WordCountIndex):
+                            f.write(f"Total words: {word_counts.total_words()}\n")
+                            f.write(f"Unique words: {len(word_counts)}\n\n")
+                        else:
+                            f.write(f"Total words: {sum(word_counts.values())}\n")
+                            f.write(f"Unique words: {len(word_counts)}\n\n")
                         f.write("Word Occurrences:\n")
                         f.write("-" * 40 + "\n")
                         
-                        if sort_by == 'alphabetical':
-                            items = sorted(word_counts.items())
-                        else:
-                            items = word_counts.most_common()
-                        
-                        if limit:
-                            items = items[:limit]
+                        items = select_word_counts(word_counts, sort_by, limit)
                         
-                        max_word_length = max(len(word) for word, _ in items)
+                        max_word_length = max((len(word) for word, _ in items), default=4)
                         f.write(f"{'Word':<{max_word_length + 2}}Count\n")
                         f.write("-" * 40 + "\n")
                         
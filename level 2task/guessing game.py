@@ -1,7 +1,39 @@
-import numpy as np
+import os
+import sys
+import math
+import time
+import random
+import signal
+import asyncio
+import argparse
+import importlib.util
+
+try:
+    import resource
+except ImportError:  # not available on Windows; the descriptor limit is left alone there
+    resource = None
+
+DEFAULT_LOW = 1
+DEFAULT_HIGH = 100
+DEFAULT_PORT = 8765
+IDLE_TIMEOUT = 300.0
+MAX_LINE = 256
+
+def _load_number_guesser():
+    """The number guesser script beside this one; its check_guess is the one rule both games play by."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'number guesser.py')
+    spec = importlib.util.spec_from_file_location('number_guesser', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+_number_guesser = _load_number_guesser()
+check_guess = _number_guesser.check_guess
+TOO_LOW, CORRECT, TOO_HIGH, OUT_OF_RANGE = (_number_guesser.TOO_LOW, _number_guesser.CORRECT,
+                                           _number_guesser.TOO_HIGH, _number_guesser.OUT_OF_RANGE)
 
 def play_guessing_game():
-    secret_number = np.int(1, 100)
+    secret_number = random.randint(DEFAULT_LOW, DEFAULT_HIGH)
     attempts = 0
     
     while True:
@@ -9,24 +41,337 @@ def play_guessing_game():
             guess = int(input("Enter your guess: "))
             attempts += 1
             
-           
-            if guess < secret_number:
+            # This game has always judged any number, so the range is unbounded.
+            result = check_guess(guess, secret_number, -math.inf, math.inf)
+            if result == TOO_LOW:
                 print("Too low!")
-            elif guess > secret_number:
+            elif result == TOO_HIGH:
                 print("Too high!")
             else:
                 print(f"Congratulations! You guessed the number {secret_number} correctly!")
                 print(f"It took you {attempts} attempts.")
                 break
-                
+        
         except ValueError:
             print("Please enter a valid number.")
 
+class GameSession:
+    """One connected player: the current range, secret and attempt count."""
+    __slots__ = ('session_id', 'writer', 'min_num', 'max_num', 'secret_number', 'attempts', 'last_active')
+    
+    def __init__(self, session_id, writer, min_num, max_num, now):
+        self.session_id = session_id
+        self.writer = writer
+        self.last_active = now
+        self.new_game(min_num, max_num)
+    
+    def new_game(self, min_num, max_num):
+        self.min_num = min_num
+        self.max_num = max_num
+        self.secret_number = random.randint(min_num, max_num)
+        self.attempts = 0
+    
+    def guess(self, guess):
+        if self.secret_number is None:
+            return "ERR No game in progress. Send NEW to play again."
+        # As in number_guesser, a guess outside the range still counts as an attempt.
+        self.attempts += 1
+        result = check_guess(guess, self.secret_number, self.min_num, self.max_num)
+        if result == OUT_OF_RANGE:
+            return (f"OUT {self.min_num} {self.max_num} Your guess is outside the range "
+                    f"({self.min_num}-{self.max_num}). Please try again.")
+        if result == TOO_LOW:
+            return "LOW Too low! Try a higher number."
+        if result == TOO_HIGH:
+            return "HIGH Too high! Try a lower number."
+        secret_number, self.secret_number = self.secret_number, None
+        return (f"CORRECT {self.attempts} Congratulations! You guessed the number {secret_number} correctly! "
+                f"It took you {self.attempts} attempts.")
 
-if __name__ == "__main__":
-    play_guessing_game()
+class GuessingGameServer:
+    """
+    Line-based TCP game server. Every connection is a session: the server
+    greets it with "READY <min> <max>", then answers each line:
+        
+        <number>        LOW / HIGH / OUT <min> <max> / CORRECT <attempts>
+        NEW [min max]   start another game, optionally on a new range
+        STATS           server counters
+        QUIT            BYE
+    
+    The first word of every reply is the machine-readable part; the rest
+    is the same text the interactive games print. Sessions idle for longer
+    than idle_timeout seconds are closed by one periodic sweep.
+    """
+    
+    def __init__(self, min_num=DEFAULT_LOW, max_num=DEFAULT_HIGH, idle_timeout=IDLE_TIMEOUT, max_sessions=None):
+        self.min_num = min_num
+        self.max_num = max_num
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self.next_id = 1
+        self.counters = {'sessions': 0, 'games_won': 0, 'guesses': 0, 'evicted': 0, 'rejected': 0}
+    
+    def stats(self):
+        return dict(self.counters, active=len(self.sessions))
+    
+    def respond(self, session, line):
+        words = line.split()
+        if not words:
+            return "ERR Please enter a valid number."
+        command = words[0].upper()
+        if command == 'QUIT':
+            return "BYE Thanks for playing! Goodbye!"
+        if command == 'STATS':
+            return "STATS " + " ".join(f"{name}={value}" for name, value in self.stats().items())
+        if command == 'NEW':
+            min_num, max_num = self.min_num, self.max_num
+            if len(words) == 3:
+                try:
+                    min_num, max_num = int(words[1]), int(words[2])
+                except ValueError:
+                    return "ERR Please enter valid numbers."
+                if min_num >= max_num:
+                    return "ERR Maximum number must be greater than minimum number."
+            elif len(words) != 1:
+                return "ERR Usage: NEW [min max]"
+            session.new_game(min_num, max_num)
+            return f"READY {min_num} {max_num} I'm thinking of a number between {min_num} and {max_num}."
+        try:
+            guess = int(words[0])
+        except ValueError:
+            return "ERR Please enter a valid number."
+        self.counters['guesses'] += 1
+        reply = session.guess(guess)
+        if reply.startswith('CORRECT'):
+            self.counters['games_won'] += 1
+        return reply
+    
+    async def handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        if self.max_sessions and len(self.sessions) >= self.max_sessions:
+            self.counters['rejected'] += 1
+            writer.write(b"BUSY Too many players, try again later.\n")
+            writer.close()
+            return
+        
+        session = GameSession(self.next_id, writer, self.min_num, self.max_num, loop.time())
+        self.next_id += 1
+        self.sessions[session.session_id] = session
+        self.counters['sessions'] += 1
+        writer.write(f"READY {session.min_num} {session.max_num} I'm thinking of a number between "
+                     f"{session.min_num} and {session.max_num}.\n".encode())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                session.last_active = loop.time()
+                reply = self.respond(session, line.decode('utf-8', 'replace'))
+                writer.write(reply.encode() + b'\n')
+                if reply.startswith('BYE'):
+                    break
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # ValueError: a line longer than MAX_LINE.
+            pass
+        finally:
+            self.sessions.pop(session.session_id, None)
+            writer.close()
+    
+    async def evict_idle(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(min(self.idle_timeout / 4, 30))
+            cutoff = loop.time() - self.idle_timeout
+            for session in [s for s in self.sessions.values() if s.last_active < cutoff]:
+                self.sessions.pop(session.session_id, None)
+                self.counters['evicted'] += 1
+                session.writer.write(b"BYE Session closed after being idle.\n")
+                session.writer.close()
+    
+    async def serve(self, host='127.0.0.1', port=DEFAULT_PORT, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE, backlog=4096)
+        sweeper = asyncio.create_task(self.evict_idle())
+        if ready is not None:
+            ready(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+def raise_open_file_limit():
+    """
+    Lift the soft descriptor limit to the hard limit (65536 when that is
+    unlimited) so thousands of sockets can be open. A soft limit that is
+    already higher, or unlimited, is left alone.
+    """
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = 65536 if hard == resource.RLIM_INFINITY else hard
+    if soft != resource.RLIM_INFINITY and soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+
+def percentiles(samples, points=(50, 90, 99)):
+    """Nearest-rank percentiles of a list of latencies, plus the maximum."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    report = {f"p{point}": ordered[max(0, -(-point * len(ordered) // 100) - 1)] for point in points}
+    report["max"] = ordered[-1]
+    return report
+
+async def _play_session(host, port, latencies, think):
+    """Connect, win one game by binary search, quit. Returns the number of guesses."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        greeting = (await reader.readline()).split()
+        if not greeting or greeting[0] != b'READY':
+            raise ConnectionError((b" ".join(greeting) or b"connection closed").decode())
+        low, high = int(greeting[1]), int(greeting[2])
+        guesses = 0
+        while True:
+            if think:
+                await asyncio.sleep(random.uniform(0, 2 * think))
+            guess = (low + high) // 2
+            start = time.perf_counter()
+            writer.write(b"%d\n" % guess)
+            reply = await reader.readline()
+            latencies.append((time.perf_counter() - start) * 1000)
+            guesses += 1
+            token = reply.split(None, 1)[0] if reply else b''
+            if token == b'LOW':
+                low = guess + 1
+            elif token == b'HIGH':
+                high = guess - 1
+            elif token == b'CORRECT':
+                break
+            else:
+                raise ConnectionError(f"unexpected reply {reply!r}")
+        writer.write(b"QUIT\n")
+        await reader.readline()
+        return guesses
+    finally:
+        writer.close()
+
+async def load_test(host='127.0.0.1', port=DEFAULT_PORT, sessions=1000, concurrency=100, think=0.0):
+    """
+    Play sessions complete games against a running server with up to
+    concurrency players connected at once, each pausing about think
+    seconds between guesses. Returns sessions/s, guesses/s and
+    per-guess round-trip latency percentiles in milliseconds.
+    """
+    latencies = []
+    remaining = [sessions]
+    totals = {'sessions': 0, 'guesses': 0, 'errors': 0}
+    
+    async def player():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            try:
+                guesses = await _play_session(host, port, latencies, think)
+                totals['guesses'] += guesses
+                totals['sessions'] += 1
+            except (OSError, ValueError, IndexError):
+                totals['errors'] += 1
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(player() for _ in range(min(concurrency, sessions))))
+    elapsed = time.perf_counter() - start
+    return dict(totals, seconds=elapsed, sessions_per_second=totals['sessions'] / elapsed,
+                guesses_per_second=totals['guesses'] / elapsed, latency_ms=percentiles(latencies))
+
+def run_server(args):
+    raise_open_file_limit()
+    server = GuessingGameServer(args.min, args.max, args.idle_timeout, args.max_sessions)
     
+    async def serve():
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        if hasattr(signal, 'SIGTERM'):
+            try:
+                loop.add_signal_handler(signal.SIGTERM, task.cancel)
+            except NotImplementedError:
+                pass
+        try:
+            await server.serve(args.host, args.port, ready=lambda _: print(
+                f"Serving guessing games on {args.host}:{args.port} "
+                f"(idle timeout {args.idle_timeout:g}s). Press Ctrl+C to stop.", flush=True))
+        except asyncio.CancelledError:
+            pass
+    
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    print("\nServer stopped. " + ", ".join(f"{name}={value}" for name, value in server.stats().items()))
+    return 0
+
+def run_load_test(args):
+    raise_open_file_limit()
+    report = asyncio.run(load_test(args.host, args.port, args.sessions, args.concurrency, args.think / 1000))
+    print(f"{report['sessions']} sessions ({report['errors']} failed), {report['guesses']} guesses "
+          f"in {report['seconds']:.2f}s")
+    print(f"{report['sessions_per_second']:,.0f} sessions/s, {report['guesses_per_second']:,.0f} guesses/s")
+    print("Guess latency ms: " + ", ".join(f"{name}={value:.2f}" for name, value in report['latency_ms'].items()))
+    return 0 if report['sessions'] else 1
 
+def main():
+    parser = argparse.ArgumentParser(description='Guess the number, alone or on a multiplayer server.')
+    
+    parser.add_argument('--serve', action='store_true',
+                        help='Host concurrent game sessions over a line-based TCP protocol')
+    
+    parser.add_argument('--load-test', action='store_true',
+                        help='Play many sessions against a running server and report throughput and latency')
+    
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='Address to serve on or connect to (default: 127.0.0.1)')
+    
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'TCP port (default: {DEFAULT_PORT})')
+    
+    parser.add_argument('--min', type=int, default=DEFAULT_LOW,
+                        help=f'Default range minimum for server games (default: {DEFAULT_LOW})')
+    
+    parser.add_argument('--max', type=int, default=DEFAULT_HIGH,
+                        help=f'Default range maximum for server games (default: {DEFAULT_HIGH})')
+    
+    parser.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT,
+                        help=f'Close sessions idle for this many seconds (default: {IDLE_TIMEOUT:g})')
+    
+    parser.add_argument('--max-sessions', type=int,
+                        help='Refuse new players beyond this many concurrent sessions')
+    
+    parser.add_argument('--sessions', type=int, default=1000,
+                        help='Games to play in the load test (default: 1000)')
+    
+    parser.add_argument('--concurrency', type=int, default=100,
+                        help='Players connected at once in the load test (default: 100)')
+    
+    parser.add_argument('--think', type=float, default=0.0,
+                        help='Average pause between a load-test player\'s guesses, in ms (default: 0)')
+    
+    args = parser.parse_args()
+    
+    if args.min >= args.max:
+        parser.error('--max must be greater than --min')
+    if args.serve:
+        return run_server(args)
+    if args.load_test:
+        return run_load_test(args)
+    
+    play_guessing_game()
+    
+    
     while True:
         play_again = input("Do you want to play again? (yes/no): ").lower()
         if play_again in ["yes", "y"]:
@@ -35,4 +380,8 @@ if __name__ == "__main__":
             print("Thanks for playing! Goodbye!")
             break
         else:
-            print("Please enter 'yes' or 'no'.")
\ No newline at end of file
+            print("Please enter 'yes' or 'no'.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,4 +1,35 @@
+import os
+import sys
+import csv
+import time
 import random
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # the game itself needs only the standard library; the simulator needs NumPy
+    np = None
+
+TOO_LOW = -1
+CORRECT = 0
+TOO_HIGH = 1
+OUT_OF_RANGE = 2
+
+STRATEGIES = ('binary', 'random', 'biased')
+BIAS = 0.25
+CHUNK_GAMES = 1_000_000
+
+def check_guess(guess, secret_number, min_num, max_num):
+    """
+    TOO_LOW, TOO_HIGH, CORRECT or OUT_OF_RANGE for a guess. Written with
+    comparisons and arithmetic only, so it works on ints and elementwise
+    on NumPy arrays: the simulator plays by exactly the game's rules.
+    """
+    outside = (guess < min_num) | (guess > max_num)
+    result = (guess > secret_number) * TOO_HIGH + (guess < secret_number) * TOO_LOW
+    return result + outside * (OUT_OF_RANGE - result)
 
 def number_guesser():
     print(" Number Guesser Game ")
@@ -23,33 +54,250 @@ def number_guesser():
     
     while True:
         try:
-           
+            
             guess = int(input("\nEnter your guess: "))
             attempts += 1
             
-          
-            if guess < min_num or guess > max_num:
+            result = check_guess(guess, secret_number, min_num, max_num)
+            if result == OUT_OF_RANGE:
                 print(f"Your guess is outside the range ({min_num}-{max_num}). Please try again.")
                 continue
             
             
-            if guess < secret_number:
+            if result == TOO_LOW:
                 print("Too low! Try a higher number.")
-            elif guess > secret_number:
+            elif result == TOO_HIGH:
                 print("Too high! Try a lower number.")
             else:
                 print(f"\nCongratulations! You've guessed the number {secret_number} correctly!")
                 print(f"It took you {attempts} attempts.")
                 break
-                
+        
         except ValueError:
             print("Please enter a valid number.")
 
+def play_game(strategy, min_num, max_num, secret_number, rng=random, bias=BIAS):
+    """Play one game guess by guess, as a player would; returns the number of attempts."""
+    if not 0 <= bias <= 1:
+        raise ValueError("bias must be between 0 and 1")
+    low, high = min_num, max_num
+    attempts = 0
+    while True:
+        if strategy == 'binary':
+            guess = (low + high) // 2
+        elif strategy == 'random':
+            guess = rng.randint(low, high)
+        else:
+            guess = low + int((high - low) * bias)
+        attempts += 1
+        result = check_guess(guess, secret_number, min_num, max_num)
+        if result == CORRECT:
+            return attempts
+        if result == TOO_LOW:
+            low = guess + 1
+        elif result == TOO_HIGH:
+            high = guess - 1
 
-if __name__ == "__main__":
+def _next_guesses(strategy, low, high, rng, bias):
+    if strategy == 'binary':
+        return (low + high) // 2
+    if strategy == 'random':
+        return rng.integers(low, high, endpoint=True)
+    return low + ((high - low) * bias).astype(np.int64)
+
+def _simulate_chunk(strategy, min_num, max_num, games, seed, bias):
+    """
+    Play games at once: each round makes one guess in every unfinished
+    game, judges them all with check_guess, narrows each game's known
+    range and drops the games that were won. Returns a histogram of
+    attempts (index = attempts, value = games).
+    """
+    rng = np.random.default_rng(seed)
+    secrets = rng.integers(min_num, max_num, games, endpoint=True)
+    low = np.full(games, min_num, dtype=np.int64)
+    high = np.full(games, max_num, dtype=np.int64)
+    index = np.arange(games)
+    attempts = np.zeros(games, dtype=np.int64)
+    
+    attempt = 0
+    while len(index):
+        attempt += 1
+        guesses = _next_guesses(strategy, low, high, rng, bias)
+        results = check_guess(guesses, secrets, min_num, max_num)
+        won = results == CORRECT
+        attempts[index[won]] = attempt
+        playing = ~won
+        low = np.where(results == TOO_LOW, guesses + 1, low)[playing]
+        high = np.where(results == TOO_HIGH, guesses - 1, high)[playing]
+        secrets = secrets[playing]
+        index = index[playing]
+    return np.bincount(attempts)
+
+def _add_histograms(total, histogram):
+    if len(histogram) > len(total):
+        histogram, total = total, histogram
+    total = total.copy()
+    total[:len(histogram)] += histogram
+    return total
+
+def simulate(strategy, min_num, max_num, games, workers=None, chunk_size=CHUNK_GAMES, seed=None, bias=BIAS):
+    """
+    Histogram of attempts over games games of strategy on min_num..max_num.
+    Games are split into chunks of chunk_size, each vectorized across its
+    games with an independent random stream, and chunks run in a process
+    pool with a bounded number in flight.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the strategy simulator")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {', '.join(STRATEGIES)}")
+    if min_num >= max_num:
+        raise ValueError("Maximum number must be greater than minimum number.")
+    if games < 1:
+        raise ValueError("games must be at least 1")
+    if not 0 <= bias <= 1:
+        # Outside 0-1 the biased guess leaves the remaining range and the
+        # game never ends.
+        raise ValueError("bias must be between 0 and 1")
+    workers = workers or os.cpu_count() or 1
+    sizes = [min(chunk_size, games - start) for start in range(0, games, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(strategy, min_num, max_num, size, chunk_seed, bias) for size, chunk_seed in zip(sizes, seeds)]
+    
+    total = np.zeros(1, dtype=np.int64)
+    if workers == 1 or len(jobs) == 1:
+        for job in jobs:
+            total = _add_histograms(total, _simulate_chunk(*job))
+        return total
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for job in jobs:
+            pending.append(executor.submit(_simulate_chunk, *job))
+            if len(pending) >= workers * 2:
+                total = _add_histograms(total, pending.popleft().result())
+        while pending:
+            total = _add_histograms(total, pending.popleft().result())
+    return total
+
+def summarize(histogram):
+    """Mean, standard deviation, median, 99th percentile and maximum attempts of a histogram."""
+    attempts = np.arange(len(histogram))
+    games = histogram.sum()
+    mean = (attempts * histogram).sum() / games
+    std = np.sqrt(((attempts - mean) ** 2 * histogram).sum() / games)
+    cumulative = np.cumsum(histogram)
+    return {
+        'games': int(games),
+        'mean': float(mean),
+        'std': float(std),
+        'p50': int(np.searchsorted(cumulative, games * 0.5)),
+        'p99': int(np.searchsorted(cumulative, games * 0.99)),
+        'max': int(np.flatnonzero(histogram)[-1]),
+    }
+
+def benchmark(games=100_000, max_num=1000, seed=0):
+    """Games per second of play_game in a loop against one vectorized chunk, per strategy."""
+    rows = []
+    for strategy in STRATEGIES:
+        rng = random.Random(seed)
+        secrets = [rng.randint(1, max_num) for _ in range(games)]
+        start = time.perf_counter()
+        for secret_number in secrets:
+            play_game(strategy, 1, max_num, secret_number, rng)
+        loop_rate = games / (time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        simulate(strategy, 1, max_num, games * 10, workers=1, seed=seed)
+        rows.append((strategy, loop_rate, games * 10 / (time.perf_counter() - start)))
+    return rows
+
+def run_simulation(args):
+    try:
+        results = []
+        for max_num in args.ranges:
+            for strategy in args.strategies:
+                start = time.perf_counter()
+                histogram = simulate(strategy, 1, max_num, args.games, args.workers, seed=args.seed, bias=args.bias)
+                results.append((strategy, max_num, histogram, time.perf_counter() - start))
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    
+    print(f"{'strategy':<10}{'range':>12}{'games':>12}{'mean':>8}{'std':>7}{'p50':>5}{'p99':>5}{'max':>5}{'games/s':>14}")
+    for strategy, max_num, histogram, seconds in results:
+        stats = summarize(histogram)
+        print(f"{strategy:<10}{f'1-{max_num}':>12}{stats['games']:>12}{stats['mean']:>8.3f}{stats['std']:>7.3f}"
+              f"{stats['p50']:>5}{stats['p99']:>5}{stats['max']:>5}{stats['games'] / seconds:>14,.0f}")
+        if args.histogram:
+            for attempts in np.flatnonzero(histogram):
+                print(f"    {attempts:>4} attempts: {histogram[attempts]:>10} ({histogram[attempts] / stats['games']:.2%})")
+    
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["strategy", "min", "max", "attempts", "games"])
+            for strategy, max_num, histogram, _ in results:
+                writer.writerows((strategy, 1, max_num, int(attempts), int(histogram[attempts]))
+                                 for attempts in np.flatnonzero(histogram))
+        print(f"Distributions written to {args.output}")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Play the number guesser, or simulate guessing strategies.')
+    
+    parser.add_argument('--simulate', action='store_true',
+                        help='Simulate many games per strategy and report the distribution of attempts')
+    
+    parser.add_argument('--strategies', type=lambda value: value.split(','), default=list(STRATEGIES),
+                        help=f'Comma-separated strategies to simulate (default: {",".join(STRATEGIES)})')
+    
+    parser.add_argument('--ranges', type=lambda value: [int(n) for n in value.split(',')], default=[100, 1000, 1000000],
+                        help='Comma-separated range sizes N, each simulated on 1..N (default: 100,1000,1000000)')
+    
+    parser.add_argument('--games', type=int, default=1_000_000,
+                        help='Games per strategy and range (default: 1000000)')
+    
+    parser.add_argument('--bias', type=float, default=BIAS,
+                        help=f'Where the biased strategy guesses within the remaining range, 0-1 (default: {BIAS})')
+    
+    parser.add_argument('--seed', type=int,
+                        help='Random seed for reproducible simulations')
+    
+    parser.add_argument('--histogram', action='store_true',
+                        help='Also print the full distribution of attempts')
+    
+    parser.add_argument('-o', '--output',
+                        help='CSV file for the distributions (strategy, min, max, attempts, games)')
+    
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Worker processes (default: CPU count)')
+    
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare a per-game Python loop with the vectorized simulator')
+    
+    args = parser.parse_args()
+    
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if not 0 <= args.bias <= 1:
+        parser.error("--bias must be between 0 and 1")
+    
+    if args.benchmark:
+        if np is None:
+            print("Error: NumPy is required for the strategy simulator")
+            return 1
+        print(f"{'strategy':<10}{'loop games/s':>14}{'vectorized games/s':>20}")
+        for strategy, loop_rate, vector_rate in benchmark():
+            print(f"{strategy:<10}{loop_rate:>14,.0f}{vector_rate:>20,.0f}")
+        return 0
+    
+    if args.simulate:
+        return run_simulation(args)
+    
     number_guesser()
     
-   
+    
     while True:
         play_again = input("\nDo you want to play again? (yes/no): ").lower()
         if play_again in ["yes", "y"]:
@@ -58,4 +306,8 @@ if __name__ == "__main__":
             print("Thanks for playing! Goodbye!")
             break
         else:
-            print("Please enter 'yes' or 'no'.")
\ No newline at end of file
+            print("Please enter 'yes' or 'no'.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,80 +1,1168 @@
 import re
+import os
+import sys
+import csv
+import json
+import time
+import stat
+import signal
+import socket
+import threading
+import http.client
+import socketserver
+import mmap
+import heapq
+import random
+import string
+import struct
+import hashlib
+import argparse
+import tempfile
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import product
+from math import comb, factorial, log10
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ProcessPoolExecutor
 
-def check_password_strength(password):
-    score = 0
-    feedback = []
-    details = {
-        "length": False,
-        "uppercase": False,
-        "lowercase": False,
-        "digits": False,
-        "special_chars": False,
-        "no_common_patterns": True
-    }
-    if len(password) >= 8:
-        score += 1
-        details["length"] = True
-    else:
-        feedback.append("Password should be at least 8 characters long")
+UPPERCASE = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+LOWERCASE = frozenset('abcdefghijklmnopqrstuvwxyz')
+SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{};:\'",.<>/?\\|')
+
+COMMON_PATTERNS = [
+    '123', 'abc', 'qwerty', 'password', 'admin', 
+    'welcome', 'letmein', 'iloveyou', '1234'
+]
+COMMON_PATTERN_RE = re.compile('|'.join(map(re.escape, COMMON_PATTERNS)), re.IGNORECASE)
+
+STRENGTH_LEVELS = {
+    0: "Very Weak",
+    1: "Weak",
+    2: "Fair",
+    3: "Moderate",
+    4: "Strong",
+    5: "Very Strong"
+}
+
+AUDIT_BATCH_SIZE = 20000
+
+SERVER_LATENCY_WINDOW = 10000
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+BREACH_INDEX_MAGIC = b'PWHASH01'
+BREACH_HEADER = struct.Struct('>8sQ')
+FANOUT = struct.Struct('>65537Q')
+KEY_BYTES = 8
+BREACH_RUN_SIZE = 2_000_000
+HEX_HASH_RE = re.compile(r'([0-9A-Fa-f]{40})(?::\d+)?')
+
+def breach_key(password):
+    """First 8 bytes of the SHA-1 of the password, the unit stored in the index."""
+    return hashlib.sha1(password.encode('utf-8', 'surrogateescape')).digest()[:KEY_BYTES]
+
+class BreachedPasswordIndex:
+    """
+    Read-only lookup into a breached-password index built by
+    build_breach_index. The file is memory-mapped, so opening it is instant
+    and each lookup touches the fan-out entry for the key's first two bytes
+    plus a binary search within that bucket, a handful of pages in total.
+    Keys are 64-bit SHA-1 prefixes, so false positives are negligible even
+    for billions of entries.
+    """
     
-    if re.search(r'[A-Z]', password):
-        score += 1
-        details["uppercase"] = True
-    else:
-        feedback.append("Include at least one uppercase letter")
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data_offset = BREACH_HEADER.size + FANOUT.size
+        magic, self.count = BREACH_HEADER.unpack_from(self.mm, 0) if len(self.mm) >= self.data_offset else (b'', 0)
+        if magic != BREACH_INDEX_MAGIC or len(self.mm) != self.data_offset + self.count * KEY_BYTES:
+            self.mm.close()
+            raise ValueError(f"{path} is not a breached-password index")
     
-    if re.search(r'[a-z]', password):
-        score += 1
-        details["lowercase"] = True
-    else:
-        feedback.append("Include at least one lowercase letter")
+    def _bucket(self, bucket):
+        return struct.unpack_from('>2Q', self.mm, BREACH_HEADER.size + bucket * 8)
     
-    if re.search(r'\d', password):
-        score += 1
-        details["digits"] = True
-    else:
-        feedback.append("Include at least one number")
+    def contains_key(self, key):
+        lo, hi = self._bucket(int.from_bytes(key[:2], 'big'))
+        mm, base = self.mm, self.data_offset
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = base + mid * KEY_BYTES
+            probe = mm[offset:offset + KEY_BYTES]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return True
+        return False
     
-    if re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>/?\\|]', password):
-        score += 1
-        details["special_chars"] = True
-    else:
-        feedback.append("Include at least one special character (!@#$%^&*()_+-=[]{}:;\"'<>,.?/|\\)")
+    def __contains__(self, password):
+        return self.contains_key(breach_key(password))
+    
+    def __len__(self):
+        return self.count
+    
+    def close(self):
+        self.mm.close()
     
-    common_patterns = [
-        r'123', r'abc', r'qwerty', r'password', r'admin', 
-        r'welcome', r'letmein', r'iloveyou', r'1234'
-    ]
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+@lru_cache(maxsize=None)
+def open_breach_index(path):
+    return BreachedPasswordIndex(path)
+
+def _iter_breach_keys(list_path):
+    """Keys from a list of plaintext passwords or SHA-1 hex hashes (HASH or HASH:count)."""
+    with open(list_path, 'r', encoding='utf-8', errors='surrogateescape', newline='') as f:
+        for line in f:
+            entry = line.rstrip('\r\n')
+            if not entry:
+                continue
+            match = HEX_HASH_RE.fullmatch(entry)
+            if match:
+                yield bytes.fromhex(match.group(1)[:KEY_BYTES * 2])
+            else:
+                yield breach_key(entry)
+
+def _iter_run(path, block_keys=65536):
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(KEY_BYTES * block_keys)
+            if not block:
+                break
+            for i in range(0, len(block), KEY_BYTES):
+                yield block[i:i + KEY_BYTES]
+
+def _write_run(keys, directory):
+    fd, path = tempfile.mkstemp(dir=directory, suffix='.run')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b''.join(keys))
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+def build_breach_index(list_paths, index_path, run_size=BREACH_RUN_SIZE):
+    """
+    Build a sorted, de-duplicated hash file from one or more breach lists.
+    Lists larger than run_size entries are sorted in runs on disk and
+    merged, so memory stays bounded however large the input is.
+    Returns the number of distinct keys written.
+    """
+    directory = os.path.dirname(os.path.abspath(index_path))
+    runs = []
+    temp_path = None
+    try:
+        keys = []
+        for list_path in list_paths:
+            for key in _iter_breach_keys(list_path):
+                keys.append(key)
+                if len(keys) >= run_size:
+                    runs.append(_write_run(sorted(keys), directory))
+                    keys = []
+        keys.sort()
+        if runs:
+            if keys:
+                runs.append(_write_run(keys, directory))
+            merged = heapq.merge(*(_iter_run(run) for run in runs))
+        else:
+            merged = iter(keys)
+        
+        fanout = [0] * 65537
+        count = 0
+        previous = None
+        temp_fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(temp_fd, 'wb') as out:
+            out.seek(BREACH_HEADER.size + FANOUT.size)
+            buffer = []
+            for key in merged:
+                if key == previous:
+                    continue
+                previous = key
+                fanout[int.from_bytes(key[:2], 'big') + 1] += 1
+                buffer.append(key)
+                count += 1
+                if len(buffer) >= 65536:
+                    out.write(b''.join(buffer))
+                    buffer = []
+            out.write(b''.join(buffer))
+            
+            for bucket in range(1, 65537):
+                fanout[bucket] += fanout[bucket - 1]
+            out.seek(0)
+            out.write(BREACH_HEADER.pack(BREACH_INDEX_MAGIC, count))
+            out.write(FANOUT.pack(*fanout))
+        os.replace(temp_path, index_path)
+        temp_path = None
+        open_breach_index.cache_clear()
+        return count
+    finally:
+        for run in runs:
+            os.remove(run)
+        if temp_path is not None:
+            os.remove(temp_path)
+
+# Ranked word lists for the guess estimator, most common first. Splitting
+# them at import is cheap; merging them (and any EXTRA_DICTIONARIES) into a
+# RankedDictionary happens on first use, in ranked_dictionary().
+COMMON_PASSWORDS = """
+123456 password 12345678 qwerty 123456789 12345 1234 111111 1234567 dragon
+123123 baseball abc123 football monkey letmein 696969 shadow master 666666
+qwertyuiop 123321 mustang 1234567890 michael 654321 superman 1qaz2wsx 7777777 121212
+000000 qazwsx 123qwe killer trustno1 jordan jennifer zxcvbnm asdfgh hunter
+buster soccer harley batman andrew tigger sunshine iloveyou 2000 charlie
+robert thomas hockey ranger daniel starwars klaster 112233 george computer
+michelle jessica pepper 1111 zxcvbn 555555 11111111 131313 freedom 777777
+pass maggie 159753 aaaaaa ginger princess joshua cheese amanda summer
+love ashley nicole chelsea biteme matthew access yankees 987654321 dallas
+austin thunder taylor matrix minecraft welcome admin login passw0rd qwerty123
+solo abc 1q2w3e4r secret hello whatever flower lovely monkey123 hunter2
+dragon123 master123 football1 baseball1 letmein1 welcome1 password1 password123 p@ssw0rd
+""".split()
+
+ENGLISH_WORDS = """
+the be to of and a in that have i it for not on with he as you do at this but his
+by from they we say her she or an will my one all would there their what so up out
+if about who get which go me when make can like time no just him know take people
+into year your good some could them see other than then now look only come its over
+think also back after use two how our work first well way even new want because any
+these give day most us love life baby angel happy family friend heart dream house
+music sweet dog cat fish blue red green black white star sun moon fire water king
+queen god jesus money summer winter spring autumn monday friday world city home
+football soccer tiger lion eagle dragon wolf bear horse apple orange banana cherry
+chocolate coffee secret magic power light dark shadow silver gold diamond rock
+ocean river mountain forest flower rose lucky smile hello welcome change please
+""".split()
+
+NAMES = """
+james john robert michael william david richard joseph thomas charles mary patricia
+jennifer linda elizabeth barbara susan jessica sarah karen daniel matthew anthony
+mark donald steven paul andrew joshua kevin brian george edward nancy lisa betty
+margaret sandra ashley emily donna michelle carol amanda melissa deborah stephanie
+rebecca laura sharon cynthia kathleen amy anna emma olivia sophia alex chris
+smith johnson williams brown jones garcia miller davis rodriguez martinez wilson
+anderson taylor moore jackson martin lee thompson white harris clark lewis walker
+""".split()
+
+EXTRA_DICTIONARIES = [path for path in os.environ.get('PASSWORD_DICTIONARIES', '').split(os.pathsep) if path]
+
+L33T_TABLE = {
+    '4': 'a', '@': 'a', '8': 'b', '(': 'c', '{': 'c', '[': 'c', '<': 'c',
+    '3': 'e', '6': 'g', '9': 'g', '1': 'il', '!': 'i', '|': 'il', '7': 'lt',
+    '0': 'o', '$': 's', '5': 's', '+': 't', '%': 'x', '2': 'z'
+}
+
+QWERTY_ROWS = (
+    (0.0, '`~ 1! 2@ 3# 4$ 5% 6^ 7& 8* 9( 0) -_ =+'),
+    (1.5, 'qQ wW eE rR tT yY uU iI oO pP [{ ]} \\|'),
+    (1.75, 'aA sS dD fF gG hH jJ kK lL ;: \'"'),
+    (2.25, 'zZ xX cC vV bB nN mM ,< .> /?'),
+)
+KEYPAD_KEYS = (
+    (1, 0, '/'), (2, 0, '*'), (3, 0, '-'),
+    (0, 1, '7'), (1, 1, '8'), (2, 1, '9'), (3, 1, '+'),
+    (0, 2, '4'), (1, 2, '5'), (2, 2, '6'),
+    (0, 3, '1'), (1, 3, '2'), (2, 3, '3'),
+    (0, 4, '0'), (2, 4, '.'),
+)
+
+REFERENCE_YEAR = time.localtime().tm_year
+MIN_YEAR_SPACE = 20
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10000
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+MAX_ESTIMATE_LENGTH = 100
+
+REPEAT_GREEDY_RE = re.compile(r'(.+)\1+', re.DOTALL)
+REPEAT_LAZY_RE = re.compile(r'(.+?)\1+', re.DOTALL)
+REPEAT_LAZY_ANCHORED_RE = re.compile(r'^(.+?)\1+$', re.DOTALL)
+DATE_SEPARATED_RE = re.compile(r'(?<!\d)(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})(?!\d)')
+DIGIT_RUN_RE = re.compile(r'\d{4,}')
+YEAR_RE = re.compile(r'19\d\d|20\d\d')
+
+class RankedDictionary:
+    """
+    Words with their frequency rank, kept as a sorted tuple plus a parallel
+    array of ranks. Substring matching bisects for each growing prefix and
+    stops as soon as no word starts with it, like walking a trie.
+    """
     
-    for pattern in common_patterns:
-        if re.search(pattern.lower(), password.lower()):
-            details["no_common_patterns"] = False
-            feedback.append(f"Avoid common patterns like '{pattern}'")
-            score = max(0, score - 1) 
+    def __init__(self, ranked_lists):
+        best = {}
+        for words in ranked_lists:
+            for rank, word in enumerate(words, 1):
+                if rank < best.get(word, rank + 1):
+                    best[word] = rank
+        self.words = tuple(sorted(best))
+        self.ranks = array('I', (best[word] for word in self.words))
+        self.max_length = max(map(len, self.words), default=0)
+        self.first_chars = frozenset(word[0] for word in self.words)
+    
+    def __len__(self):
+        return len(self.words)
+    
+    def matches(self, text):
+        """Yield (i, j, rank) for every dictionary word equal to text[i:j + 1]."""
+        words, count = self.words, len(self.words)
+        for i in range(len(text)):
+            if text[i] not in self.first_chars:
+                continue
+            lo = 0
+            for j in range(i + 1, min(len(text), i + self.max_length) + 1):
+                prefix = text[i:j]
+                lo = bisect_left(words, prefix, lo)
+                if lo == count or not words[lo].startswith(prefix):
+                    break
+                if words[lo] == prefix:
+                    yield i, j - 1, self.ranks[lo]
+
+def _read_ranked_list(path):
+    with open(path, 'r', encoding='utf-8', errors='surrogateescape') as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+@lru_cache(maxsize=None)
+def ranked_dictionary():
+    lists = [COMMON_PASSWORDS, ENGLISH_WORDS, NAMES]
+    lists.extend(_read_ranked_list(path) for path in EXTRA_DICTIONARIES)
+    return RankedDictionary(lists)
+
+def _adjacency(keys, diagonals):
+    """
+    Map every character to {neighbouring character: direction} from key
+    coordinates, and return the average number of neighbouring keys.
+    """
+    graph = {}
+    degrees = []
+    for x, y, chars in keys:
+        neighbours = []
+        for x2, y2, chars2 in keys:
+            dx, dy = x2 - x, y2 - y
+            if (dy == 0 and abs(dx) == 1) or (abs(dy) == 1 and (abs(dx) <= 1 if diagonals else abs(dx) < 1)):
+                neighbours.append((((dx > 0) - (dx < 0), dy), chars2))
+        degrees.append(len(neighbours))
+        for char in chars:
+            graph[char] = {char2: direction for direction, chars2 in neighbours for char2 in chars2}
+    return graph, sum(degrees) / len(degrees)
+
+@lru_cache(maxsize=None)
+def keyboard_graphs():
+    """(name, graph, starting positions, average degree, shifted chars) per layout."""
+    qwerty = [(offset + k, y, key) for y, (offset, row) in enumerate(QWERTY_ROWS) for k, key in enumerate(row.split())]
+    graphs = []
+    for name, keys, diagonals in (('qwerty', qwerty, False), ('keypad', KEYPAD_KEYS, True)):
+        graph, degree = _adjacency(keys, diagonals)
+        shifted = frozenset(key[1] for _, _, key in keys if len(key) > 1)
+        graphs.append((name, graph, len(keys), degree, shifted))
+    return graphs
+
+def _match(pattern, i, j, token, guesses, **extra):
+    return dict(pattern=pattern, i=i, j=j, token=token, guesses=guesses, **extra)
+
+def _n_choose_k(n, k):
+    return comb(n, k) if 0 <= k <= n else 0
+
+def _uppercase_variations(token):
+    if token.islower() or not any(c.isupper() for c in token):
+        return 1
+    if token[0].isupper() and not any(c.isupper() for c in token[1:]):
+        return 2
+    if token[-1].isupper() and not any(c.isupper() for c in token[:-1]):
+        return 2
+    if token.isupper():
+        return 2
+    upper = sum(c.isupper() for c in token)
+    lower = sum(c.islower() for c in token)
+    return sum(_n_choose_k(upper + lower, k) for k in range(1, min(upper, lower) + 1))
+
+def _l33t_variations(token, subs):
+    variations = 1
+    lowered = token.lower()
+    for subbed, unsubbed in subs.items():
+        s, u = lowered.count(subbed), lowered.count(unsubbed)
+        if s == 0 or u == 0:
+            variations *= 2
+        else:
+            variations *= sum(_n_choose_k(s + u, k) for k in range(1, min(s, u) + 1))
+    return variations
+
+def _dictionary_matches(password):
+    dictionary = ranked_dictionary()
+    lowered = password.lower()
+    n = len(password)
+    matches = []
+    for i, j, rank in dictionary.matches(lowered):
+        token = password[i:j + 1]
+        matches.append(_match('dictionary', i, j, token, rank * _uppercase_variations(token),
+                              matched_word=lowered[i:j + 1], rank=rank))
+    
+    for i, j, rank in dictionary.matches(lowered[::-1]):
+        i, j = n - 1 - j, n - 1 - i
+        token = password[i:j + 1]
+        if j > i:
+            matches.append(_match('dictionary', i, j, token, 2 * rank * _uppercase_variations(token),
+                                  matched_word=lowered[i:j + 1][::-1], rank=rank, reversed=True))
+    
+    # Try each combination of readings for the l33t characters present,
+    # keeping only matches that actually contain a substitution.
+    choices = [(char, L33T_TABLE[char]) for char in sorted(set(lowered)) if char in L33T_TABLE]
+    seen = set()
+    for readings in product(*(letters for _, letters in choices)) if choices else ():
+        table = {char: letter for (char, _), letter in zip(choices, readings)}
+        translated = ''.join(table.get(c, c) for c in lowered)
+        for i, j, rank in dictionary.matches(translated):
+            token = password[i:j + 1]
+            subs = {char: table[char] for char in set(token.lower()) if char in table}
+            if not subs or (i, j, rank) in seen or len(token) == 1:
+                continue
+            seen.add((i, j, rank))
+            guesses = rank * _uppercase_variations(token) * _l33t_variations(token, subs)
+            matches.append(_match('dictionary', i, j, token, guesses,
+                                  matched_word=translated[i:j + 1], rank=rank, l33t=True))
+    return matches
+
+def _spatial_guesses(length, turns, shifted, starts, degree):
+    guesses = 0
+    for i in range(2, length + 1):
+        for j in range(1, min(turns, i - 1) + 1):
+            guesses += _n_choose_k(i - 1, j - 1) * starts * degree ** j
+    if shifted:
+        unshifted = length - shifted
+        if unshifted == 0:
+            guesses *= 2
+        else:
+            guesses *= sum(_n_choose_k(shifted + unshifted, k) for k in range(1, min(shifted, unshifted) + 1))
+    return guesses
+
+def _spatial_matches(password):
+    matches = []
+    n = len(password)
+    for name, graph, starts, degree, shifted_chars in keyboard_graphs():
+        i = 0
+        while i < n - 1:
+            j = i
+            last_direction = None
+            turns = 0
+            shifted = int(password[i] in shifted_chars)
+            while j + 1 < n:
+                direction = graph.get(password[j], {}).get(password[j + 1])
+                if direction is None:
+                    break
+                if direction != last_direction:
+                    turns += 1
+                    last_direction = direction
+                shifted += password[j + 1] in shifted_chars
+                j += 1
+            if j - i >= 2:
+                token = password[i:j + 1]
+                matches.append(_match('spatial', i, j, token,
+                                      _spatial_guesses(len(token), turns, shifted, starts, degree),
+                                      graph=name, turns=turns))
+            i = j + 1 if j > i else i + 1
+    return matches
+
+def _sequence_matches(password):
+    matches = []
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        delta = ord(password[i + 1]) - ord(password[i])
+        j = i + 1
+        while j + 1 < n and ord(password[j + 1]) - ord(password[j]) == delta:
+            j += 1
+        if j - i >= 2 and 0 < abs(delta) <= 5:
+            token = password[i:j + 1]
+            first = token[0]
+            if first in 'aAzZ019':
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            if delta < 0:
+                base *= 2
+            matches.append(_match('sequence', i, j, token, base * len(token), ascending=delta > 0))
+            i = j
+        else:
+            i += 1
+    return matches
+
+def _repeat_matches(password):
+    matches = []
+    position = 0
+    while position < len(password):
+        greedy = REPEAT_GREEDY_RE.search(password, position)
+        if not greedy:
             break
+        lazy = REPEAT_LAZY_RE.search(password, position)
+        if len(greedy.group(0)) > len(lazy.group(0)):
+            match = greedy
+            base = REPEAT_LAZY_ANCHORED_RE.match(match.group(0)).group(1)
+        else:
+            match = lazy
+            base = match.group(1)
+        i, j = match.start(), match.end() - 1
+        base_guesses = estimate_guesses(base)["guesses"]
+        count = len(match.group(0)) // len(base)
+        matches.append(_match('repeat', i, j, match.group(0), base_guesses * count,
+                              base_token=base, repeat_count=count))
+        position = j + 1
+    return matches
+
+def _two_digit_year(year):
+    if year > 99:
+        return year
+    return year + (1900 if year > 50 else 2000)
+
+def _valid_date(day, month, year):
+    return 1 <= day <= 31 and 1 <= month <= 12 and (1000 <= year <= 2050)
+
+def _date_guesses(year, separator):
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE) * 365 * (4 if separator else 1)
+
+def _best_date(parts):
+    """
+    Read three digit strings as a date with the year first or last, and
+    return the (day, month, year) closest to the reference year, or None.
+    """
+    best = None
+    a, b, c = parts
+    for year, first, second in ((c, a, b), (a, b, c)):
+        if len(year) not in (2, 4) or len(first) > 2 or len(second) > 2:
+            continue
+        year = _two_digit_year(int(year))
+        for day, month in ((int(first), int(second)), (int(second), int(first))):
+            if _valid_date(day, month, year) and (best is None or abs(year - REFERENCE_YEAR) < abs(best[2] - REFERENCE_YEAR)):
+                best = (day, month, year)
+    return best
+
+def _date_matches(password):
+    matches = []
+    for match in DATE_SEPARATED_RE.finditer(password):
+        date = _best_date((match.group(1), match.group(3), match.group(4)))
+        if date:
+            matches.append(_match('date', match.start(), match.end() - 1, match.group(0),
+                                  _date_guesses(date[2], True), separator=match.group(2)))
+    
+    for run in DIGIT_RUN_RE.finditer(password):
+        digits, offset = run.group(0), run.start()
+        for i in range(len(digits)):
+            for j in range(i + 4, min(len(digits), i + 8) + 1):
+                token = digits[i:j]
+                best = None
+                for k in range(1, len(token) - 1):
+                    for l in range(k + 1, len(token)):
+                        date = _best_date((token[:k], token[k:l], token[l:]))
+                        if date and (best is None or abs(date[2] - REFERENCE_YEAR) < abs(best[2] - REFERENCE_YEAR)):
+                            best = date
+                if best:
+                    matches.append(_match('date', offset + i, offset + j - 1, token, _date_guesses(best[2], False)))
+    
+    for match in YEAR_RE.finditer(password):
+        year = int(match.group(0))
+        matches.append(_match('year', match.start(), match.end() - 1, match.group(0),
+                              max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)))
+    return matches
+
+def _bruteforce(password, i, j):
+    length = j - i + 1
+    guesses = 10 ** length
+    floor = MIN_SUBMATCH_GUESSES_SINGLE_CHAR if length == 1 else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+    return _match('bruteforce', i, j, password[i:j + 1], max(guesses, floor + 1))
+
+def _bounded_guesses(match, password_length):
+    if len(match['token']) >= password_length:
+        return match['guesses']
+    floor = MIN_SUBMATCH_GUESSES_SINGLE_CHAR if len(match['token']) == 1 else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+    return max(match['guesses'], floor)
+
+def _most_guessable_sequence(password, matches):
+    """
+    Choose the segmentation minimising l! * product(guesses) + D^(l - 1)
+    over sequences of l matches, with brute force filling any gaps.
+    """
+    n = len(password)
+    by_end = [[] for _ in range(n)]
+    for match in matches:
+        by_end[match['j']].append(match)
+    best_match = [{} for _ in range(n)]
+    best_pi = [{} for _ in range(n)]
+    best_g = [{} for _ in range(n)]
+    
+    def update(match, length):
+        k = match['j']
+        pi = _bounded_guesses(match, n)
+        if length > 1:
+            pi *= best_pi[match['i'] - 1][length - 1]
+        g = factorial(length) * pi + MIN_GUESSES_BEFORE_GROWING_SEQUENCE ** (length - 1)
+        for other_length, other_g in best_g[k].items():
+            if other_length <= length and other_g <= g:
+                return
+        best_match[k][length], best_pi[k][length], best_g[k][length] = match, pi, g
+    
+    for k in range(n):
+        for match in by_end[k]:
+            if match['i'] > 0:
+                for length in list(best_match[match['i'] - 1]):
+                    update(match, length + 1)
+            else:
+                update(match, 1)
+        update(_bruteforce(password, 0, k), 1)
+        for i in range(1, k + 1):
+            lengths = [length for length, last in best_match[i - 1].items() if last['pattern'] != 'bruteforce']
+            if lengths:
+                bruteforce = _bruteforce(password, i, k)
+                for length in lengths:
+                    update(bruteforce, length + 1)
+    
+    if n == 0:
+        return 1, []
+    length, guesses = min(best_g[n - 1].items(), key=lambda item: (item[1], item[0]))
+    sequence = []
+    k = n - 1
+    while k >= 0:
+        match = best_match[k][length]
+        sequence.append(match)
+        k = match['i'] - 1
+        length -= 1
+    sequence.reverse()
+    return guesses, sequence
+
+def guesses_to_score(guesses):
+    """Map a guess count to 0-4, as zxcvbn does."""
+    for score, limit in enumerate((1e3, 1e6, 1e8, 1e10)):
+        if guesses < limit + 5:
+            return score
+    return 4
+
+def estimate_guesses(password):
+    """
+    Estimate how many guesses an attacker needs, in the spirit of zxcvbn.
+    The password is split into dictionary, keyboard, sequence, repeat and
+    date matches (brute force elsewhere) by dynamic programming. Only the
+    first MAX_ESTIMATE_LENGTH characters are considered.
+    """
+    password = password[:MAX_ESTIMATE_LENGTH]
+    matches = (_dictionary_matches(password) + _spatial_matches(password) + _sequence_matches(password)
+               + _repeat_matches(password) + _date_matches(password))
+    guesses, sequence = _most_guessable_sequence(password, matches)
+    return {
+        "guesses": guesses,
+        "guesses_log10": log10(max(guesses, 1)),
+        "score": guesses_to_score(guesses),
+        "sequence": sequence
+    }
+
+ESTIMATE_FEEDBACK = {
+    "dictionary": "Avoid common words, names and passwords like '{token}'",
+    "spatial": "Avoid keyboard patterns like '{token}'",
+    "sequence": "Avoid sequences like '{token}'",
+    "repeat": "Avoid repeated characters or words like '{token}'",
+    "date": "Avoid dates like '{token}'",
+    "year": "Avoid years like '{token}'"
+}
+
+def estimate_feedback(estimate):
+    feedback = []
+    for match in estimate["sequence"]:
+        message = ESTIMATE_FEEDBACK.get(match["pattern"])
+        if message:
+            feedback.append(message.format(token=match["token"]))
+        if match.get("l33t"):
+            feedback.append("Predictable substitutions like '@' for 'a' don't help much")
+    return list(dict.fromkeys(feedback))
+
+def benchmark_estimator(count=20000, seed=0):
+    """Time the first estimate (lazy dictionary load) and then `count` more."""
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(count):
+        kind = rng.randrange(4)
+        if kind == 0:
+            word = rng.choice(COMMON_PASSWORDS + ENGLISH_WORDS + NAMES)
+            samples.append(word.capitalize() + str(rng.randrange(100)) + rng.choice('!@#$'))
+        elif kind == 1:
+            samples.append(''.join(rng.choice(string.ascii_letters + string.digits + '!@#$') for _ in range(rng.randint(8, 16))))
+        elif kind == 2:
+            samples.append(rng.choice(['qwerty', 'asdfgh', 'zxcvbn', '1qaz2wsx']) + f"{rng.randint(1950, 2025)}")
+        else:
+            samples.append(f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1950, 2025)}{rng.choice(ENGLISH_WORDS)}")
     
-    strength_levels = {
-        0: "Very Weak",
-        1: "Weak",
-        2: "Fair",
-        3: "Moderate",
-        4: "Strong",
-        5: "Very Strong"
+    start = time.perf_counter()
+    estimate_guesses("warm up the dictionaries")
+    first = time.perf_counter() - start
+    
+    timings = []
+    for password in samples:
+        start = time.perf_counter()
+        estimate_guesses(password)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    total = sum(timings)
+    return {
+        "first_call_ms": first * 1000,
+        "estimates_per_second": count / total,
+        "mean_us": total / count * 1e6,
+        "p99_us": timings[int(count * 0.99) - 1] * 1e6
+    }
+
+def analyze_password(password, breach_index=None, estimate=True):
+    """
+    Run every check in one pass over the password's distinct characters.
+    Returns (score, details, common_pattern, guess_estimate).
+    
+    With estimate, the score is also capped by estimate_guesses, so a
+    password built from a word, a digit and a symbol cannot rate above its
+    guessability. With a breach_index, a password found in it also fails
+    "not_breached" and scores 0.
+    """
+    chars = set(password)
+    details = {
+        "length": len(password) >= 8,
+        "uppercase": not UPPERCASE.isdisjoint(chars),
+        "lowercase": not LOWERCASE.isdisjoint(chars),
+        "digits": any(c.isdecimal() for c in chars),
+        "special_chars": not SPECIAL_CHARS.isdisjoint(chars),
+        "no_common_patterns": True
     }
+    score = sum(details.values()) - 1
+    
+    common_pattern = None
+    if COMMON_PATTERN_RE.search(password):
+        # Report the first listed pattern that occurs, and confirm it against
+        # str.lower(), which folds a few non-ASCII letters differently.
+        lowered = password.lower()
+        common_pattern = next((pattern for pattern in COMMON_PATTERNS if pattern in lowered), None)
+    if common_pattern:
+        details["no_common_patterns"] = False
+        score = max(0, score - 1)
+    
+    guess_estimate = None
+    if estimate:
+        guess_estimate = estimate_guesses(password)
+        details["hard_to_guess"] = guess_estimate["score"] >= 3
+        if guess_estimate["score"] < 4:
+            score = min(score, guess_estimate["score"])
+    
+    if breach_index is not None:
+        details["not_breached"] = password not in breach_index
+        if not details["not_breached"]:
+            score = 0
     
-    strength = strength_levels.get(score, "Unknown")
+    return score, details, common_pattern, guess_estimate
+
+def check_password_strength(password, breach_index=None, estimate=True):
+    score, details, common_pattern, guess_estimate = analyze_password(password, breach_index, estimate)
+    feedback = []
+    
+    if not details["length"]:
+        feedback.append("Password should be at least 8 characters long")
+    if not details["uppercase"]:
+        feedback.append("Include at least one uppercase letter")
+    if not details["lowercase"]:
+        feedback.append("Include at least one lowercase letter")
+    if not details["digits"]:
+        feedback.append("Include at least one number")
+    if not details["special_chars"]:
+        feedback.append("Include at least one special character (!@#$%^&*()_+-=[]{}:;\"'<>,.?/|\\)")
+    if common_pattern:
+        feedback.append(f"Avoid common patterns like '{common_pattern}'")
+    if guess_estimate and not details["hard_to_guess"]:
+        feedback.extend(estimate_feedback(guess_estimate))
+    if not details.get("not_breached", True):
+        feedback.append("This password appears in a known breach list")
+    
+    strength = STRENGTH_LEVELS.get(score, "Unknown")
     
     if not feedback:
         feedback.append("Excellent password!")
     
-    return {
+    result = {
         "score": score,
         "strength": strength,
         "feedback": feedback,
         "details": details
     }
+    if guess_estimate:
+        result["guesses_log10"] = round(guess_estimate["guesses_log10"], 2)
+    return result
+
+def _audit_batch(first_line, passwords, index_path=None, estimate=True):
+    breach_index = open_breach_index(index_path) if index_path else None
+    rows = []
+    for line_number, password in enumerate(passwords, first_line):
+        score, details, _, _ = analyze_password(password, breach_index, estimate)
+        failed = ";".join(check for check, passed in details.items() if not passed)
+        rows.append((line_number, score, STRENGTH_LEVELS[score], failed))
+    return rows
+
+def iter_password_batches(file, batch_size=AUDIT_BATCH_SIZE):
+    """Yield (first_line_number, passwords) from a file with one password per line."""
+    batch = []
+    first_line = 1
+    for line_number, line in enumerate(file, 1):
+        batch.append(line.rstrip('\r\n'))
+        if len(batch) == batch_size:
+            yield first_line, batch
+            batch = []
+            first_line = line_number + 1
+    if batch:
+        yield first_line, batch
+
+def audit_passwords(input_path, output_path, workers=None, batch_size=AUDIT_BATCH_SIZE, index_path=None,
+                    estimate=True):
+    """
+    Score every line of input_path and stream one CSV row per password to
+    output_path (line number, score, strength, failed checks). Passwords
+    themselves are never written. Batches are scored in a process pool
+    with a bounded number in flight, and rows are written in input order.
+    Returns a Counter of strength labels.
+    """
+    workers = workers or os.cpu_count() or 1
+    totals = Counter()
+    
+    with open(input_path, 'r', encoding='utf-8', errors='surrogateescape', newline='') as source, \
+            open(output_path, 'w', encoding='utf-8', newline='') as output:
+        writer = csv.writer(output)
+        writer.writerow(["line", "score", "strength", "failed_checks"])
+        
+        def write(rows):
+            writer.writerows(rows)
+            totals.update(row[2] for row in rows)
+        
+        batches = iter_password_batches(source, batch_size)
+        if workers == 1:
+            for first_line, passwords in batches:
+                write(_audit_batch(first_line, passwords, index_path, estimate))
+            return totals
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for first_line, passwords in batches:
+                pending.append(executor.submit(_audit_batch, first_line, passwords, index_path, estimate))
+                if len(pending) >= workers * 2:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+    
+    return totals
+
+def run_audit(args):
+    start = time.perf_counter()
+    try:
+        totals = audit_passwords(args.audit, args.output, args.workers, index_path=args.breach_index,
+                                 estimate=not args.no_estimate)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+    
+    count = sum(totals.values())
+    print(f"Audited {count} passwords in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f}/s)")
+    for score in sorted(STRENGTH_LEVELS):
+        label = STRENGTH_LEVELS[score]
+        print(f"{label:<12}{totals[label]}")
+    print(f"Results written to {args.output}")
+    return 0
+
+def percentiles(samples, points=(50, 90, 99)):
+    """Nearest-rank percentiles of a list of latencies, plus the maximum."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    report = {f"p{point}": ordered[max(0, -(-point * len(ordered) // 100) - 1)] for point in points}
+    report["max"] = ordered[-1]
+    return report
+
+class PasswordCheckHandler(BaseHTTPRequestHandler):
+    """
+    POST /check with {"password": ...} or {"passwords": [...]} returns
+    {"result": ...} or {"results": [...]}, each the check_password_strength
+    structure. GET /stats reports request counts and latency percentiles.
+    """
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send(200, self.server.stats())
+        elif self.path == '/health':
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": "not found"})
+    
+    def do_POST(self):
+        if self.path != '/check':
+            self._send(404, {"error": "not found"})
+            return
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get('Content-Length', -1))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_REQUEST_BYTES:
+            # The body is left unread, so the connection cannot be reused.
+            self.close_connection = True
+            self._send(400, {"error": "request too large" if length > 0 else "missing or invalid Content-Length"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length))
+            estimate = request.get("estimate", self.server.estimate)
+            if "passwords" in request:
+                passwords = request["passwords"]
+                if not isinstance(passwords, list) or not all(isinstance(p, str) for p in passwords):
+                    raise ValueError("'passwords' must be a list of strings")
+                response = {"results": [self.server.check(password, estimate) for password in passwords]}
+            elif isinstance(request.get("password"), str):
+                passwords = [request["password"]]
+                response = {"result": self.server.check(passwords[0], estimate)}
+            else:
+                raise ValueError("expected 'password' or 'passwords'")
+        except (ValueError, AttributeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        self._send(200, response)
+        self.server.record(time.perf_counter() - start, len(passwords))
+    
+    def _send(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+class _PasswordCheckService:
+    """Warm state and latency bookkeeping shared by the TCP and Unix servers."""
+    
+    def init_service(self, breach_index=None, estimate=True):
+        self.breach_index = breach_index
+        self.estimate = estimate
+        self.latencies = deque(maxlen=SERVER_LATENCY_WINDOW)
+        self.requests = 0
+        self.passwords = 0
+        self.lock = threading.Lock()
+        self.started = time.time()
+        # Build the dictionaries and keyboard graphs before the first request.
+        estimate_guesses("warm up")
+    
+    def check(self, password, estimate):
+        return check_password_strength(password, self.breach_index, estimate)
+    
+    def record(self, seconds, count):
+        with self.lock:
+            self.latencies.append(seconds * 1000)
+            self.requests += 1
+            self.passwords += count
+    
+    def stats(self):
+        with self.lock:
+            latencies = list(self.latencies)
+            requests, passwords = self.requests, self.passwords
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "requests": requests,
+            "passwords": passwords,
+            "latency_ms": {name: round(value, 3) for name, value in percentiles(latencies).items()}
+        }
+
+class PasswordCheckServer(_PasswordCheckService, ThreadingHTTPServer):
+    daemon_threads = True
+
+class UnixPasswordCheckServer(_PasswordCheckService, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('unix', 0)
+
+def make_server(address, breach_index=None, estimate=True):
+    """address is 'HOST:PORT', 'PORT' (on 127.0.0.1) or 'unix:/path/to/socket'."""
+    if address.startswith('unix:'):
+        path = address[len('unix:'):]
+        if os.path.exists(path):
+            # Replace a stale socket from an earlier run, never another file.
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.remove(path)
+        server = UnixPasswordCheckServer(path, PasswordCheckHandler)
+    else:
+        host, _, port = address.rpartition(':')
+        server = PasswordCheckServer((host or '127.0.0.1', int(port)), PasswordCheckHandler)
+    server.init_service(breach_index, estimate)
+    return server
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=30):
+        super().__init__('localhost', timeout=timeout)
+        self.unix_path = path
+    
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+class PasswordCheckClient:
+    """Client for a running server, reusing one keep-alive connection."""
+    
+    def __init__(self, address, timeout=30):
+        if address.startswith('unix:'):
+            self.connection = _UnixHTTPConnection(address[len('unix:'):], timeout)
+        else:
+            host, _, port = address.rpartition(':')
+            self.connection = http.client.HTTPConnection(host or '127.0.0.1', int(port), timeout=timeout)
+    
+    def _request(self, method, path, body=None):
+        payload = json.dumps(body).encode('utf-8') if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload else {}
+        self.connection.request(method, path, payload, headers)
+        response = self.connection.getresponse()
+        data = json.loads(response.read())
+        if response.status != 200:
+            raise ValueError(data.get("error", f"HTTP {response.status}"))
+        return data
+    
+    def check(self, password):
+        return self._request('POST', '/check', {"password": password})["result"]
+    
+    def check_many(self, passwords):
+        return self._request('POST', '/check', {"passwords": list(passwords)})["results"]
+    
+    def stats(self):
+        return self._request('GET', '/stats')
+    
+    def close(self):
+        self.connection.close()
+
+def _stop_server(signum, frame):
+    raise KeyboardInterrupt
+
+def run_server(args, breach_index):
+    signal.signal(signal.SIGTERM, _stop_server)
+    try:
+        server = make_server(args.serve, breach_index, not args.no_estimate)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(f"Serving password checks on {args.serve} (POST /check, GET /stats). Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    finally:
+        server.server_close()
+        if args.serve.startswith('unix:') and os.path.exists(args.serve[len('unix:'):]):
+            os.remove(args.serve[len('unix:'):])
+    return 0
+
+def run_client(args):
+    """Send passwords from stdin in batches and print one JSON result per line."""
+    client = PasswordCheckClient(args.client)
+    latencies = []
+    count = 0
+    try:
+        for _, batch in iter_password_batches(sys.stdin, args.batch_size):
+            start = time.perf_counter()
+            results = client.check_many(batch)
+            latencies.append((time.perf_counter() - start) * 1000)
+            count += len(results)
+            for result in results:
+                print(json.dumps(result))
+        server_stats = client.stats()
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+    
+    report = percentiles(latencies)
+    print(f"{count} passwords in {len(latencies)} requests; client latency ms: "
+          + ", ".join(f"{name}={value:.2f}" for name, value in report.items()), file=sys.stderr)
+    print(f"Server: {json.dumps(server_stats)}", file=sys.stderr)
+    return 0
 
 def main():
+    parser = argparse.ArgumentParser(description='Check password strength interactively or audit a password file.')
+    
+    parser.add_argument('--audit', metavar='FILE',
+                        help='Score every line of FILE instead of prompting')
+    
+    parser.add_argument('-o', '--output',
+                        help='CSV file for audit results (default: <FILE>.audit.csv)')
+    
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Worker processes for the audit (default: CPU count)')
+    
+    parser.add_argument('--breach-index', metavar='INDEX',
+                        help='Also reject passwords found in this breached-password index')
+    
+    parser.add_argument('--build-breach-index', metavar='LIST', nargs='+',
+                        help='Build --breach-index from lists of passwords or SHA-1 hashes, then exit')
+    
+    parser.add_argument('--no-estimate', action='store_true',
+                        help='Skip the guess estimator (faster audits, class-count score only)')
+    
+    parser.add_argument('--benchmark-estimator', metavar='N', type=int, nargs='?', const=20000,
+                        help='Time N guess estimates and report estimates per second, then exit')
+    
+    parser.add_argument('--serve', metavar='ADDRESS',
+                        help="Serve checks over HTTP on PORT, HOST:PORT or unix:PATH")
+    
+    parser.add_argument('--client', metavar='ADDRESS',
+                        help='Send passwords from stdin to a running server and print JSON results')
+    
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help='Passwords per request in client mode (default: 100)')
+    
+    args = parser.parse_args()
+    
+    if args.client:
+        return run_client(args)
+    
+    if args.benchmark_estimator:
+        report = benchmark_estimator(args.benchmark_estimator)
+        print(f"First estimate (loads dictionaries): {report['first_call_ms']:.1f} ms")
+        print(f"Estimates per second: {report['estimates_per_second']:,.0f}")
+        print(f"Mean: {report['mean_us']:.0f} us, p99: {report['p99_us']:.0f} us")
+        return 0
+    
+    if args.build_breach_index:
+        if not args.breach_index:
+            parser.error('--build-breach-index requires --breach-index')
+        start = time.perf_counter()
+        try:
+            count = build_breach_index(args.build_breach_index, args.breach_index)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Indexed {count} distinct hashes in {time.perf_counter() - start:.1f}s")
+        return 0
+    
+    breach_index = None
+    if args.breach_index:
+        try:
+            breach_index = open_breach_index(args.breach_index)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return 1
+    
+    if args.audit:
+        args.output = args.output or args.audit + '.audit.csv'
+        return run_audit(args)
+    
+    if args.serve:
+        return run_server(args, breach_index)
+    
     print("=== Password Strength Checker ===")
     print("Enter a password to check its strength.")
     print("Type 'exit' to quit the program.\n")
@@ -86,9 +1174,11 @@ def main():
             print("Exiting program. Goodbye!")
             break
         
-        result = check_password_strength(password)
+        result = check_password_strength(password, breach_index, not args.no_estimate)
         
         print("\nPassword Strength: " + result["strength"] + f" ({result['score']}/5)")
+        if "guesses_log10" in result:
+            print(f"Estimated guesses: 10^{result['guesses_log10']:.1f}")
         print("\nFeedback:")
         for item in result["feedback"]:
             print(f"- {item}")
@@ -101,4 +1191,4 @@ def main():
         print("\n" + "-" * 40 + "\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
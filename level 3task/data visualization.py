@@ -1,15 +1,1086 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import os
+import io
+import sys
 import json
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import base64
+import html
+import argparse
+import time
+import tempfile
+import importlib
+import threading
+import statistics
+import subprocess
+import tracemalloc
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+class LazyImport:
+    """
+    Stands in for a module, or for one name in a module, and imports it on
+    first attribute access, call or isinstance check. All lazy imports and
+    the warm-up thread share one lock, so two threads never import
+    interdependent packages at the same time.
+    """
+    
+    _lock = threading.RLock()
+    
+    def __init__(self, module, name=None):
+        self._module = module
+        self._name = name
+        self._target = None
+    
+    def load(self):
+        if self._target is None:
+            with LazyImport._lock:
+                module = importlib.import_module(self._module)
+                self._target = getattr(module, self._name) if self._name else module
+        return self._target
+    
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+    
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+    
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.load())
+    
+    def __repr__(self):
+        target = f"{self._module}.{self._name}" if self._name else self._module
+        return f"<lazy {target}{'' if self._target is None else ' (loaded)'}>"
+
+
+# The data and plotting stack costs seconds to import, so none of it is
+# loaded until a chart or dataset needs it (or the warm-up thread gets to it
+# after the window is up).
+pd = LazyImport('pandas')
+np = LazyImport('numpy')
+plt = LazyImport('matplotlib.pyplot')
+sns = LazyImport('seaborn')
+px = LazyImport('plotly.express')
+get_plotlyjs = LazyImport('plotly.offline', 'get_plotlyjs')
+get_plotlyjs_version = LazyImport('plotly.offline', 'get_plotlyjs_version')
+PlotlyJSONEncoder = LazyImport('plotly.utils', 'PlotlyJSONEncoder')
+Figure = LazyImport('matplotlib.figure', 'Figure')
+Line2D = LazyImport('matplotlib.lines', 'Line2D')
+FigureCanvasAgg = LazyImport('matplotlib.backends.backend_agg', 'FigureCanvasAgg')
+FigureCanvasTkAgg = LazyImport('matplotlib.backends.backend_tkagg', 'FigureCanvasTkAgg')
+
+# Warmed in this order after the window shows: the default library first.
+WARM_IMPORTS = ['numpy', 'pandas', 'matplotlib.figure', 'matplotlib.backends.backend_tkagg',
+                'matplotlib.pyplot', 'seaborn', 'plotly.express', 'plotly.offline']
+WARM_DELAY_MS = 100
+HEAVY_MODULES = ['numpy', 'pandas', 'matplotlib', 'seaborn', 'plotly']
+
+
+def warm_imports(modules=WARM_IMPORTS):
+    """Import modules one at a time in a daemon thread and return the thread."""
+    def run():
+        for name in modules:
+            try:
+                with LazyImport._lock:
+                    importlib.import_module(name)
+            except Exception:
+                # A missing or broken library is reported when it is first used.
+                pass
+    
+    thread = threading.Thread(target=run, name="import-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+VIZ_TYPES = ["Scatter Plot", "Line Chart", "Bar Chart", "Histogram", "Box Plot", "Heatmap", "Pie Chart", "3D Scatter"]
+LIBRARIES = ["Matplotlib", "Seaborn", "Plotly (Static)"]
+THREE_D_WARNING = "3D Scatter requires a third column (set as Color)"
+
+
+def load_dataset(file_path):
+    file_ext = os.path.splitext(file_path)[1].lower()
+    
+    if file_ext == '.csv':
+        return pd.read_csv(file_path)
+    elif file_ext == '.xlsx':
+        return pd.read_excel(file_path)
+    elif file_ext == '.json':
+        return pd.read_json(file_path)
+    else:
+        raise ValueError("Unsupported file format")
+
+
+class StageTimer:
+    """
+    Accumulates wall-clock time per named stage (load, aggregate, render,
+    draw). Nested stages are exclusive: time spent in an inner stage is not
+    counted again in the stage around it.
+    """
+    
+    def __init__(self):
+        self.timings = {}
+        self._children = []
+    
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        self._children.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed - self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+    
+    def summary(self):
+        return ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.timings.items())
+
+
+def draw_matplotlib(fig, df, viz_type, x_col, y_col, color_col, title, timer=None):
+    timer = timer or StageTimer()
+    
+    if viz_type == "3D Scatter":
+        z_col = color_col
+        if not z_col:
+            raise ValueError(THREE_D_WARNING)
+        ax = fig.add_subplot(111, projection='3d')
+        ax.scatter(df[x_col], df[y_col], df[z_col])
+        ax.set_zlabel(z_col)
+    else:
+        ax = fig.add_subplot(111)
+    
+    if viz_type == "Scatter Plot":
+        if color_col:
+            scatter = ax.scatter(df[x_col], df[y_col], c=df[color_col].astype('category').cat.codes)
+            fig.colorbar(scatter, ax=ax, label=color_col)
+        else:
+            ax.scatter(df[x_col], df[y_col])
+    elif viz_type == "Line Chart":
+        if color_col:
+            for category, group in df.groupby(color_col):
+                ax.plot(group[x_col], group[y_col], label=category)
+            ax.legend()
+        else:
+            ax.plot(df[x_col], df[y_col])
+    elif viz_type == "Bar Chart":
+        if color_col:
+            with timer.stage("aggregate"):
+                grouped = df.groupby([x_col, color_col])[y_col].mean().unstack()
+            grouped.plot(kind='bar', ax=ax)
+        else:
+            with timer.stage("aggregate"):
+                means = df.groupby(x_col)[y_col].mean()
+            means.plot(kind='bar', ax=ax)
+    elif viz_type == "Histogram":
+        ax.hist(df[x_col], bins=20)
+    elif viz_type == "Box Plot":
+        if color_col:
+            df.boxplot(column=y_col, by=color_col, ax=ax)
+        else:
+            df.boxplot(column=y_col, ax=ax)
+    elif viz_type == "Heatmap":
+        if x_col and y_col and color_col:
+            with timer.stage("aggregate"):
+                pivot_df = df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
+            _imshow_matrix(fig, ax, pivot_df)
+        else:
+            with timer.stage("aggregate"):
+                corr_df = df.select_dtypes(include=[np.number]).corr()
+            _imshow_matrix(fig, ax, corr_df, rotation=90)
+    elif viz_type == "Pie Chart":
+        with timer.stage("aggregate"):
+            totals = df.groupby(x_col)[y_col].sum()
+        totals.plot(kind='pie', ax=ax, autopct='%1.1f%%')
+    
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_title(title)
+    fig.tight_layout()
+
+
+def draw_seaborn(fig, df, viz_type, x_col, y_col, color_col, title, timer=None):
+    timer = timer or StageTimer()
+    
+    if viz_type == "3D Scatter":
+        z_col = color_col
+        if not z_col:
+            raise ValueError(THREE_D_WARNING)
+        ax = fig.add_subplot(111, projection='3d')
+        ax.scatter(df[x_col], df[y_col], df[z_col])
+        ax.set_zlabel(z_col)
+    else:
+        ax = fig.add_subplot(111)
+    
+    if viz_type == "Scatter Plot":
+        sns.scatterplot(data=df, x=x_col, y=y_col, hue=color_col, ax=ax)
+    elif viz_type == "Line Chart":
+        sns.lineplot(data=df, x=x_col, y=y_col, hue=color_col, ax=ax)
+    elif viz_type == "Bar Chart":
+        sns.barplot(data=df, x=x_col, y=y_col, hue=color_col, ax=ax)
+    elif viz_type == "Histogram":
+        sns.histplot(data=df, x=x_col, hue=color_col, ax=ax)
+    elif viz_type == "Box Plot":
+        sns.boxplot(data=df, x=x_col, y=y_col, hue=color_col, ax=ax)
+    elif viz_type == "Heatmap":
+        if x_col and y_col and color_col:
+            with timer.stage("aggregate"):
+                pivot_df = df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
+            sns.heatmap(pivot_df, annot=True, cmap="YlGnBu", ax=ax)
+        else:
+            with timer.stage("aggregate"):
+                corr_df = df.select_dtypes(include=[np.number]).corr()
+            sns.heatmap(corr_df, annot=True, cmap="coolwarm", ax=ax)
+    elif viz_type == "Pie Chart":
+        with timer.stage("aggregate"):
+            totals = df.groupby(x_col)[y_col].sum()
+        totals.plot(kind='pie', ax=ax, autopct='%1.1f%%')
+    
+    ax.set_title(title)
+    fig.tight_layout()
+
+
+def build_plotly_figure(df, viz_type, x_col, y_col, color_col, title, timer=None):
+    timer = timer or StageTimer()
+    fig = None
+    
+    if viz_type == "Scatter Plot":
+        fig = px.scatter(df, x=x_col, y=y_col, color=color_col, title=title)
+    elif viz_type == "Line Chart":
+        fig = px.line(df, x=x_col, y=y_col, color=color_col, title=title)
+    elif viz_type == "Bar Chart":
+        fig = px.bar(df, x=x_col, y=y_col, color=color_col, title=title)
+    elif viz_type == "Histogram":
+        fig = px.histogram(df, x=x_col, color=color_col, title=title)
+    elif viz_type == "Box Plot":
+        fig = px.box(df, x=x_col, y=y_col, color=color_col, title=title)
+    elif viz_type == "Heatmap":
+        if x_col and y_col and color_col:
+            with timer.stage("aggregate"):
+                pivot_df = df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
+            fig = px.imshow(pivot_df, title=title)
+        else:
+            with timer.stage("aggregate"):
+                corr_df = df.select_dtypes(include=[np.number]).corr()
+            fig = px.imshow(corr_df, title=title or "Correlation Matrix")
+    elif viz_type == "Pie Chart":
+        fig = px.pie(df, names=x_col, values=y_col, title=title)
+    elif viz_type == "3D Scatter":
+        z_col = color_col
+        if not z_col:
+            raise ValueError(THREE_D_WARNING)
+        fig = px.scatter_3d(df, x=x_col, y=y_col, z=z_col, title=title)
+    
+    return fig
+
+
+def draw_plotly_static(fig, df, viz_type, x_col, y_col, color_col, title, timer=None):
+    timer = timer or StageTimer()
+    
+    if viz_type == "3D Scatter":
+        if not color_col:
+            raise ValueError(THREE_D_WARNING)
+        ax = fig.add_subplot(111, projection='3d')
+        ax.scatter(df[x_col], df[y_col], df[color_col])
+        ax.set_xlabel(x_col)
+        ax.set_ylabel(y_col)
+        ax.set_zlabel(color_col)
+        ax.set_title(title)
+    else:
+        ax = fig.add_subplot(111)
+        if viz_type == "Scatter Plot":
+            ax.scatter(df[x_col], df[y_col])
+        elif viz_type == "Line Chart":
+            ax.plot(df[x_col], df[y_col])
+        elif viz_type == "Bar Chart":
+            ax.bar(df[x_col], df[y_col])
+        elif viz_type == "Histogram":
+            ax.hist(df[x_col], bins=20)
+        elif viz_type == "Box Plot":
+            df.boxplot(column=y_col, by=x_col, ax=ax)
+        elif viz_type == "Heatmap":
+            if x_col and y_col and color_col:
+                with timer.stage("aggregate"):
+                    pivot_df = df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
+                im = ax.imshow(pivot_df)
+            else:
+                with timer.stage("aggregate"):
+                    corr_df = df.select_dtypes(include=[np.number]).corr()
+                im = ax.imshow(corr_df)
+            fig.colorbar(im, ax=ax)
+        elif viz_type == "Pie Chart":
+            with timer.stage("aggregate"):
+                totals = df.groupby(x_col)[y_col].sum()
+            totals.plot(kind='pie', ax=ax, autopct='%1.1f%%')
+        
+        ax.set_xlabel(x_col)
+        ax.set_ylabel(y_col)
+        ax.set_title(f"{title} (Plotly Static Render)")
+    
+    fig.tight_layout()
+
+
+# Out-of-core mode. A CSV that does not fit in memory is split into
+# newline-aligned byte ranges; each range is streamed in chunks by a worker
+# process that folds every chunk into a small partial aggregate, and the
+# partials are merged in the parent. Only the merged results (histogram
+# counts, group sums and counts, covariance moments, a bounded random
+# sample) ever exist in memory. Records must be one per line.
+OUT_OF_CORE_BYTES = 1024 ** 3
+OUT_OF_CORE_SAMPLE_ROWS = 100_000
+
+
+class _ByteRange(io.RawIOBase):
+    def __init__(self, path, start, end):
+        self.file = open(path, 'rb')
+        self.file.seek(start)
+        self.remaining = end - start
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        data = self.file.read(min(len(buffer), self.remaining))
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+    
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+def _finite(chunk, column):
+    values = chunk[column].to_numpy(dtype=float)
+    return values[~np.isnan(values)]
+
+
+def _minmax_partial(chunk, rng, column):
+    values = _finite(chunk, column)
+    return (values.min(), values.max()) if len(values) else None
+
+
+def _minmax_merge(a, b):
+    if a is None or b is None:
+        return a if b is None else b
+    return (min(a[0], b[0]), max(a[1], b[1]))
+
+
+def _histogram_partial(chunk, rng, column, edges):
+    return np.histogram(_finite(chunk, column), bins=np.asarray(edges))[0]
+
+
+def _histogram_merge(a, b):
+    return a + b
+
+
+def _group_partial(chunk, rng, keys, value):
+    return chunk.groupby(list(keys), observed=True, sort=False)[value].agg(['sum', 'count'])
+
+
+def _group_merge(a, b):
+    return a.add(b, fill_value=0)
+
+
+def _moments_partial(chunk, rng, columns):
+    values = chunk[list(columns)].to_numpy(dtype=float)
+    values = values[~np.isnan(values).any(axis=1)]
+    if len(values) == 0:
+        return None
+    mean = values.mean(axis=0)
+    centered = values - mean
+    return (len(values), mean, centered.T @ centered)
+
+
+def _moments_merge(a, b):
+    # Pairwise update of count, mean and centered cross-products (Chan et al.),
+    # which avoids the cancellation of summing raw x*x^T.
+    if a is None or b is None:
+        return a if b is None else b
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    return (n, mean_a + delta * n_b / n, m2_a + m2_b + np.outer(delta, delta) * n_a * n_b / n)
+
+
+def _sample_partial(chunk, rng, size):
+    # Every row gets a uniform random key and the `size` smallest keys win,
+    # which stays a uniform sample when partials are merged.
+    keys = rng.random(len(chunk))
+    if len(chunk) > size:
+        keep = np.argpartition(keys, size)[:size]
+        return (keys[keep], chunk.iloc[keep], len(chunk), size)
+    return (keys, chunk, len(chunk), size)
+
+
+def _sample_merge(a, b):
+    keys = np.concatenate([a[0], b[0]])
+    rows = pd.concat([a[1], b[1]], ignore_index=True)
+    size = a[3]
+    if len(keys) > size:
+        keep = np.argpartition(keys, size)[:size]
+        keys, rows = keys[keep], rows.iloc[keep].reset_index(drop=True)
+    return (keys, rows, a[2] + b[2], size)
+
+
+OUT_OF_CORE_OPERATIONS = {
+    "minmax": (_minmax_partial, _minmax_merge),
+    "histogram": (_histogram_partial, _histogram_merge),
+    "group": (_group_partial, _group_merge),
+    "moments": (_moments_partial, _moments_merge),
+    "sample": (_sample_partial, _sample_merge),
+}
+
+
+def _scan_range(path, start, end, names, dtypes, numeric, chunksize, operation, args, seed):
+    partial, merge = OUT_OF_CORE_OPERATIONS[operation]
+    rng = np.random.default_rng(seed)
+    result = None
+    with io.BufferedReader(_ByteRange(path, start, end)) as stream:
+        for chunk in pd.read_csv(stream, header=None, names=names, dtype=dtypes, chunksize=chunksize):
+            # Numeric columns are judged from the preview only, so a stray
+            # text cell further down becomes NaN here instead of failing
+            # the parse.
+            for column in numeric:
+                chunk[column] = pd.to_numeric(chunk[column], errors='coerce').astype('float64')
+            value = partial(chunk, rng, *args)
+            result = value if result is None else merge(result, value)
+    return result
+
+
+class OutOfCoreDataset:
+    """
+    Chart queries over a CSV file answered by streaming it in chunks across
+    a process pool. Results are memoised, so re-rendering a chart does not
+    rescan the file.
+    """
+    
+    def __init__(self, file_path, chunksize=500_000, workers=None, seed=0):
+        self.file_path = file_path
+        self.chunksize = chunksize
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.row_count = None
+        self._executor = None
+        self._results = {}
+        
+        preview = pd.read_csv(file_path, nrows=10_000)
+        self.columns = list(preview.columns)
+        self.numeric_columns = list(preview.select_dtypes(include=[np.number]).columns)
+        self.dtypes = {col: 'object' for col in self.columns if col not in self.numeric_columns}
+        self.ranges = self._split_ranges()
+    
+    def _split_ranges(self):
+        size = os.path.getsize(self.file_path)
+        with open(self.file_path, 'rb') as f:
+            f.readline()
+            data_start = f.tell()
+            parts = max(1, min(self.workers * 4, (size - data_start) // (8 * 1024 ** 2)))
+            bounds = [data_start]
+            for i in range(1, parts):
+                f.seek(data_start + (size - data_start) * i // parts)
+                f.readline()
+                bounds.append(max(f.tell(), bounds[-1]))
+            bounds.append(size)
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    
+    def _run(self, operation, *args):
+        key = (operation, args)
+        if key in self._results:
+            return self._results[key]
+        
+        tasks = [(self.file_path, start, end, self.columns, self.dtypes, self.numeric_columns, self.chunksize,
+                  operation, args, (self.seed, i))
+                 for i, (start, end) in enumerate(self.ranges)]
+        if self.workers == 1 or len(tasks) <= 1:
+            partials = [_scan_range(*task) for task in tasks]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            partials = list(self._executor.map(_scan_range, *zip(*tasks)))
+        
+        merge = OUT_OF_CORE_OPERATIONS[operation][1]
+        result = None
+        for value in partials:
+            if value is not None:
+                result = value if result is None else merge(result, value)
+        
+        self._results[key] = result
+        return result
+    
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+    
+    def histogram(self, column, bins=20):
+        bounds = self._run("minmax", column)
+        if bounds is None:
+            raise ValueError(f"Column '{column}' has no numeric values")
+        lo, hi = bounds
+        edges = np.linspace(lo, hi if hi > lo else lo + 1, bins + 1)
+        counts = self._run("histogram", column, tuple(edges))
+        return counts, edges
+    
+    def group_stats(self, keys, value):
+        stats = self._run("group", tuple(keys), value)
+        if stats is None:
+            raise ValueError("No rows to aggregate")
+        if isinstance(stats.index, pd.MultiIndex):
+            # Chunks are grouped unsorted, so the index levels hold keys in
+            # order of first appearance. Rebuilt from the values, the levels
+            # come out sorted and sort_index and unstack order rows and
+            # columns by value, as pivot_table does.
+            stats.index = pd.MultiIndex.from_arrays(
+                [stats.index.get_level_values(i) for i in range(stats.index.nlevels)], names=stats.index.names)
+        return stats.sort_index()
+    
+    def group_sum(self, keys, value):
+        return self.group_stats(keys, value)['sum']
+    
+    def group_mean(self, keys, value):
+        stats = self.group_stats(keys, value)
+        return stats['sum'] / stats['count']
+    
+    def pivot_mean(self, index, columns, values):
+        return self.group_mean([index, columns], values).unstack().sort_index().sort_index(axis=1)
+    
+    def correlation(self):
+        moments = self._run("moments", tuple(self.numeric_columns))
+        if moments is None:
+            raise ValueError("No complete numeric rows to correlate")
+        n, _, m2 = moments
+        std = np.sqrt(np.diag(m2))
+        return pd.DataFrame(m2 / np.outer(std, std), index=self.numeric_columns, columns=self.numeric_columns)
+    
+    def sample(self, size=OUT_OF_CORE_SAMPLE_ROWS):
+        result = self._run("sample", size)
+        if result is None:
+            return pd.DataFrame(columns=self.columns)
+        self.row_count = result[2]
+        return result[1]
+
+
+def _imshow_matrix(fig, ax, matrix, rotation=None):
+    im = ax.imshow(matrix)
+    fig.colorbar(im, ax=ax)
+    ax.set_xticks(range(len(matrix.columns)))
+    ax.set_yticks(range(len(matrix.index)))
+    ax.set_xticklabels(matrix.columns, rotation=rotation)
+    ax.set_yticklabels(matrix.index)
+
+
+def draw_out_of_core(fig, dataset, viz_type, x_col, y_col, color_col, title, timer=None):
+    """Matplotlib rendering of an OutOfCoreDataset through its aggregate queries."""
+    timer = timer or StageTimer()
+    
+    if viz_type in ("Scatter Plot", "Line Chart", "Box Plot", "3D Scatter"):
+        with timer.stage("aggregate"):
+            sample = dataset.sample()
+            if viz_type == "Line Chart":
+                sample = sample.sort_values(x_col)
+        draw_matplotlib(fig, sample, viz_type, x_col, y_col, color_col, title, timer)
+        return
+    
+    ax = fig.add_subplot(111)
+    
+    if viz_type == "Bar Chart":
+        with timer.stage("aggregate"):
+            if color_col:
+                means = dataset.group_mean([x_col, color_col], y_col).unstack()
+            else:
+                means = dataset.group_mean([x_col], y_col)
+        means.plot(kind='bar', ax=ax)
+    elif viz_type == "Histogram":
+        with timer.stage("aggregate"):
+            counts, edges = dataset.histogram(x_col, bins=20)
+        ax.hist(edges[:-1], bins=edges, weights=counts)
+    elif viz_type == "Heatmap":
+        if x_col and y_col and color_col:
+            with timer.stage("aggregate"):
+                pivot_df = dataset.pivot_mean(x_col, y_col, color_col)
+            _imshow_matrix(fig, ax, pivot_df)
+        else:
+            with timer.stage("aggregate"):
+                corr_df = dataset.correlation()
+            _imshow_matrix(fig, ax, corr_df, rotation=90)
+    elif viz_type == "Pie Chart":
+        with timer.stage("aggregate"):
+            totals = dataset.group_sum([x_col], y_col)
+        totals.plot(kind='pie', ax=ax, autopct='%1.1f%%')
+    
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    ax.set_title(title)
+    fig.tight_layout()
+
+
+STATIC_RENDERERS = {
+    "Matplotlib": draw_matplotlib,
+    "Seaborn": draw_seaborn,
+    "Plotly (Static)": draw_plotly_static,
+    "Out-of-core": draw_out_of_core,
+}
+
+
+# Compact interactive HTML export. Large scatter/line series are switched to
+# WebGL (scattergl), numeric arrays are written as base64 typed arrays instead
+# of JSON text, and series longer than max_points are reduced to a min/max
+# overview. Finer zoom levels are written as tiles next to the HTML file and
+# fetched by the page when the user zooms in, so the page itself stays the
+# same size no matter how many rows the data has.
+WEBGL_THRESHOLD = 5000
+COMPACT_MAX_POINTS = 20000
+POINT_ATTRS = ["x", "y", "text", "hovertext", "customdata", "ids", "marker.color", "marker.size"]
+TYPED_ARRAY_CODES = {"float64": "f8", "float32": "f4", "int32": "i4", "int16": "i2", "int8": "i1",
+                     "uint32": "u4", "uint16": "u2", "uint8": "u1"}
+
+COMPACT_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotlyjs_src}"></script>
+</head>
+<body style="margin:0">
+<div id="plot" style="width:100%;height:100vh"></div>
+<script>
+(function() {{
+    var figure = {figure};
+    var tiling = {tiling};
+    var tileDir = {tile_dir};
+    var ctors = {{f8: Float64Array, f4: Float32Array, i4: Int32Array, i2: Int16Array, i1: Int8Array,
+                 u4: Uint32Array, u2: Uint16Array, u1: Uint8Array}};
+    var tiles = window.__compactTiles = window.__compactTiles || {{}};
+    
+    function decode(value) {{
+        if (value === null || typeof value !== "object") return value;
+        if (value.bdata !== undefined && value.dtype !== undefined) {{
+            var raw = atob(value.bdata), bytes = new Uint8Array(raw.length);
+            for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+            return new ctors[value.dtype](bytes.buffer);
+        }}
+        for (var key in value) value[key] = decode(value[key]);
+        return value;
+    }}
+    
+    function getPath(obj, path) {{
+        var parts = path.split(".");
+        for (var i = 0; i < parts.length && obj; i++) obj = obj[parts[i]];
+        return obj;
+    }}
+    
+    function concat(parts) {{
+        if (parts.length === 1) return parts[0];
+        var total = 0;
+        parts.forEach(function(part) {{ total += part.length; }});
+        var out = ArrayBuffer.isView(parts[0]) ? new parts[0].constructor(total) : new Array(total);
+        var offset = 0;
+        parts.forEach(function(part) {{
+            for (var i = 0; i < part.length; i++) out[offset + i] = part[i];
+            offset += part.length;
+        }});
+        return out;
+    }}
+    
+    function countBelow(starts, value) {{
+        var lo = 0, hi = starts.length;
+        while (lo < hi) {{
+            var mid = (lo + hi) >> 1;
+            if (starts[mid] <= value) lo = mid + 1; else hi = mid;
+        }}
+        return lo;
+    }}
+    
+    function loadTiles(names, done) {{
+        var pending = names.length;
+        names.forEach(function(name) {{
+            if (tiles[name]) {{ if (--pending === 0) done(); return; }}
+            var script = document.createElement("script");
+            script.src = tileDir + "/" + name + ".js";
+            script.onload = function() {{ tiles[name] = decode(tiles[name]); if (--pending === 0) done(); }};
+            document.head.appendChild(script);
+        }});
+    }}
+    
+    decode(figure);
+    var gd = document.getElementById("plot");
+    var overview = {{}};
+    Object.keys(tiling).forEach(function(index) {{
+        overview[index] = {{}};
+        tiling[index].attrs.forEach(function(attr) {{ overview[index][attr] = getPath(figure.data[index], attr); }});
+    }});
+    
+    function apply(index, columns) {{
+        var update = {{}};
+        Object.keys(columns).forEach(function(attr) {{ update[attr] = [columns[attr]]; }});
+        Plotly.restyle(gd, update, [Number(index)]);
+    }}
+    
+    var request = 0;
+    Plotly.newPlot(gd, figure.data, figure.layout, {{responsive: true}}).then(function() {{
+        gd.on("plotly_relayout", function(event) {{
+            var token = ++request;
+            Object.keys(tiling).forEach(function(index) {{
+                var info = tiling[index], axis = info.axis;
+                if (event[axis + ".autorange"]) {{ apply(index, overview[index]); return; }}
+                var lo = event[axis + ".range[0]"], hi = event[axis + ".range[1]"];
+                if (lo === undefined && event[axis + ".range"]) {{
+                    lo = event[axis + ".range"][0];
+                    hi = event[axis + ".range"][1];
+                }}
+                if (lo === undefined) return;
+                
+                var level = -1, first = 0, last = 0;
+                for (var k = info.levels.length - 1; k >= 0; k--) {{
+                    first = Math.max(countBelow(info.levels[k], lo) - 1, 0);
+                    last = Math.max(countBelow(info.levels[k], hi) - 1, 0);
+                    if (last - first < info.max_tiles) {{ level = k; break; }}
+                }}
+                if (level < 0) {{ apply(index, overview[index]); return; }}
+                
+                var names = [];
+                for (var j = first; j <= last; j++) names.push("t" + index + "_" + (level + 1) + "_" + j);
+                loadTiles(names, function() {{
+                    if (token !== request) return;
+                    var columns = {{}};
+                    info.attrs.forEach(function(attr) {{
+                        columns[attr] = concat(names.map(function(name) {{ return tiles[name][attr]; }}));
+                    }});
+                    apply(index, columns);
+                }});
+            }});
+        }});
+    }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def _decode_typed_array(value):
+    if isinstance(value, dict) and "bdata" in value and "dtype" in value:
+        dtype = {code: name for name, code in TYPED_ARRAY_CODES.items()}[value["dtype"]]
+        array = np.frombuffer(base64.b64decode(value["bdata"]), dtype=np.dtype(dtype).newbyteorder('<'))
+        if value.get("shape"):
+            array = array.reshape([int(dim) for dim in str(value["shape"]).split(",")])
+        return array
+    return value
+
+
+def _encode_typed_array(values):
+    array = np.asarray(values)
+    if array.dtype.kind == 'i' and array.dtype.itemsize > 4:
+        if array.size == 0 or (array.min() >= np.iinfo(np.int32).min and array.max() <= np.iinfo(np.int32).max):
+            array = array.astype(np.int32)
+        else:
+            array = array.astype(np.float64)
+    elif array.dtype.kind == 'u' and array.dtype.itemsize > 4:
+        array = array.astype(np.float64)
+    elif array.dtype.kind == 'f' and array.dtype.itemsize < 4:
+        array = array.astype(np.float32)
+    
+    code = TYPED_ARRAY_CODES.get(array.dtype.name)
+    if code is None:
+        return array.tolist()
+    
+    encoded = {"dtype": code,
+               "bdata": base64.b64encode(np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<')).tobytes()).decode('ascii')}
+    if array.ndim > 1:
+        encoded["shape"] = ", ".join(str(dim) for dim in array.shape)
+    return encoded
+
+
+def _compact_trace_arrays(trace):
+    """Replace the numeric per-point arrays of a trace with typed-array specs."""
+    for attr in POINT_ATTRS + ["z"]:
+        value = _decode_typed_array(_get_path(trace, attr))
+        if isinstance(value, (list, tuple, np.ndarray)) and len(value):
+            try:
+                array = np.asarray(value)
+            except ValueError:
+                continue
+            if array.dtype.kind in 'iuf':
+                _set_path(trace, attr, _encode_typed_array(array))
+
+
+def _get_path(trace, attr):
+    for part in attr.split("."):
+        if not isinstance(trace, dict) or part not in trace:
+            return None
+        trace = trace[part]
+    return trace
+
+
+def _set_path(trace, attr, value):
+    parts = attr.split(".")
+    for part in parts[:-1]:
+        trace = trace.setdefault(part, {})
+    trace[parts[-1]] = value
+
+
+def _point_columns(trace):
+    x = _get_path(trace, "x")
+    if x is None:
+        return {}
+    n = len(_decode_typed_array(x))
+    columns = {}
+    for attr in POINT_ATTRS:
+        value = _decode_typed_array(_get_path(trace, attr))
+        if isinstance(value, (list, tuple, np.ndarray)) and len(value) == n:
+            columns[attr] = np.asarray(value)
+    return columns
+
+
+def downsample_minmax(y, target):
+    """
+    Indices that keep the minimum and maximum of y in each of target // 2
+    equal-count buckets, in their original order.
+    """
+    n = len(y)
+    if n <= target:
+        return np.arange(n)
+    buckets = max(1, target // 2)
+    bounds = np.linspace(0, n, buckets + 1).astype(np.int64)
+    bucket_ids = np.repeat(np.arange(buckets), np.diff(bounds))
+    y = np.asarray(y, dtype=np.float64)
+    order = np.lexsort((np.nan_to_num(y, nan=np.inf), bucket_ids))
+    keep = np.concatenate([order[bounds[:-1]], order[bounds[1:] - 1]])
+    return np.unique(keep)
+
+
+def _tile_source(columns, select):
+    return {attr: _encode_typed_array(values[select]) if values.dtype.kind in 'iuf' else values[select].tolist()
+            for attr, values in columns.items()}
+
+
+def write_compact_html(fig, file_path, plotlyjs='cdn', max_points=COMPACT_MAX_POINTS):
+    """
+    Write a Plotly figure as a compact interactive HTML file.
+    
+    plotlyjs is 'cdn' to reference the public bundle, 'directory' to write a
+    single plotly.min.js next to the output that every export in that folder
+    shares, or any other string to use as the script URL directly.
+    """
+    figure = fig.to_dict()
+    output_dir = os.path.dirname(os.path.abspath(file_path))
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    tile_dir = f"{base_name}_tiles"
+    tile_points = max(2, max_points // 4)
+    tiling = {}
+    
+    for index, trace in enumerate(figure.get("data", [])):
+        if trace.get("type", "scatter") not in ("scatter", "scattergl"):
+            continue
+        columns = _point_columns(trace)
+        if "x" not in columns or "y" not in columns:
+            continue
+        n = len(columns["x"])
+        if n > WEBGL_THRESHOLD:
+            trace["type"] = "scattergl"
+        if n <= max_points or columns["y"].dtype.kind not in 'iuf':
+            continue
+        
+        # Tiles are cut along x, so x must be ascending. Markers can be put
+        # in that order freely; a line through unsorted x keeps its drawing
+        # order and gets only the overview.
+        tiled = columns["x"].dtype.kind in 'iuf'
+        if tiled and np.any(np.diff(columns["x"]) < 0):
+            if "lines" in trace.get("mode", "markers"):
+                tiled = False
+            else:
+                order = np.argsort(columns["x"], kind='stable')
+                columns = {attr: values[order] for attr, values in columns.items()}
+        
+        overview = downsample_minmax(columns["y"], max_points)
+        for attr, values in columns.items():
+            _set_path(trace, attr, values[overview])
+        
+        if not tiled:
+            continue
+        
+        # Level k splits the sorted series into 2**k equal-count tiles, each
+        # reduced to tile_points; the deepest level holds the raw points.
+        os.makedirs(os.path.join(output_dir, tile_dir), exist_ok=True)
+        levels = []
+        level = 1
+        while True:
+            parts = 2 ** level
+            bounds = np.linspace(0, n, parts + 1).astype(np.int64)
+            for j in range(parts):
+                start, stop = bounds[j], bounds[j + 1]
+                select = start + downsample_minmax(columns["y"][start:stop], tile_points)
+                name = f"t{index}_{level}_{j}"
+                with open(os.path.join(output_dir, tile_dir, f"{name}.js"), 'w', encoding='utf-8') as f:
+                    f.write(f"window.__compactTiles[{json.dumps(name)}] = "
+                            f"{json.dumps(_tile_source(columns, select), cls=PlotlyJSONEncoder)};\n")
+            levels.append(columns["x"][bounds[:-1]].tolist())
+            if n / parts <= tile_points:
+                break
+            level += 1
+        
+        axis = trace.get("xaxis", "x")
+        tiling[str(index)] = {"axis": "xaxis" + axis[1:], "levels": levels,
+                              "attrs": list(columns), "max_tiles": 4}
+    
+    for trace in figure.get("data", []):
+        _compact_trace_arrays(trace)
+    
+    if plotlyjs == 'cdn':
+        plotlyjs_src = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+    elif plotlyjs == 'directory':
+        plotlyjs_src = "plotly.min.js"
+        bundle_path = os.path.join(output_dir, plotlyjs_src)
+        if not os.path.exists(bundle_path):
+            # Batch workers may export into the same folder at once; each
+            # writes its own temporary copy and swaps it in whole.
+            fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(get_plotlyjs())
+                os.replace(temp_path, bundle_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+    else:
+        plotlyjs_src = plotlyjs
+    
+    def script_json(value):
+        return json.dumps(value, cls=PlotlyJSONEncoder).replace("</", "<\\/")
+    
+    title = figure.get("layout", {}).get("title", {})
+    title = title.get("text", "") if isinstance(title, dict) else title
+    
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(COMPACT_HTML_TEMPLATE.format(
+            title=html.escape(str(title or "Visualization")),
+            plotlyjs_src=html.escape(plotlyjs_src, quote=True),
+            figure=script_json(figure),
+            tiling=script_json(tiling),
+            tile_dir=script_json(tile_dir),
+        ))
+    
+    return file_path
+
+
+class RenderSession:
+    """
+    Keeps one Figure and one Tk canvas alive across re-renders.
+    
+    A chart with the same library, type and colour setting as the previous
+    one is updated in place (set_offsets/set_data) and redrawn by blitting
+    when the new data fits the current axes; anything else clears and
+    redraws the same Figure instead of creating a new one.
+    """
+    
+    UPDATABLE = {
+        ("Matplotlib", "Scatter Plot"), ("Matplotlib", "Line Chart"),
+        ("Plotly (Static)", "Scatter Plot"), ("Plotly (Static)", "Line Chart"),
+    }
+    
+    def __init__(self, master, figsize=(10, 6)):
+        self.figure = Figure(figsize=figsize)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.widget = self.canvas.get_tk_widget()
+        self.key = None
+        self.artist = None
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _on_draw(self, event):
+        # The updatable artist is animated, so a full draw leaves it out and
+        # the captured background can be reused for blitting.
+        if self.artist is None:
+            return
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.figure.draw_artist(self.artist)
+    
+    @staticmethod
+    def shown_title(library, title):
+        return f"{title} (Plotly Static Render)" if library == "Plotly (Static)" else title
+    
+    def render(self, library, df, viz_type, x_col, y_col, color_col, title, timer=None):
+        timer = timer or StageTimer()
+        if not self.widget.winfo_manager():
+            self.widget.pack(fill=tk.BOTH, expand=True)
+        
+        key = (library, viz_type, color_col is None)
+        numeric = (isinstance(df, pd.DataFrame) and x_col in df.columns and y_col in df.columns
+                   and pd.api.types.is_numeric_dtype(df[x_col]) and pd.api.types.is_numeric_dtype(df[y_col]))
+        
+        if key == self.key and self.artist is not None and numeric:
+            with timer.stage("update"):
+                if self._update_in_place(df, x_col, y_col, self.shown_title(library, title)):
+                    return
+        
+        self.artist = None
+        self.background = None
+        self.figure.clear()
+        with timer.stage("render"):
+            STATIC_RENDERERS[library](self.figure, df, viz_type, x_col, y_col, color_col, title, timer)
+        self.key = key
+        
+        if (library, viz_type) in self.UPDATABLE and color_col is None and numeric:
+            ax = self.figure.axes[0]
+            artists = ax.collections if viz_type == "Scatter Plot" else ax.lines
+            if len(artists) == 1:
+                self.artist = artists[0]
+                self.artist.set_animated(True)
+        
+        with timer.stage("draw"):
+            self.canvas.draw()
+        # Anything pyplot created behind our back (pandas/seaborn helpers)
+        # would otherwise live until the process exits.
+        plt.close('all')
+    
+    def _update_in_place(self, df, x_col, y_col, title):
+        x = df[x_col].to_numpy(dtype=float)
+        y = df[y_col].to_numpy(dtype=float)
+        if len(x) == 0 or np.isnan(x).all() or np.isnan(y).all():
+            return False
+        
+        ax = self.artist.axes
+        if isinstance(self.artist, Line2D):
+            self.artist.set_data(x, y)
+        else:
+            self.artist.set_offsets(np.column_stack([x, y]))
+        
+        labels_changed = (ax.get_xlabel(), ax.get_ylabel(), ax.get_title()) != (x_col, y_col, title)
+        ax.set_xlabel(x_col)
+        ax.set_ylabel(y_col)
+        ax.set_title(title)
+        
+        x_lo, x_hi = sorted(ax.get_xlim())
+        y_lo, y_hi = sorted(ax.get_ylim())
+        fits = (x_lo <= np.nanmin(x) and np.nanmax(x) <= x_hi
+                and y_lo <= np.nanmin(y) and np.nanmax(y) <= y_hi)
+        
+        if labels_changed or not fits or self.background is None:
+            ax.ignore_existing_data_limits = True
+            ax.update_datalim(np.column_stack([x, y]))
+            ax.autoscale_view()
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self.background)
+            self.figure.draw_artist(self.artist)
+            self.canvas.blit(self.figure.bbox)
+        return True
+    
+    def savefig(self, path, **kwargs):
+        # Animated artists are skipped by a normal draw, so switch it off
+        # while saving.
+        if self.artist is not None:
+            self.artist.set_animated(False)
+        try:
+            self.figure.savefig(path, **kwargs)
+        finally:
+            if self.artist is not None:
+                self.artist.set_animated(True)
+                self.canvas.draw_idle()
+
 
 class DataVisualizationTool:
     def __init__(self, root):
@@ -19,6 +1090,7 @@ class DataVisualizationTool:
         self.root.configure(bg="#f0f0f0")
         
         self.df = None
+        self.dataset = None
         self.file_path = None
         self.selected_columns = []
         self.current_fig = None
@@ -40,6 +1112,9 @@ class DataVisualizationTool:
         self.file_path_var = tk.StringVar()
         tk.Entry(self.top_frame, textvariable=self.file_path_var, width=50).pack(side=tk.LEFT, padx=5)
         tk.Button(self.top_frame, text="Browse", command=self.load_file, bg="#4CAF50", fg="white", font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+        self.out_of_core = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.top_frame, text="Out-of-core (large CSV)", variable=self.out_of_core,
+                       bg="#f0f0f0").pack(side=tk.LEFT, padx=5)
         
         # Left frame - Controls
         tk.Label(self.left_frame, text="Visualization Controls", bg="#f0f0f0", font=("Arial", 14, "bold")).pack(pady=10)
@@ -47,15 +1122,13 @@ class DataVisualizationTool:
         # Visualization type
         tk.Label(self.left_frame, text="Visualization Type:", bg="#f0f0f0", font=("Arial", 12)).pack(anchor='w', padx=5, pady=5)
         self.viz_type = tk.StringVar(value="Scatter Plot")
-        viz_types = ["Scatter Plot", "Line Chart", "Bar Chart", "Histogram", "Box Plot", "Heatmap", "Pie Chart", "3D Scatter"]
-        viz_dropdown = ttk.Combobox(self.left_frame, textvariable=self.viz_type, values=viz_types, width=25)
+        viz_dropdown = ttk.Combobox(self.left_frame, textvariable=self.viz_type, values=VIZ_TYPES, width=25)
         viz_dropdown.pack(anchor='w', padx=5, pady=2)
         
         # Library selection
         tk.Label(self.left_frame, text="Library:", bg="#f0f0f0", font=("Arial", 12)).pack(anchor='w', padx=5, pady=5)
         self.library = tk.StringVar(value="Matplotlib")  # Default to Matplotlib instead of Plotly
-        lib_types = ["Matplotlib", "Seaborn", "Plotly (Static)"]  # Changed Plotly to "Plotly (Static)"
-        lib_dropdown = ttk.Combobox(self.left_frame, textvariable=self.library, values=lib_types, width=25)
+        lib_dropdown = ttk.Combobox(self.left_frame, textvariable=self.library, values=LIBRARIES, width=25)
         lib_dropdown.pack(anchor='w', padx=5, pady=2)
         
         self.column_frame = tk.LabelFrame(self.left_frame, text="Data Columns", bg="#f0f0f0", font=("Arial", 12))
@@ -86,19 +1159,34 @@ class DataVisualizationTool:
         self.plot_title = tk.StringVar(value="Data Visualization")
         tk.Entry(self.settings_frame, textvariable=self.plot_title, width=25).pack(anchor='w', padx=5, pady=2)
         
-        tk.Button(self.left_frame, text="Generate Visualization", command=self.generate_visualization, 
+        tk.Button(self.left_frame, text="Generate Visualization", command=self.generate_visualization,
                  bg="#007BFF", fg="white", font=("Arial", 12)).pack(pady=10, fill=tk.X, padx=5)
         
         tk.Button(self.left_frame, text="Save Visualization", command=self.save_visualization,
                  bg="#28a745", fg="white", font=("Arial", 12)).pack(pady=5, fill=tk.X, padx=5)
         
+        self.show_timings = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.left_frame, text="Show timings in status bar", variable=self.show_timings,
+                       bg="#f0f0f0").pack(anchor='w', padx=5)
+        
         self.canvas_frame = tk.Frame(self.right_frame, bg="white", bd=2, relief=tk.SUNKEN)
         self.canvas_frame.pack(fill=tk.BOTH, expand=True)
         
+        self._render_session = None
+        self.note_frame = None
+        
         self.status_var = tk.StringVar(value="Ready. Please load a dataset.")
         self.status_bar = tk.Label(self.root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
+    @property
+    def render_session(self):
+        # Created on first use: building the Figure and its Tk canvas is what
+        # pulls in matplotlib.
+        if self._render_session is None:
+            self._render_session = RenderSession(self.canvas_frame)
+        return self._render_session
+    
     def load_file(self):
         file_types = [
             ("CSV files", "*.csv"),
@@ -111,19 +1199,31 @@ class DataVisualizationTool:
         if self.file_path:
             try:
                 self.file_path_var.set(self.file_path)
-                file_ext = os.path.splitext(self.file_path)[1].lower()
+                if self.dataset is not None:
+                    self.dataset.close()
+                    self.dataset = None
                 
-                if file_ext == '.csv':
-                    self.df = pd.read_csv(self.file_path)
-                elif file_ext == '.xlsx':
-                    self.df = pd.read_excel(self.file_path)
-                elif file_ext == '.json':
-                    self.df = pd.read_json(self.file_path)
-                else:
-                    raise ValueError("Unsupported file format")
+                is_csv = os.path.splitext(self.file_path)[1].lower() == '.csv'
+                large = os.path.getsize(self.file_path) > OUT_OF_CORE_BYTES
+                timer = StageTimer()
+                with timer.stage("load"):
+                    if is_csv and (self.out_of_core.get() or large):
+                        # Charts that need every row go through the dataset's
+                        # aggregate queries; the rest use a random sample.
+                        self.dataset = OutOfCoreDataset(self.file_path)
+                        self.df = self.dataset.sample()
+                    else:
+                        self.df = load_dataset(self.file_path)
                 
                 self.update_column_selection()
-                self.status_var.set(f"Loaded dataset with {self.df.shape[0]} rows and {self.df.shape[1]} columns")
+                if self.dataset is not None:
+                    status = (f"Opened {self.dataset.row_count} rows out-of-core "
+                              f"({len(self.df)}-row sample for Seaborn/Plotly and point charts)")
+                else:
+                    status = f"Loaded dataset with {self.df.shape[0]} rows and {self.df.shape[1]} columns"
+                if self.show_timings.get():
+                    status += f" ({timer.summary()})"
+                self.status_var.set(status)
             except Exception as e:
                 self.status_var.set(f"Error loading file: {str(e)}")
                 messagebox.showerror("Error", f"Failed to load file: {str(e)}")
@@ -160,108 +1260,60 @@ class DataVisualizationTool:
         color_col = self.color_by.get() if self.color_by.get() != "" else None
         title = self.plot_title.get()
         
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
+        if viz_type == "3D Scatter" and not color_col:
+            self.status_var.set(THREE_D_WARNING)
+            messagebox.showwarning("Warning", THREE_D_WARNING)
+            return
+        
+        if self.note_frame is not None:
+            self.note_frame.pack_forget()
+        
+        timer = StageTimer() if self.show_timings.get() else None
         
         try:
             if library == "Plotly (Static)":
-                self.generate_plotly_viz(viz_type, x_col, y_col, color_col, title)
+                self.generate_plotly_viz(viz_type, x_col, y_col, color_col, title, timer)
             elif library == "Matplotlib":
-                self.generate_matplotlib_viz(viz_type, x_col, y_col, color_col, title)
+                self.generate_matplotlib_viz(viz_type, x_col, y_col, color_col, title, timer)
             elif library == "Seaborn":
-                self.generate_seaborn_viz(viz_type, x_col, y_col, color_col, title)
+                self.generate_seaborn_viz(viz_type, x_col, y_col, color_col, title, timer)
             
-            self.status_var.set(f"Generated {viz_type} using {library}")
+            status = f"Generated {viz_type} using {library}"
+            if timer is not None:
+                status += f" ({timer.summary()})"
+            self.status_var.set(status)
         except Exception as e:
             self.status_var.set(f"Error generating visualization: {str(e)}")
             messagebox.showerror("Error", f"Failed to generate visualization: {str(e)}")
     
-    def generate_plotly_viz(self, viz_type, x_col, y_col, color_col, title):
-        fig = None
+    def generate_plotly_viz(self, viz_type, x_col, y_col, color_col, title, timer=None):
+        timer = timer or StageTimer()
+        with timer.stage("plotly figure"):
+            self.current_fig = build_plotly_figure(self.df, viz_type, x_col, y_col, color_col, title, timer)
         
-        if viz_type == "Scatter Plot":
-            fig = px.scatter(self.df, x=x_col, y=y_col, color=color_col, title=title)
-        elif viz_type == "Line Chart":
-            fig = px.line(self.df, x=x_col, y=y_col, color=color_col, title=title)
-        elif viz_type == "Bar Chart":
-            fig = px.bar(self.df, x=x_col, y=y_col, color=color_col, title=title)
-        elif viz_type == "Histogram":
-            fig = px.histogram(self.df, x=x_col, color=color_col, title=title)
-        elif viz_type == "Box Plot":
-            fig = px.box(self.df, x=x_col, y=y_col, color=color_col, title=title)
-        elif viz_type == "Heatmap":
-            if x_col and y_col and color_col:
-                pivot_df = self.df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
-                fig = px.imshow(pivot_df, title=title)
-            else:
-                corr_df = self.df.select_dtypes(include=[np.number]).corr()
-                fig = px.imshow(corr_df, title=title or "Correlation Matrix")
-        elif viz_type == "Pie Chart":
-            fig = px.pie(self.df, names=x_col, values=y_col, title=title)
-        elif viz_type == "3D Scatter":
-            z_col = color_col 
-            if z_col:
-                fig = px.scatter_3d(self.df, x=x_col, y=y_col, z=z_col, title=title)
-            else:
-                self.status_var.set("3D Scatter requires a third column (set as Color)")
-                messagebox.showwarning("Warning", "3D Scatter requires a third column (set as Color)")
-                return
-        
-        self.current_fig = fig
+        self.render_session.render("Plotly (Static)", self.df, viz_type, x_col, y_col, color_col, title, timer)
         
-                 plt.figure(figsize=(10, 6))     
-        
-        if viz_type == "3D Scatter":
-            ax = plt.figure().add_subplot(111, projection='3d')
-            ax.scatter(self.df[x_col], self.df[y_col], self.df[color_col])
-            ax.set_xlabel(x_col)
-            ax.set_ylabel(y_col)
-            ax.set_zlabel(color_col)
-            ax.set_title(title)
-        else:
-            if viz_type == "Scatter Plot":
-                plt.scatter(self.df[x_col], self.df[y_col])
-            elif viz_type == "Line Chart":
-                plt.plot(self.df[x_col], self.df[y_col])
-            elif viz_type == "Bar Chart":
-                plt.bar(self.df[x_col], self.df[y_col])
-            elif viz_type == "Histogram":
-                plt.hist(self.df[x_col], bins=20)
-            elif viz_type == "Box Plot":
-                self.df.boxplot(column=y_col, by=x_col)
-            elif viz_type == "Heatmap":
-                if x_col and y_col and color_col:
-                    pivot_df = self.df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
-                    plt.imshow(pivot_df)
-                    plt.colorbar()
-                else:
-                    corr_df = self.df.select_dtypes(include=[np.number]).corr()
-                    plt.imshow(corr_df)
-                    plt.colorbar()
-            elif viz_type == "Pie Chart":
-                self.df.groupby(x_col)[y_col].sum().plot(kind='pie', autopct='%1.1f%%')
+        if self.note_frame is None:
+            self.note_frame = tk.Frame(self.canvas_frame, bg="#f0f0f0")
+            tk.Label(self.note_frame, text="Note: This is a static render of a Plotly visualization.",
+                     bg="#f0f0f0", fg="#555").pack(pady=5)
             
-            plt.xlabel(x_col)
-            plt.ylabel(y_col)
-            plt.title(f"{title} (Plotly Static Render)")
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(plt.gcf(), master=self.canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        note_frame = tk.Frame(self.canvas_frame, bg="#f0f0f0")
-        note_frame.pack(fill=tk.X)
-        tk.Label(note_frame, text="Note: This is a static render of a Plotly visualization.", 
-                 bg="#f0f0f0", fg="#555").pack(pady=5)
-        
-        tk.Button(note_frame, text="Save as Interactive HTML", 
-                 command=lambda: self.save_as_html(), 
-                 bg="#17a2b8", fg="white").pack(pady=5)
+            tk.Button(self.note_frame, text="Save as Interactive HTML",
+                     command=lambda: self.save_as_html(),
+                     bg="#17a2b8", fg="white").pack(pady=5)
+            
+            tk.Button(self.note_frame, text="Save as Compact HTML (large data)",
+                     command=lambda: self.save_as_html(compact=True),
+                     bg="#17a2b8", fg="white").pack(pady=5)
+        self.note_frame.pack(fill=tk.X)
     
-    def save_as_html(self):
-        """Save the current Plotly figure as an interactive HTML file"""
+    def save_as_html(self, compact=False):
+        """
+        Save the current Plotly figure as an interactive HTML file.
+        
+        The compact mode uses write_compact_html and shares one plotly.min.js
+        with the other exports in the same folder.
+        """
         if hasattr(self, 'current_fig') and self.current_fig is not None:
             file_path = filedialog.asksaveasfilename(
                 title="Save Interactive Visualization",
@@ -271,9 +1323,12 @@ class DataVisualizationTool:
             
             if file_path:
                 try:
-                    self.current_fig.write_html(file_path)
+                    if compact:
+                        write_compact_html(self.current_fig, file_path, plotlyjs='directory')
+                    else:
+                        self.current_fig.write_html(file_path)
                     self.status_var.set(f"Interactive visualization saved to {file_path}")
-                    messagebox.showinfo("Success", 
+                    messagebox.showinfo("Success",
                                        f"Interactive visualization saved to {file_path}\n\n"
                                        f"Open this file in your web browser to interact with the visualization.")
                 except Exception as e:
@@ -282,119 +1337,16 @@ class DataVisualizationTool:
         else:
             messagebox.showwarning("Warning", "No Plotly visualization available to save")
     
-    def generate_matplotlib_viz(self, viz_type, x_col, y_col, color_col, title):
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        if viz_type == "Scatter Plot":
-            if color_col:
-                scatter = ax.scatter(self.df[x_col], self.df[y_col], c=self.df[color_col].astype('category').cat.codes)
-                plt.colorbar(scatter, ax=ax, label=color_col)
-            else:
-                ax.scatter(self.df[x_col], self.df[y_col])
-        elif viz_type == "Line Chart":
-            if color_col:
-                for category, group in self.df.groupby(color_col):
-                    ax.plot(group[x_col], group[y_col], label=category)
-                ax.legend()
-            else:
-                ax.plot(self.df[x_col], self.df[y_col])
-        elif viz_type == "Bar Chart":
-            if color_col:
-                grouped = self.df.groupby([x_col, color_col])[y_col].mean().unstack()
-                grouped.plot(kind='bar', ax=ax)
-            else:
-                self.df.groupby(x_col)[y_col].mean().plot(kind='bar', ax=ax)
-        elif viz_type == "Histogram":
-            ax.hist(self.df[x_col], bins=20)
-        elif viz_type == "Box Plot":
-            if color_col:
-                self.df.boxplot(column=y_col, by=color_col, ax=ax)
-            else:
-                self.df.boxplot(column=y_col, ax=ax)
-        elif viz_type == "Heatmap":
-            if x_col and y_col and color_col:
-                pivot_df = self.df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
-                im = ax.imshow(pivot_df)
-                plt.colorbar(im, ax=ax)
-                ax.set_xticks(range(len(pivot_df.columns)))
-                ax.set_yticks(range(len(pivot_df.index)))
-                ax.set_xticklabels(pivot_df.columns)
-                ax.set_yticklabels(pivot_df.index)
-            else:
-                corr_df = self.df.select_dtypes(include=[np.number]).corr()
-                im = ax.imshow(corr_df)
-                plt.colorbar(im, ax=ax)
-                ax.set_xticks(range(len(corr_df.columns)))
-                ax.set_yticks(range(len(corr_df.index)))
-                ax.set_xticklabels(corr_df.columns, rotation=90)
-                ax.set_yticklabels(corr_df.index)
-        elif viz_type == "Pie Chart":
-            self.df.groupby(x_col)[y_col].sum().plot(kind='pie', ax=ax, autopct='%1.1f%%')
-        elif viz_type == "3D Scatter":
-            fig.clear()
-            ax = fig.add_subplot(111, projection='3d')
-            z_col = color_col
-            if z_col:
-                ax.scatter(self.df[x_col], self.df[y_col], self.df[z_col])
-                ax.set_zlabel(z_col)
-            else:
-                self.status_var.set("3D Scatter requires a third column (set as Color)")
-                messagebox.showwarning("Warning", "3D Scatter requires a third column (set as Color)")
-                return
-        
-        ax.set_xlabel(x_col)
-        ax.set_ylabel(y_col)
-        ax.set_title(title)
-        plt.tight_layout()
-        
-        self.current_fig = fig
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    def generate_matplotlib_viz(self, viz_type, x_col, y_col, color_col, title, timer=None):
+        if self.dataset is not None:
+            self.render_session.render("Out-of-core", self.dataset, viz_type, x_col, y_col, color_col, title, timer)
+        else:
+            self.render_session.render("Matplotlib", self.df, viz_type, x_col, y_col, color_col, title, timer)
+        self.current_fig = self.render_session.figure
     
-    def generate_seaborn_viz(self, viz_type, x_col, y_col, color_col, title):
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        if viz_type == "Scatter Plot":
-            sns.scatterplot(data=self.df, x=x_col, y=y_col, hue=color_col, ax=ax)
-        elif viz_type == "Line Chart":
-            sns.lineplot(data=self.df, x=x_col, y=y_col, hue=color_col, ax=ax)
-        elif viz_type == "Bar Chart":
-            sns.barplot(data=self.df, x=x_col, y=y_col, hue=color_col, ax=ax)
-        elif viz_type == "Histogram":
-            sns.histplot(data=self.df, x=x_col, hue=color_col, ax=ax)
-        elif viz_type == "Box Plot":
-            sns.boxplot(data=self.df, x=x_col, y=y_col, hue=color_col, ax=ax)
-        elif viz_type == "Heatmap":
-            if x_col and y_col and color_col:
-                pivot_df = self.df.pivot_table(index=x_col, columns=y_col, values=color_col, aggfunc='mean')
-                sns.heatmap(pivot_df, annot=True, cmap="YlGnBu", ax=ax)
-            else:
-                corr_df = self.df.select_dtypes(include=[np.number]).corr()
-                sns.heatmap(corr_df, annot=True, cmap="coolwarm", ax=ax)
-        elif viz_type == "Pie Chart":
-            self.df.groupby(x_col)[y_col].sum().plot(kind='pie', ax=ax, autopct='%1.1f%%')
-        elif viz_type == "3D Scatter":
-            fig.clear()
-            ax = fig.add_subplot(111, projection='3d')
-            z_col = color_col
-            if z_col:
-                ax.scatter(self.df[x_col], self.df[y_col], self.df[z_col])
-                ax.set_zlabel(z_col)
-            else:
-                self.status_var.set("3D Scatter requires a third column (set as Color)")
-                messagebox.showwarning("Warning", "3D Scatter requires a third column (set as Color)")
-                return
-        
-        ax.set_title(title)
-        plt.tight_layout()
-        
-        self.current_fig = fig
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    def generate_seaborn_viz(self, viz_type, x_col, y_col, color_col, title, timer=None):
+        self.render_session.render("Seaborn", self.df, viz_type, x_col, y_col, color_col, title, timer)
+        self.current_fig = self.render_session.figure
     
     def save_visualization(self):
         if not hasattr(self, 'current_fig') or self.current_fig is None:
@@ -417,13 +1369,326 @@ class DataVisualizationTool:
         
         if save_path:
             try:
-                self.current_fig.savefig(save_path, dpi=300, bbox_inches='tight')
+                if self.current_fig is self.render_session.figure:
+                    self.render_session.savefig(save_path, dpi=300, bbox_inches='tight')
+                else:
+                    self.current_fig.savefig(save_path, dpi=300, bbox_inches='tight')
                 self.status_var.set(f"Visualization saved to {save_path}")
                 messagebox.showinfo("Success", f"Visualization saved to {save_path}")
             except Exception as e:
                 self.status_var.set(f"Error saving visualization: {str(e)}")
                 messagebox.showerror("Error", f"Failed to save visualization: {str(e)}")
 
+
+# Headless batch rendering. Each worker process keeps the datasets it has
+# already loaded, and charts are dispatched grouped by source so a dataset is
+# read once per worker rather than once per chart.
+_dataset_cache = {}
+
+
+def _cached_dataset(source):
+    key = (source, os.path.getmtime(source))
+    if key not in _dataset_cache:
+        _dataset_cache.clear()
+        _dataset_cache[key] = load_dataset(source)
+    return _dataset_cache[key]
+
+
+def _init_batch_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def load_batch_spec(spec_path, output_dir=None):
+    """
+    Read a batch spec file.
+    
+    The spec is JSON, either a list of charts or an object with a "charts"
+    list plus optional "output_dir" and "defaults". Each chart has "source",
+    "type", "library", "x", "y", "color", "title", "name" and "formats"
+    (any of "png", "svg", "html"). Setting "html_mode" to "compact" writes
+    HTML through write_compact_html. Relative paths in the spec resolve
+    against the spec's directory; an output_dir argument is used as given.
+    """
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    
+    if isinstance(spec, list):
+        spec = {"charts": spec}
+    
+    base_dir = os.path.dirname(os.path.abspath(spec_path))
+    if output_dir is None:
+        output_dir = spec.get("output_dir", "charts")
+        if not os.path.isabs(output_dir):
+            output_dir = os.path.join(base_dir, output_dir)
+    
+    defaults = {"type": "Scatter Plot", "library": "Matplotlib", "x": "", "y": "",
+                "color": None, "title": "Data Visualization", "formats": ["png"]}
+    defaults.update(spec.get("defaults", {}))
+    
+    charts = []
+    for index, entry in enumerate(spec.get("charts", [])):
+        chart = dict(defaults)
+        chart.update(entry)
+        if "source" not in chart:
+            raise ValueError(f"Chart {index} has no source")
+        if chart["type"] not in VIZ_TYPES:
+            raise ValueError(f"Chart {index} has unknown type '{chart['type']}'")
+        if chart["library"] not in LIBRARIES:
+            raise ValueError(f"Chart {index} has unknown library '{chart['library']}'")
+        if not os.path.isabs(chart["source"]):
+            chart["source"] = os.path.join(base_dir, chart["source"])
+        chart["name"] = chart.get("name") or f"chart_{index:03d}"
+        chart["color"] = chart["color"] or None
+        charts.append(chart)
+    
+    return charts, output_dir
+
+
+def render_chart(df, chart, output_dir):
+    outputs = []
+    formats = [fmt.lower().lstrip('.') for fmt in chart["formats"]]
+    args = (chart["type"], chart["x"], chart["y"], chart["color"], chart["title"])
+    
+    static_formats = [fmt for fmt in formats if fmt != "html"]
+    if static_formats:
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        STATIC_RENDERERS[chart["library"]](fig, df, *args)
+        for fmt in static_formats:
+            path = os.path.join(output_dir, f"{chart['name']}.{fmt}")
+            fig.savefig(path, dpi=chart.get("dpi", 150), bbox_inches='tight')
+            outputs.append(path)
+    
+    if "html" in formats:
+        if chart["library"] != "Plotly (Static)":
+            raise ValueError("HTML output requires the 'Plotly (Static)' library")
+        path = os.path.join(output_dir, f"{chart['name']}.html")
+        plotly_fig = build_plotly_figure(df, *args)
+        if chart.get("html_mode") == "compact":
+            write_compact_html(plotly_fig, path, plotlyjs='directory',
+                               max_points=chart.get("max_points", COMPACT_MAX_POINTS))
+        else:
+            plotly_fig.write_html(path)
+        outputs.append(path)
+    
+    return outputs
+
+
+def render_chart_group(charts, output_dir):
+    results = []
+    for chart in charts:
+        try:
+            df = _cached_dataset(chart["source"])
+            results.append({"name": chart["name"], "outputs": render_chart(df, chart, output_dir), "error": None})
+        except Exception as e:
+            results.append({"name": chart["name"], "outputs": [], "error": str(e)})
+    return results
+
+
+def run_batch(spec_path, output_dir=None, workers=None):
+    charts, output_dir = load_batch_spec(spec_path, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    
+    by_source = {}
+    for chart in charts:
+        by_source.setdefault(chart["source"], []).append(chart)
+    
+    # Split big sources so every worker has something to do, while keeping
+    # each task on a single source.
+    chunk_size = max(1, -(-len(charts) // (workers * 4)))
+    tasks = []
+    for group in by_source.values():
+        for start in range(0, len(group), chunk_size):
+            tasks.append(group[start:start + chunk_size])
+    
+    results = []
+    if workers == 1:
+        _init_batch_worker()
+        for task in tasks:
+            results.extend(render_chart_group(task, output_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+            futures = [executor.submit(render_chart_group, task, output_dir) for task in tasks]
+            for future in as_completed(futures):
+                results.extend(future.result())
+    
+    order = {chart["name"]: index for index, chart in enumerate(charts)}
+    results.sort(key=lambda result: order[result["name"]])
+    return results
+
+
+# Rendering benchmark. Every (rows, library, chart type) case is rendered
+# headless on an Agg canvas, with load, aggregation, render and draw timed
+# separately through StageTimer and the peak traced allocation recorded.
+BENCHMARK_CHARTS = {
+    "Scatter Plot": ("Sales", "Profit", None),
+    "Line Chart": ("Sales", "Expenses", None),
+    "Bar Chart": ("Month", "Sales", None),
+    "Histogram": ("Sales", "", None),
+    "Box Plot": ("Category", "Sales", None),
+    "Heatmap": ("Month", "Category", "Profit"),
+    "Pie Chart": ("Category", "Sales", None),
+    "3D Scatter": ("Sales", "Expenses", "Profit"),
+}
+
+
+def make_synthetic_data(n_rows, seed=0):
+    """A DataFrame with the columns create_sample_data writes, at any size."""
+    rng = np.random.default_rng(seed)
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    sales = rng.normal(12000, 2500, n_rows).round()
+    expenses = rng.normal(8500, 1000, n_rows).round()
+    
+    # Categorical columns keep the 1e8-row frames within reach of one machine.
+    return pd.DataFrame({
+        'Month': pd.Categorical.from_codes(np.arange(n_rows) % len(months), months),
+        'Sales': sales,
+        'Expenses': expenses,
+        'Profit': sales - expenses,
+        'Category': pd.Categorical.from_codes(rng.integers(0, 3, n_rows), ['A', 'B', 'C']),
+    })
+
+
+def _peak_mb():
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    return round(peak / 1024 ** 2, 2)
+
+
+def benchmark_case(df, library, viz_type):
+    x_col, y_col, color_col = BENCHMARK_CHARTS[viz_type]
+    timer = StageTimer()
+    result = {"library": library, "type": viz_type, "error": None}
+    tracemalloc.reset_peak()
+    
+    try:
+        fig = Figure(figsize=(10, 6))
+        canvas = FigureCanvasAgg(fig)
+        if library == "Plotly (Static)":
+            with timer.stage("plotly figure"):
+                build_plotly_figure(df, viz_type, x_col, y_col, color_col, "Benchmark", timer)
+        with timer.stage("render"):
+            STATIC_RENDERERS[library](fig, df, viz_type, x_col, y_col, color_col, "Benchmark", timer)
+        with timer.stage("draw"):
+            canvas.draw()
+    except Exception as e:
+        result["error"] = str(e)
+    
+    result.update({f"{name}_s": round(seconds, 6) for name, seconds in timer.timings.items()})
+    result["peak_mb"] = _peak_mb()
+    return result
+
+
+def run_benchmark(sizes, libraries=None, viz_types=None, seed=0):
+    libraries = libraries or LIBRARIES
+    viz_types = viz_types or VIZ_TYPES
+    _init_batch_worker()
+    tracemalloc.start()
+    report = {"sizes": []}
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for n_rows in sizes:
+                entry = {"rows": n_rows, "cases": []}
+                
+                data_path = os.path.join(tmp_dir, f"synthetic_{n_rows}.csv")
+                make_synthetic_data(n_rows, seed).to_csv(data_path, index=False)
+                tracemalloc.reset_peak()
+                
+                timer = StageTimer()
+                with timer.stage("load"):
+                    df = load_dataset(data_path)
+                entry["load_s"] = round(timer.timings["load"], 6)
+                entry["load_peak_mb"] = _peak_mb()
+                os.remove(data_path)
+                
+                for library in libraries:
+                    for viz_type in viz_types:
+                        entry["cases"].append(benchmark_case(df, library, viz_type))
+                
+                report["sizes"].append(entry)
+                del df
+    finally:
+        tracemalloc.stop()
+    
+    return report
+
+
+# Import-time benchmark. Each case runs in a fresh interpreter under
+# -X importtime, so it measures a cold start the way a user launching the
+# tool sees it.
+IMPORT_SCRIPT_CODE = (
+    "import importlib.util, json, sys\n"
+    "spec = importlib.util.spec_from_file_location('data_visualization', sys.argv[1])\n"
+    "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+    "print(json.dumps(sorted({name.split('.')[0] for name in sys.modules} & set(sys.argv[2:]))))\n"
+)
+IMPORT_EAGER_CODE = (
+    "import pandas, numpy, matplotlib.pyplot, seaborn, plotly.express, plotly.graph_objects\n"
+    "from matplotlib.backends import backend_agg, backend_tkagg\n"
+    "print('[]')\n"
+)
+
+
+def profile_imports(code, args=()):
+    """
+    Run code in a fresh interpreter with -X importtime. Returns the wall
+    time, the summed import time, the slowest top-level imports and the
+    list the code prints (heavy modules it loaded).
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code, *args],
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    
+    total_us = 0
+    top_level = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        # Nested imports are indented two spaces per level under the first.
+        if not name.startswith('  '):
+            top_level[name.strip()] = int(cumulative_us)
+    slowest = sorted(top_level.items(), key=lambda item: -item[1])[:8]
+    return {
+        "wall_s": round(wall, 4),
+        "import_s": round(total_us / 1e6, 4),
+        "slowest": [{"module": name, "cumulative_s": round(us / 1e6, 4)} for name, us in slowest],
+        "heavy_loaded": json.loads(proc.stdout.strip().splitlines()[-1]),
+    }
+
+
+def run_import_benchmark(runs=5):
+    """
+    Median cold-start import cost of this script against importing the
+    plotting stack eagerly, as the script used to do at the top.
+    """
+    cases = {
+        "script": (IMPORT_SCRIPT_CODE, [os.path.abspath(__file__), *HEAVY_MODULES]),
+        "eager plotting stack": (IMPORT_EAGER_CODE, []),
+    }
+    report = {"python": sys.version.split()[0], "runs": runs, "cases": {}}
+    for label, (code, args) in cases.items():
+        try:
+            profiles = [profile_imports(code, args) for _ in range(runs)]
+        except RuntimeError as e:
+            report["cases"][label] = {"error": str(e)}
+            continue
+        report["cases"][label] = {
+            "wall_s": statistics.median(profile["wall_s"] for profile in profiles),
+            "import_s": statistics.median(profile["import_s"] for profile in profiles),
+            "slowest": profiles[-1]["slowest"],
+            "heavy_loaded": profiles[-1]["heavy_loaded"],
+        }
+    return report
+
+
 def create_sample_data():
     data = {
         'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
@@ -439,12 +1704,113 @@ def create_sample_data():
     print(f"Sample data created at {os.path.abspath(sample_file)}")
     return sample_file
 
-if __name__ == "__main__":
-    try:
+
+def main():
+    parser = argparse.ArgumentParser(description='Interactive data visualization tool.')
+    
+    parser.add_argument('--batch', metavar='SPEC',
+                        help='Render the charts listed in a JSON spec file without opening the GUI')
+    
+    parser.add_argument('-o', '--output-dir',
+                        help='Directory for batch outputs (overrides the spec)',
+                        default=None)
+    
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Number of worker processes for batch rendering (default: CPU count)',
+                        default=None)
+    
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Time load, aggregation and rendering on synthetic data and print a JSON report')
+    
+    parser.add_argument('--sizes',
+                        help='Comma-separated row counts for --benchmark, e.g. 1e3,1e4,1e8 (default: 1e3,1e4,1e5,1e6)',
+                        default='1e3,1e4,1e5,1e6')
+    
+    parser.add_argument('--libraries',
+                        help='Comma-separated libraries for --benchmark (default: all)',
+                        default='')
+    
+    parser.add_argument('--types',
+                        help='Comma-separated visualization types for --benchmark (default: all)',
+                        default='')
+    
+    parser.add_argument('--report',
+                        help='Write the benchmark JSON to this file instead of stdout',
+                        default=None)
+    
+    parser.add_argument('--import-benchmark', action='store_true',
+                        help='Measure cold-start import time under -X importtime and print a JSON report')
+    
+    parser.add_argument('--runs', type=int,
+                        help='Fresh interpreters per case for --import-benchmark (default: 5)',
+                        default=5)
+    
+    parser.add_argument('--max-import-ms', type=float,
+                        help='With --import-benchmark, fail if importing the script takes longer than this '
+                             'or loads a plotting library eagerly',
+                        default=None)
+    
+    parser.add_argument('--no-warm', action='store_true',
+                        help='Do not preload the plotting libraries in the background after the window opens')
+    
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        sizes = [int(float(size)) for size in args.sizes.split(',') if size.strip()]
+        libraries = [lib.strip() for lib in args.libraries.split(',') if lib.strip()]
+        viz_types = [viz.strip() for viz in args.types.split(',') if viz.strip()]
+        report = run_benchmark(sizes, libraries, viz_types)
         
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"Benchmark report saved to {args.report}")
+        else:
+            print(json.dumps(report, indent=2))
+        return 0
+    
+    if args.import_benchmark:
+        report = run_import_benchmark(args.runs)
+        print(json.dumps(report, indent=2))
+        
+        script = report["cases"]["script"]
+        if args.max_import_ms is not None:
+            if "error" in script:
+                print(f"FAILED: {script['error']}")
+                return 1
+            if script["heavy_loaded"]:
+                print(f"FAILED: importing the script loads {', '.join(script['heavy_loaded'])} eagerly")
+                return 1
+            if script["import_s"] * 1000 > args.max_import_ms:
+                print(f"FAILED: import took {script['import_s'] * 1000:.1f} ms "
+                      f"(limit {args.max_import_ms:g} ms)")
+                return 1
+        return 0
+    
+    if args.batch:
+        results = run_batch(args.batch, args.output_dir, args.workers)
+        failed = [result for result in results if result["error"]]
+        
+        for result in results:
+            if result["error"]:
+                print(f"FAILED {result['name']}: {result['error']}")
+            else:
+                print(f"Rendered {result['name']}: {', '.join(result['outputs'])}")
+        
+        print(f"\n{len(results) - len(failed)} of {len(results)} charts rendered")
+        return 1 if failed else 0
+    
+    try:
         root = tk.Tk()
         app = DataVisualizationTool(root)
+        if not args.no_warm:
+            root.after(WARM_DELAY_MS, warm_imports)
         root.mainloop()
     except Exception as e:
         print(f"Error starting application: {str(e)}")
-        input("Press Enter to exit...")
\ No newline at end of file
+        input("Press Enter to exit...")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())